@@ -2,25 +2,49 @@
 # نسخة نهائية من مشروع N-Puzzle مع تعليقات تفصيلية بالعربي
 # حفظ الملف ثم شغّله: python n_puzzle_final_with_comments.py
 # ملاحظة: يلزم تثبيت pygame: pip install pygame
+# الحل نفسه (الحالات، الهيوريستيكس، المحركات) في باكدج npuzzle ومفيهوش pygame،
+# والملف ده فيه الواجهة بس
 
 import pygame
+import queue
+import sqlite3
 import sys
-import random
 import time
-import heapq
+
+from npuzzle import (MAX_STEPS, MEMORY_LIMIT, SHUFFLE_MAP, WD_MAX_SIZE, decode_state, generate_by_moves,
+                     is_solvable)
+from npuzzle.cache import DEFAULT_DB, SolutionCache
+from npuzzle.worker import SolveWorker
+from npuzzle import pattern_db  # find_default لتحذير الإعدادات لو ملف الـ PDB مش موجود
 
 # ----------------------------
 # تهيئة pygame والإعدادات العامة
 # ----------------------------
-pygame.init()
 # أحجام النافذة — اخترت حجم مناسب للشكل اللي بعتها
 WIDTH, HEIGHT = 980, 720
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("N-Puzzle Solver")
-# خطوط للعرض
-FONT = pygame.font.SysFont("Arial", 22)
-TITLE_FONT = pygame.font.SysFont("Arial", 36, bold=True)
-clock = pygame.time.Clock()
+# النافذة والخطوط بتتعمل في init_display (من نقطة البداية بس): عمليات Parallel IDA* بتستورد
+# الملف ده من جديد مع spawn (الافتراضي على macOS و Windows)، فلو اتعملت وقت الاستيراد كل عملية
+# كانت هتفتح نافذة لوحدها
+screen = FONT = SMALL_FONT = TITLE_FONT = clock = None
+# كاش الحلول: خلط Easy / Medium بيتكرر كتير، فالحل اللي اتلاقى قبل كده بيرجع من غير بحث
+# (على الديسك ومشترك مع batch؛ لو الفولدر مش قابل للكتابة بنكتفي بالذاكرة).
+# بيتفتح هو كمان في init_display، عشان استيراد الملف ميفتحش sqlite ولا يعمل فولدر الكاش
+SOLUTION_CACHE = None
+
+def init_display():
+    global screen, FONT, SMALL_FONT, TITLE_FONT, clock, SOLUTION_CACHE
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("N-Puzzle Solver")
+    # خطوط للعرض
+    FONT = pygame.font.SysFont("Arial", 22)
+    SMALL_FONT = pygame.font.SysFont("Arial", 14)
+    TITLE_FONT = pygame.font.SysFont("Arial", 36, bold=True)
+    clock = pygame.time.Clock()
+    try:
+        SOLUTION_CACHE = SolutionCache(DEFAULT_DB)
+    except (OSError, sqlite3.Error):
+        SOLUTION_CACHE = SolutionCache()
 
 # ----------------------------
 # ألوان مستخدمة (ثابتة)
@@ -30,190 +54,24 @@ BLACK = (0, 0, 0)
 PURPLE = (128, 0, 128)    # لون الزر المحدد (بنفسجي)
 DARK_BLACK = (20, 20, 20) # لون الأزرار غير المحددة
 BUTTON_LIGHT = (240, 240, 255)  # لون البلاطات داخل اللوح
+RED = (180, 0, 0)         # رسايل التحذير و "No solution found"
 
 # ----------------------------
-# تعاريف سلوك الشفل بحسب الحجم والصعوبة
-# - هذه الخريطة تُستخدم لتحديد عدد الحركات العشوائية (shuffle)
+# اسم الخوارزمية في الواجهة -> (اسم المحرك في npuzzle.ENGINES، حد الوقت بالثواني)
 # ----------------------------
-SHUFFLE_MAP = {
-    3: {"Easy": 10, "Medium": 20, "Hard": 50},
-    4: {"Easy": 30, "Medium": 80, "Hard": 120},
-    5: {"Easy": 80, "Medium": 160, "Hard": 300},
+GUI_ENGINES = {
+    "DFS": ("dfs", 20),
+    "Best-First": ("best_first", 60),
+    "A*": ("a_star", 120),
+    "IDA*": ("ida_star", 120),
+    "Parallel IDA*": ("parallel_ida_star", 120),
+    "Table": ("table", None),
+    "Anytime A*": ("ara_star", 120),
+    "Reduction": ("reduction", 120),
 }
-
-# حدود للحماية (لمنع استهلاك وقت غير محدود)
-MAX_STEPS = 500000
-
-# ----------------------------
-# دالة مساعدة لحساب القيم الهيوريستية
-# ----------------------------
-def heuristic_val(state, goal, size, method="manhattan"):
-    """
-    ترجع قيمة الـ heuristic للحالة state بالنسبة للـ goal.
-    method: "manhattan" أو "misplaced"
-    """
-    if method == "manhattan":
-        dist = 0
-        pos = {v:i for i,v in enumerate(goal)}
-        for i, val in enumerate(state):
-            if val == 0: 
-                continue
-            goal_idx = pos[val]
-            x1, y1 = divmod(i, size)
-            x2, y2 = divmod(goal_idx, size)
-            dist += abs(x1 - x2) + abs(y1 - y2)
-        return dist
-    elif method == "misplaced":
-        return sum(1 for i, v in enumerate(state) if v != 0 and v != goal[i])
-    return 0
-
-# ----------------------------
-# دوال حالات البازل: جيران، شفل، قابلية الحل
-# ----------------------------
-def get_neighbors(state, size):
-    """ترجع قائمة الحالات الناتجة من تحريك البلاطة الفارغة (0) بمقدار خطوة"""
-    moves = []
-    idx = state.index(0)
-    row, col = divmod(idx, size)
-    directions = [(-1,0),(1,0),(0,-1),(0,1)]
-    for dr, dc in directions:
-        r, c = row + dr, col + dc
-        if 0 <= r < size and 0 <= c < size:
-            new_idx = r * size + c
-            new_state = list(state)
-            new_state[idx], new_state[new_idx] = new_state[new_idx], new_state[idx]
-            moves.append(tuple(new_state))
-    return moves
-
-def generate_by_moves(goal, size, moves):
-    """
-    نبدأ من الحالة الهدف ثم نعمل 'moves' حركات عشوائية صالحة بحيث تكون النتيجة قابلة للحل.
-    هذه طريقة مضمونة لإنشاء حالة قابلة للحل (لأننا بدئنا من goal).
-    """
-    cur = tuple(goal)
-    prev = None
-    for _ in range(moves):
-        neighs = get_neighbors(cur, size)
-        # منع التراجع الفوري للخلف لعمل شفل أفضل
-        choices = [n for n in neighs if n != prev]
-        if not choices:
-            choices = neighs
-        nxt = random.choice(choices)
-        prev = cur
-        cur = nxt
-    return cur
-
-def is_solvable(state, size, goal):
-    """
-    تحقق قابلية الحل عن طريق حساب inversions.
-    طريقة معيارية: 
-    - لو الحجم فردي: inversions يجب أن تكون زوجية.
-    - لو الحجم زوجي: تعتمد على موقع الصفر (صف من القاع).
-    (مكتوبة علشان لو استخدمت توليد عشوائي مختلف)
-    """
-    arr = [x for x in state if x != 0]
-    inv = 0
-    for i in range(len(arr)):
-        for j in range(i+1, len(arr)):
-            if arr[i] > arr[j]:
-                inv += 1
-    if size % 2 == 1:
-        return inv % 2 == 0
-    else:
-        row = state.index(0) // size
-        # صف من القاع = size - row
-        return ((inv + (size - row)) % 2) == 0
-
-# ----------------------------
-# الخوارزميات: DFS (stack)، Best-First (Greedy)، A*
-# - كلها ترجع (path, nodes, reason)
-# - path: قائمة الحالات (من البداية إلى الهدف) أو None لو مش لقيت
-# - nodes: عدد العقد الموسعة
-# - reason: "solved" أو "time_limit" أو "max_steps" أو "exhausted"
-# ----------------------------
-def dfs(start, goal, size, time_limit=None, max_steps=MAX_STEPS):
-    """
-    DFS عبارة عن stack (عمق أولاً) — نستخدم هنا نهج غير متكرر مع visited لمنع الدوران.
-    ملاحظة: هذا DFS قد يستغرق وقت طويل لذا هناك وقت/حد للعقد.
-    """
-    start_time = time.time()
-    stack = [(start, [start])]
-    visited = set()
-    nodes = 0
-    while stack:
-        # فحص حدود الوقت
-        if time_limit and (time.time() - start_time) > time_limit:
-            return None, nodes, "time_limit"
-        state, path = stack.pop()
-        nodes += 1
-        if nodes > max_steps:
-            return None, nodes, "max_steps"
-        if state == goal:
-            return path, nodes, "solved"
-        if state in visited:
-            continue
-        visited.add(state)
-        # نضيف الجيران (لا نتحقق من عمق هنا لأن المثال السابق طلب تعطيل DFS للحجم الأكبر)
-        for n in get_neighbors(state, size):
-            if n not in visited:
-                stack.append((n, path + [n]))
-    return None, nodes, "exhausted"
-
-def best_first(start, goal, size, heuristic="manhattan", time_limit=None, max_steps=MAX_STEPS):
-    """
-    Best-First (Greedy) يعتمد على أقل قيمة هيوريستيك فقط (g not considered).
-    """
-    start_time = time.time()
-    pq = [(heuristic_val(start, goal, size, heuristic), [start])]
-    visited = set()
-    nodes = 0
-    while pq:
-        if time_limit and (time.time() - start_time) > time_limit:
-            return None, nodes, "time_limit"
-        _, path = heapq.heappop(pq)
-        state = path[-1]
-        nodes += 1
-        if nodes > max_steps:
-            return None, nodes, "max_steps"
-        if state == goal:
-            return path, nodes, "solved"
-        if state in visited:
-            continue
-        visited.add(state)
-        for n in get_neighbors(state, size):
-            if n not in visited:
-                h = heuristic_val(n, goal, size, heuristic)
-                heapq.heappush(pq, (h, path + [n]))
-    return None, nodes, "exhausted"
-
-def a_star(start, goal, size, heuristic="manhattan", time_limit=None, max_steps=MAX_STEPS):
-    """
-    A* يستخدم f = g + h ويخزن أفضل g لكل حالة.
-    """
-    start_time = time.time()
-    pq = [(heuristic_val(start, goal, size, heuristic), 0, [start])]  # (f, g, path)
-    best_g = {start: 0}
-    nodes = 0
-    while pq:
-        if time_limit and (time.time() - start_time) > time_limit:
-            return None, nodes, "time_limit"
-        f, g, path = heapq.heappop(pq)
-        state = path[-1]
-        nodes += 1
-        if nodes > max_steps:
-            return None, nodes, "max_steps"
-        if state == goal:
-            return path, nodes, "solved"
-        # إذا كان لدينا g أفضل لهذه الحالة نكمل
-        if best_g.get(state, float('inf')) < g:
-            continue
-        for n in get_neighbors(state, size):
-            new_g = g + 1
-            if new_g < best_g.get(n, float('inf')):
-                best_g[n] = new_g
-                h = heuristic_val(n, goal, size, heuristic)
-                heapq.heappush(pq, (new_g + h, new_g, path + [n]))
-    return None, nodes, "exhausted"
+# فوق 5x5 كل المحركات exponential فالـ Reduction بس اللي بيشتغل
+# (وهو بيحل آخر بلوك 3x3 بـ A* بالهيوريستيك المختار)
+REDUCTION_ONLY_ABOVE = 5
 
 # ----------------------------
 # رسم اللوحة (Board) — تستخدم في الأنيميشن وعرض الحالة
@@ -222,31 +80,36 @@ def draw_board(state, size, top_left, board_size):
     """
     ترسم لوح البازل في المكان top_left وبحجم board_size × board_size.
     كل بلاطة لها هامش بسيط (padding).
+    state ممكن يكون tuple أو int مضغوط — هنا بس بنفكه لـ tuple.
     """
+    state = decode_state(state, size)
     tile_size = board_size // size
+    pad = min(6, tile_size // 10)  # 10x10 في المعاينة الصغيرة: البلاطة 30 بكسل بس
+    font = FONT if tile_size >= 48 else SMALL_FONT
     x0, y0 = top_left
     for i, val in enumerate(state):
         r, c = divmod(i, size)
-        rect = pygame.Rect(x0 + c*tile_size + 6, y0 + r*tile_size + 6, tile_size - 12, tile_size - 12)
+        rect = pygame.Rect(x0 + c*tile_size + pad, y0 + r*tile_size + pad, tile_size - 2*pad, tile_size - 2*pad)
         if val == 0:
             # المربع الفارغ أسود
             pygame.draw.rect(screen, BLACK, rect, border_radius=10)
         else:
             # بلاطة فاتحة مع رقم
             pygame.draw.rect(screen, BUTTON_LIGHT, rect, border_radius=10)
-            txt = FONT.render(str(val), True, BLACK)
+            txt = font.render(str(val), True, BLACK)
             screen.blit(txt, txt.get_rect(center=rect.center))
 
 # ----------------------------
 # شاشة النتائج (بعد ما تشوف الأنيميشن و تضغط Next)
 # ----------------------------
-def result_screen(algo_name, steps, nodes, elapsed, reason=None):
+def result_screen(algo_name, steps, nodes, elapsed, reason=None, stats=None):
     """
     تعرض معلومات عن نتيجة الحل:
     - هل تم حل البازل؟
     - عدد الخطوات
     - عدد العقد الموسعة
     - الوقت المستغرق
+    - لو stats (SearchStats) متبعتة: عدادات البحث تحت (pops مكررة، أحجام، أوقات)
     """
     running = True
     while running:
@@ -267,6 +130,11 @@ def result_screen(algo_name, steps, nodes, elapsed, reason=None):
         for i, ln in enumerate(lines):
             surf = FONT.render(ln, True, BLACK)
             screen.blit(surf, (WIDTH//2 - 200, 150 + i * 36))
+        if stats is not None:
+            y = 150 + len(lines) * 36 + 20
+            for i, ln in enumerate(stats.lines()):
+                surf = FONT.render(ln, True, DARK_BLACK)
+                screen.blit(surf, (WIDTH//2 - 200, y + i * 30))
 
         info_surf = FONT.render("Press ESC to return to menu", True, BLACK)
         screen.blit(info_surf, (WIDTH//2 - info_surf.get_width()//2, HEIGHT - 80))
@@ -281,11 +149,79 @@ def result_screen(algo_name, steps, nodes, elapsed, reason=None):
         pygame.display.flip()
         clock.tick(30)
 
+# ----------------------------
+# شاشة "جاري الحل": البحث شغال في SolveWorker والشاشة دي بترسم التقدم كل frame
+# - بتعرض العقد، الـ bound الحالي (f)، حجم الـ frontier، الوقت، والسرعة
+# - Cancel (أو ESC) بيطلب من المحرك يقف، وبنستنى حدث done علشان الـ thread يخلص فعلاً
+# - أول ما المسار يوصل بنرجعه فورًا والأنيميشن يبدأ
+# ----------------------------
+def solving_screen(worker, algo_name, size, start_state):
+    """
+    ترجع dict حدث done (path, nodes, reason, elapsed) أو None لو المستخدم لغى البحث.
+    """
+    worker.start()
+    latest = {"nodes": 0, "bound": None, "frontier": 0, "elapsed": 0.0}
+    best = None  # آخر حدث solution (Anytime A* بس)
+    cancelling = False
+    cancel_rect = pygame.Rect(WIDTH//2 - 80, HEIGHT - 120, 160, 50)
+    preview_size = 300
+    while True:
+        # نفضي الـ queue كله ونحتفظ بآخر progress بس
+        try:
+            while True:
+                kind, data = worker.events.get_nowait()
+                if kind == "done":
+                    return None if data["reason"] == "cancelled" else data
+                if kind == "solution":
+                    best = data
+                    continue
+                latest = data
+        except queue.Empty:
+            pass
+
+        screen.fill(WHITE)
+        title = TITLE_FONT.render("Cancelling..." if cancelling else f"Solving with {algo_name}...", True, PURPLE)
+        screen.blit(title, (WIDTH//2 - title.get_width()//2, 30))
+        draw_board(start_state, size, (WIDTH//2 - preview_size//2, 90), preview_size)
+
+        elapsed = latest["elapsed"]
+        rate = latest["nodes"] / elapsed if elapsed > 0 else 0
+        lines = [
+            f"Nodes expanded: {latest['nodes']:,}",
+            f"Current bound (f): {latest['bound'] if latest['bound'] is not None else '-'}",
+            f"Frontier size: {latest['frontier']:,}",
+            f"Elapsed: {elapsed:.1f} s   ({rate:,.0f} nodes/s)",
+        ]
+        if best is not None:
+            lines.append(f"Best so far: {best['length']} moves (at most {best['bound']:.2f}x optimal)")
+        for i, ln in enumerate(lines):
+            surf = FONT.render(ln, True, BLACK)
+            screen.blit(surf, (WIDTH//2 - 200, 410 + i * 34))
+
+        pygame.draw.rect(screen, (200,200,200) if cancelling else PURPLE, cancel_rect, border_radius=12)
+        txt = FONT.render("Cancel", True, WHITE)
+        screen.blit(txt, txt.get_rect(center=cancel_rect.center))
+
+        for ev in pygame.event.get():
+            if ev.type == pygame.QUIT:
+                worker.cancel()
+                pygame.quit()
+                sys.exit()
+            if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1 and cancel_rect.collidepoint(ev.pos):
+                worker.cancel()
+                cancelling = True
+            if ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
+                worker.cancel()
+                cancelling = True
+
+        pygame.display.flip()
+        clock.tick(30)
+
 # ----------------------------
 # دالة الأنيميشن: تعرض الخطوات بوتيرة 200ms مع معالجة للأحداث (حتى يمكن إغلاق النافذة)
 # بعد الانتهاء تظهر زر Next للانتقال لعرض النتائج
 # ----------------------------
-def animate_solution_and_show_next(start_state, path, size, nodes, elapsed, algo_name, reason):
+def animate_solution_and_show_next(start_state, path, size, nodes, elapsed, algo_name, reason, stats=None):
     """
     path: قائمة الحالات من البداية إلى الهدف (شاملة البداية والهدف)
     start_state: الحالة الابتدائية (path[0] عادة)
@@ -313,7 +249,7 @@ def animate_solution_and_show_next(start_state, path, size, nodes, elapsed, algo
                     sys.exit()
                 if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
                     if next_rect.collidepoint(ev.pos):
-                        result_screen(algo_name, None, nodes, elapsed, reason)
+                        result_screen(algo_name, None, nodes, elapsed, reason, stats)
                         return
                 if ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
                     return
@@ -324,13 +260,16 @@ def animate_solution_and_show_next(start_state, path, size, nodes, elapsed, algo
     step_index = 0
     last_time = time.time()
     step_delay = 0.200  # 200ms ثابت كما طلبت
+    # مسارات Reduction بالآلاف: الأنيميشن كله ياخد حوالي دقيقة بحد أقصى (كذا خطوة في الـ frame)
+    if len(path) > 300:
+        step_delay = 60.0 / len(path)
     anim_done = False
 
     while True:
         now = time.time()
         # إذا الوقت مر للتقدم خطوة
         if not anim_done and now - last_time >= step_delay:
-            step_index += 1
+            step_index += int((now - last_time) / step_delay)
             last_time = now
             # لو وصلنا لنهاية المسار (آخر حالة في path) نوقف الأنيميشن
             if step_index >= len(path):
@@ -365,7 +304,7 @@ def animate_solution_and_show_next(start_state, path, size, nodes, elapsed, algo
             if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
                 if anim_done and next_rect.collidepoint(ev.pos):
                     # ننتقل لشاشة النتائج مع بيانات الحل
-                    result_screen(algo_name, path, nodes, elapsed, reason)
+                    result_screen(algo_name, path, nodes, elapsed, reason, stats)
                     return
             if ev.type == pygame.KEYDOWN:
                 if ev.key == pygame.K_ESCAPE:
@@ -412,6 +351,10 @@ class MenuButton:
             # عند النقر نُنادي الـ callback مع المفتاح
             self.callback(self.key)
 
+def heuristic_size(algo_name, size):
+    """حجم اللوح اللي الهيوريستيك هيشتغل عليه فعلًا (Reduction بيستخدمه على آخر بلوك 3x3 بس)"""
+    return 3 if algo_name == "Reduction" else size
+
 def choose_settings():
     """
     شاشة اختيار الإعدادات — تعرض جميع الأزرار وتُحدّث اختيارات المستخدم.
@@ -427,9 +370,11 @@ def choose_settings():
     def set_size(k):
         nonlocal chosen_size, chosen_algo
         chosen_size = k
-        if chosen_size > 3 and chosen_algo == "DFS":
-            # نجبر الانتقال إلى A* لأن DFS غير مسموح هنا
+        if chosen_size > 3 and chosen_algo in ("DFS", "Table"):
+            # نجبر الانتقال إلى A* لأن DFS و Table غير مسموحين هنا
             set_algo("A*")
+        if chosen_size > REDUCTION_ONLY_ABOVE:
+            set_algo("Reduction")
 
     def set_algo(a):
         nonlocal chosen_algo
@@ -450,15 +395,24 @@ def choose_settings():
     buttons.append(MenuButton("3x3", 120, 160, 140, 56, 3, lambda k: set_size(k)))
     buttons.append(MenuButton("4x4", 120, 240, 140, 56, 4, lambda k: set_size(k)))
     buttons.append(MenuButton("5x5", 120, 320, 140, 56, 5, lambda k: set_size(k)))
+    buttons.append(MenuButton("10x10", 120, 400, 140, 56, 10, lambda k: set_size(k)))
 
     # خوارزميات (عمود منتصف)
-    buttons.append(MenuButton("DFS", 360, 160, 180, 56, "DFS", lambda k: set_algo(k)))
-    buttons.append(MenuButton("Best-First", 360, 240, 180, 56, "Best-First", lambda k: set_algo(k)))
-    buttons.append(MenuButton("A*", 360, 320, 180, 56, "A*", lambda k: set_algo(k)))
+    buttons.append(MenuButton("DFS", 360, 160, 180, 32, "DFS", lambda k: set_algo(k)))
+    buttons.append(MenuButton("Best-First", 360, 196, 180, 32, "Best-First", lambda k: set_algo(k)))
+    buttons.append(MenuButton("A*", 360, 232, 180, 32, "A*", lambda k: set_algo(k)))
+    buttons.append(MenuButton("IDA*", 360, 268, 180, 32, "IDA*", lambda k: set_algo(k)))
+    buttons.append(MenuButton("Parallel IDA*", 360, 304, 180, 32, "Parallel IDA*", lambda k: set_algo(k)))
+    buttons.append(MenuButton("Table (3x3)", 360, 340, 180, 32, "Table", lambda k: set_algo(k)))
+    buttons.append(MenuButton("Anytime A*", 360, 376, 180, 32, "Anytime A*", lambda k: set_algo(k)))
+    buttons.append(MenuButton("Reduction", 360, 412, 180, 32, "Reduction", lambda k: set_algo(k)))
 
     # هيوريستيك (عمود يمين وسط) — باينة دايمًا لكن تتعمل فقط مع Best-First / A*
     buttons.append(MenuButton("Manhattan", 620, 160, 160, 48, "manhattan", lambda k: set_heur(k)))
-    buttons.append(MenuButton("Misplaced", 620, 230, 160, 48, "misplaced", lambda k: set_heur(k)))
+    buttons.append(MenuButton("Misplaced", 620, 215, 160, 48, "misplaced", lambda k: set_heur(k)))
+    buttons.append(MenuButton("Lin. Conflict", 620, 270, 160, 48, "linear_conflict", lambda k: set_heur(k)))
+    buttons.append(MenuButton("Walking Dist", 620, 325, 160, 48, "walking_distance", lambda k: set_heur(k)))
+    buttons.append(MenuButton("PDB", 620, 380, 160, 48, "pdb", lambda k: set_heur(k)))
 
     # صعوبات (عمود أقصى اليمين)
     buttons.append(MenuButton("Easy", 820, 160, 120, 48, "Easy", lambda k: set_diff(k)))
@@ -475,10 +429,19 @@ def choose_settings():
     # ربط فعلي لزر Start و Info مُباشر بعد تعريف الدوال
     def start_game():
         nonlocal chosen_size, chosen_algo, chosen_heur, chosen_diff
-        # منع DFS أكبر من 3
-        if chosen_algo == "DFS" and chosen_size > 3:
+        # منع DFS و Table أكبر من 3
+        if chosen_algo in ("DFS", "Table") and chosen_size > 3:
             # تعرض تحذير بسيط في القائمة بدل التشغيل — لكن هنعكس لآخر لحظة
             return
+        if chosen_size > REDUCTION_ONLY_ABOVE and chosen_algo != "Reduction":
+            return
+        # PDB لازم يكون متبني الأول (البناء بياخد دقايق فمش بنعمله من الواجهة)
+        uses_heur = chosen_algo not in ("DFS", "Table")
+        heur_size = heuristic_size(chosen_algo, chosen_size)
+        if uses_heur and chosen_heur == "pdb" and pattern_db.find_default(heur_size) is None:
+            return
+        if uses_heur and chosen_heur == "walking_distance" and heur_size > WD_MAX_SIZE:
+            return
         shuffle = SHUFFLE_MAP[chosen_size][chosen_diff]
         # إنشاء بداية البازل من خلال توليد حركات من goal
         goal = tuple(list(range(1, chosen_size*chosen_size)) + [0])
@@ -487,18 +450,20 @@ def choose_settings():
         if not is_solvable(start_state, chosen_size, goal):
             start_state = generate_by_moves(goal, chosen_size, shuffle)
 
-        # تنفيذ الخوارزمية المختارة
-        t1 = time.time()
-        if chosen_algo == "DFS":
-            path, nodes, reason = dfs(start_state, goal, chosen_size, time_limit=20, max_steps=MAX_STEPS)
-        elif chosen_algo == "Best-First":
-            path, nodes, reason = best_first(start_state, goal, chosen_size, heuristic=chosen_heur, time_limit=60, max_steps=MAX_STEPS)
-        else:  # A*
-            path, nodes, reason = a_star(start_state, goal, chosen_size, heuristic=chosen_heur, time_limit=120, max_steps=MAX_STEPS)
-        elapsed = time.time() - t1
+        # تنفيذ الخوارزمية المختارة في thread جانبي — الشاشة بتفضل بترسم وفيها Cancel
+        engine, time_limit = GUI_ENGINES[chosen_algo]
+        worker = SolveWorker(engine, start_state, goal, chosen_size, heuristic=chosen_heur,
+                             time_limit=time_limit, max_steps=MAX_STEPS, memory_limit=MEMORY_LIMIT,
+                             cache=SOLUTION_CACHE)
+        result = solving_screen(worker, chosen_algo, chosen_size, start_state)
+        if result is None:
+            # المستخدم لغى البحث: نرجع للإعدادات
+            return
 
         # نعرض الأنيميشن مع تفعيل زر Next بعد الانتهاء
-        animate_solution_and_show_next(start_state, path, chosen_size, nodes, elapsed, chosen_algo, reason)
+        animate_solution_and_show_next(start_state, result["path"], chosen_size, result["nodes"],
+                                       result["elapsed"], chosen_algo, result.get("error", result["reason"]),
+                                       result.get("stats"))
 
     # الآن نربط callback لزر Start و Info
     start_btn.callback = lambda k: start_game()
@@ -520,16 +485,34 @@ def choose_settings():
                 b.selected = True
             elif b.key == 5 and chosen_size == 5:
                 b.selected = True
+            elif b.key == 10 and chosen_size == 10:
+                b.selected = True
             elif b.key == "DFS" and chosen_algo == "DFS":
                 b.selected = True
             elif b.key == "Best-First" and chosen_algo == "Best-First":
                 b.selected = True
             elif b.key == "A*" and chosen_algo == "A*":
                 b.selected = True
+            elif b.key == "IDA*" and chosen_algo == "IDA*":
+                b.selected = True
+            elif b.key == "Parallel IDA*" and chosen_algo == "Parallel IDA*":
+                b.selected = True
+            elif b.key == "Table" and chosen_algo == "Table":
+                b.selected = True
+            elif b.key == "Anytime A*" and chosen_algo == "Anytime A*":
+                b.selected = True
+            elif b.key == "Reduction" and chosen_algo == "Reduction":
+                b.selected = True
             elif b.key == "manhattan" and chosen_heur == "manhattan":
                 b.selected = True
             elif b.key == "misplaced" and chosen_heur == "misplaced":
                 b.selected = True
+            elif b.key == "linear_conflict" and chosen_heur == "linear_conflict":
+                b.selected = True
+            elif b.key == "walking_distance" and chosen_heur == "walking_distance":
+                b.selected = True
+            elif b.key == "pdb" and chosen_heur == "pdb":
+                b.selected = True
             elif b.key == "Easy" and chosen_diff == "Easy":
                 b.selected = True
             elif b.key == "Medium" and chosen_diff == "Medium":
@@ -548,9 +531,19 @@ def choose_settings():
         info_btn.draw(screen)
 
         # عرض تحذير إذا DFS والـ size > 3 (تنبيه للمستخدم)
+        heur_size = heuristic_size(chosen_algo, chosen_size)
         if chosen_algo == "DFS" and chosen_size > 3:
             warn = FONT.render("DFS not allowed for size > 3 (will not start).", True, (180,0,0))
-            screen.blit(warn, (120, 410))
+            screen.blit(warn, (120, 606))
+        elif chosen_size > REDUCTION_ONLY_ABOVE and chosen_algo != "Reduction":
+            warn = FONT.render(f"Only Reduction runs on {chosen_size}x{chosen_size} (will not start).", True, (180,0,0))
+            screen.blit(warn, (120, 606))
+        elif chosen_heur == "pdb" and chosen_algo not in ("DFS", "Table") and pattern_db.find_default(heur_size) is None:
+            warn = FONT.render(f"No PDB for {heur_size}x{heur_size} (run: python -m npuzzle.pattern_db --size {heur_size})", True, (180,0,0))
+            screen.blit(warn, (120, 606))
+        elif chosen_heur == "walking_distance" and chosen_algo not in ("DFS", "Table") and heur_size > WD_MAX_SIZE:
+            warn = FONT.render(f"Walking Distance supports up to {WD_MAX_SIZE}x{WD_MAX_SIZE} (will not start).", True, (180,0,0))
+            screen.blit(warn, (120, 606))
 
         # شريط الملخص في الأسفل (يتحدّث أوتوماتيك)
         shuffle_val = SHUFFLE_MAP[chosen_size][chosen_diff]
@@ -584,8 +577,12 @@ def info_screen():
         lines = [
             "N-Puzzle Solver",
             "Implemented with Python + Pygame",
-            "Algorithms: DFS (limited), Best-First (Greedy), A* (optimal if heuristic admissible)",
-            "Heuristics: Manhattan, Misplaced",
+            "Algorithms: DFS (limited), Best-First (Greedy), A*, IDA* (optimal if admissible)",
+            "Parallel IDA*: IDA* with the first layers split across all CPU cores",
+            "Table (3x3): exact distance table, optimal path without searching",
+            "Anytime A*: quick first path, then shorter ones until the time limit",
+            "Reduction: row by row / column by column for big boards (up to 20x20), not optimal",
+            "Heuristics: Manhattan, Misplaced, Linear Conflict, Walking Distance, PDB",
             "Choose settings then press Start. Press ESC to return."
         ]
         for i, ln in enumerate(lines):
@@ -639,4 +636,5 @@ def main_menu():
 # نقطة البداية لتشغيل البرنامج
 # ----------------------------
 if __name__ == "__main__":
+    init_display()
     main_menu()
@@ -0,0 +1,56 @@
+# npuzzle
+# قلب الـ solver من غير أي واجهة: تمثيل الحالة، الهيوريستيكس، محركات البحث، الجداول الجاهزة
+# - مفيش pygame هنا خالص، فالاستيراد بياخد ملّي ثواني وينفع على سيرفر أو في سكريبت أو worker
+# - الواجهة (main.py) بتستورد من هنا، وأي أداة تانية تقدر تعمل نفس الحاجة:
+#     from npuzzle import a_star
+#     path, nodes, reason = a_star(start, goal, 4, heuristic="pdb")
+# - pattern_db / eight_puzzle / ranking موديولات جوه الباكدج ليها CLI خاص بيها:
+#     python -m npuzzle.pattern_db --size 4
+
+from .board import (MAX_STEPS, MEMORY_LIMIT, SHUFFLE_MAP, apply_move, decode_state, default_goal, encode_state,
+                    expand, find_blank, generate_by_moves, get_neighbors, is_solvable, legal_moves,
+                    move_table, random_board, reconstruct_path, tile_bits)
+from .heuristics import (HEURISTICS, WD_MAX_SIZE, LinearConflict, WalkingDistance, get_heuristic,
+                         heuristic_table, heuristic_val)
+from .search import a_star, best_first, dfs, ida_star, table_solve
+from .anytime import ara_star
+from .beam import beam_search
+from .bidirectional import bidirectional_bfs, mm
+from .reduction import reduction_solve
+from .stats import SearchStats
+
+# المحركات المتوازية (parallel.py) بتستورد multiprocessing و shared_memory (عشرات الملّي ثواني)،
+# فالموديول بيتحمّل أول ما واحد منهم يتنادى بس
+def hda_star(*args, **kwargs):
+    """parallel.hda_star"""
+    from .parallel import hda_star
+    return hda_star(*args, **kwargs)
+
+def parallel_ida_star(*args, **kwargs):
+    """parallel.parallel_ida_star"""
+    from .parallel import parallel_ida_star
+    return parallel_ida_star(*args, **kwargs)
+
+# المحركات بالاسم — علشان أي أداة (زي batch) تختار محرك من نص على سطر الأوامر
+ENGINES = {
+    "dfs": dfs,
+    "best_first": best_first,
+    "a_star": a_star,
+    "ida_star": ida_star,
+    "table": table_solve,
+    "bidirectional_bfs": bidirectional_bfs,
+    "mm": mm,
+    "ara_star": ara_star,
+    "beam": beam_search,
+    "reduction": reduction_solve,
+    "hda_star": hda_star,
+    "parallel_ida_star": parallel_ida_star,
+}
+# المحركات اللي مش بتاخد heuristic
+NO_HEURISTIC = ("dfs", "table", "bidirectional_bfs")
+# المحركات اللي بتاخد memory_limit (بتكمل بـ IDA* لو الذاكرة خلصت)
+MEMORY_LIMITED = ("best_first", "a_star")
+# المحركات اللي بتبلغ بحلول متحسنة وهي شغالة (on_solution(path, bound))
+ANYTIME = ("ara_star",)
+# المحركات اللي بتشغّل عملياتها بنفسها (مينفعش تشتغل جوه worker في pool، فـ batch بيشغلها في نفس العملية)
+MULTIPROCESS = ("hda_star", "parallel_ida_star")
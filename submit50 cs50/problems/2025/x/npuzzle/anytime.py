@@ -0,0 +1,118 @@
+# npuzzle/anytime.py
+# ARA* (Anytime Repairing A*, Likhachev et al. 2003): حل بسرعة الأول وبعدين حلول أحسن لحد ما الوقت يخلص
+# - أول لفة weighted A* بوزن كبير (f = g + w·h) فبيلاقي حل بسرعة حتى على 5x5
+# - كل لفة بعد كده w بيقل والبحث بيكمل من نفس الـ open و g (مش من الأول): الحالات اللي لقالها g أحسن
+#   وهي متوسعة بتتحط في INCONS وبترجع للـ open في اللفة الجاية بس
+# - بعد كل حل: on_solution(path, bound) حيث bound = حد أعلى لـ (طول الحل / الطول الأمثل)
+#   = min(w, g(goal) / أقل g + h في الـ open و INCONS)
+# - لما الوقت أو عدد العقد يخلص ومعانا حل: (أحسن path، nodes، "time_limit_best_effort")
+#   ولما bound يوصل 1 الحل أمثل: "solved"
+# ملاحظة: الملف ده مفيهوش pygame
+
+import time
+
+from .board import MAX_STEPS, encode_state, expand, find_blank, reconstruct_path
+from .heuristics import get_heuristic, heuristic_val
+from .openlist import BucketQueue
+from .search import PROGRESS_EVERY, _expand_counted
+from .stats import timed_heuristic
+
+# الـ key في الـ bucket queue لازم int: key = SCALE·g + round(SCALE·w)·h (دقة 0.1 في الوزن)
+SCALE = 10
+
+def ara_star(start, goal, size, heuristic="manhattan", time_limit=None, max_steps=MAX_STEPS, progress=None,
+             stats=None, weight=3.0, weight_step=0.5, on_solution=None):
+    """
+    نفس عقد (path, nodes, reason) + reason="time_limit_best_effort" لو الميزانية (وقت أو عقد) خلصت
+    بعد ما لقينا حل واحد على الأقل. من غير حل خالص: "time_limit" / "max_steps" زي A*.
+    on_solution(path, bound): بتتنادى مع كل حل أقصر من اللي قبله.
+    stats.iterations = عدد الأوزان اللي اتجربت، stats.suboptimality = bound بتاع الحل اللي رجع.
+    progress: bound = أقل key في الـ open / SCALE.
+    """
+    start_time = time.time()
+    table = timed_heuristic(get_heuristic(goal, size, heuristic), stats)
+    start, goal = encode_state(start, size), encode_state(goal, size)
+    # عنصر الـ open: (state << 48) | (h << 32) | (blank << 16) | (prev_blank + 1) — h محتاجينها لإعادة حساب
+    # الـ key لما الوزن يتغير
+    h0 = heuristic_val(start, goal, size, heuristic)
+    g = {start: 0}
+    parent = {start: None}
+    opened = {start: (h0, find_blank(start, size), -1)}   # الحالات اللي في الـ open دلوقتي
+    incons = {}
+    best_path, best_len = None, float('inf')
+    nodes = 0
+    w = max(1.0, weight)
+
+    def out_of_budget(reason):
+        if best_path is not None:
+            return best_path, nodes, "time_limit_best_effort"
+        return None, nodes, reason
+
+    try:
+        while True:
+            if stats:
+                stats.iterations += 1
+            wk = round(w * SCALE)
+            pq = BucketQueue()
+            opened.update(incons)
+            incons = {}
+            for state, (h, blank, prev_blank) in opened.items():
+                pq.push(SCALE * g[state] + wk * h, g[state],
+                        (state << 48) | (h << 32) | (blank << 16) | (prev_blank + 1))
+            closed = set()
+            # improve_path: لحد ما مفيش حالة في الـ open ممكن تحسّن الحل الحالي بالوزن ده
+            while opened and pq.min_key() < SCALE * g.get(goal, float('inf')):
+                key, sg, item = pq.pop()
+                state = item >> 48
+                if g[state] != sg or state in closed:
+                    if stats:
+                        stats.stale_pops += 1
+                    continue
+                del opened[state]
+                closed.add(state)
+                if time_limit and nodes & 1023 == 0 and (time.time() - start_time) > time_limit:
+                    return out_of_budget("time_limit")
+                nodes += 1
+                if nodes > max_steps:
+                    return out_of_budget("max_steps")
+                if progress and nodes % PROGRESS_EVERY == 0 and progress(nodes, key // SCALE, len(opened)):
+                    return None, nodes, "cancelled"
+                h, blank, prev_blank = (item >> 32) & 0xffff, (item >> 16) & 0xffff, (item & 0xffff) - 1
+                if stats:
+                    children = _expand_counted(stats, state, size, h, table, blank, prev_blank)
+                else:
+                    children = expand(state, size, h, table, blank, prev_blank)
+                new_g = sg + 1
+                for n, nh, n_blank in children:
+                    if new_g >= g.get(n, float('inf')):
+                        continue
+                    g[n] = new_g
+                    parent[n] = state
+                    if n in closed:
+                        incons[n] = (nh, n_blank, blank)
+                    else:
+                        opened[n] = (nh, n_blank, blank)
+                        pq.push(SCALE * new_g + wk * nh, new_g,
+                                (n << 48) | (nh << 32) | (n_blank << 16) | (blank + 1))
+                if stats and len(pq) > stats.max_open:
+                    stats.max_open = len(pq)
+            if goal not in g:
+                return None, nodes, "exhausted"
+            # حد الـ suboptimality: أي حل أقصر لازم يعدي على حالة في الـ open أو INCONS
+            lower = min((g[s] + h for s, (h, _, _) in list(opened.items()) + list(incons.items())
+                         if g[s] + h < g[goal]), default=g[goal])
+            bound = min(w, g[goal] / lower) if lower else 1.0
+            if g[goal] < best_len:
+                best_len = g[goal]
+                best_path = reconstruct_path(parent, goal, size)
+                if on_solution:
+                    on_solution(best_path, bound)
+            if stats:
+                # الحد بيضيق كل لفة حتى لو الحل نفسه ما اتغيرش (أقل g + h في الـ open بيطلع)
+                stats.suboptimality = bound
+            if bound <= 1.0:
+                return best_path, nodes, "solved"
+            w = max(1.0, w - weight_step)
+    finally:
+        if stats:
+            stats.finish(nodes, len(g), start_time)
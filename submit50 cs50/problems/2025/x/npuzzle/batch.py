@@ -0,0 +1,240 @@
+# npuzzle/batch.py
+# حل ملف كامل من الألواح من سطر الأوامر، موزعة على pool من العمليات (multiprocessing)
+# - الملف: لوح في كل سطر، يا أرقام مفصولة بمسافات أو فواصل ("1 2 3 4 5 6 7 0 8")
+#   يا JSON Lines: list أرقام أو object فيه "board" (واختياري "id" و "goal")
+# - كل لوح بيتحل في عملية لوحده بحد وقت وحد عقد خاصين بيه
+# - النتيجة بتطلع سطر JSON أول ما أي لوح يخلص (مش لما الملف كله يخلص)
+# تشغيل: python -m npuzzle.batch boards.txt --algo a_star --heuristic pdb --time-limit 30 -j 8
+# ملاحظة: الملف ده مفيهوش pygame
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import sqlite3
+import sys
+import time
+
+from . import ENGINES, MAX_STEPS, MEMORY_LIMITED, MULTIPROCESS, NO_HEURISTIC
+from .board import default_goal, is_solvable
+from .cache import DEFAULT_DB, SolutionCache
+from .heuristics import HEURISTICS
+from .shared import TableRegistry, install
+from .stats import SearchStats
+from .vector import heuristic_many
+
+# ----------------------------
+# قراءة الألواح
+# ----------------------------
+def parse_board(line):
+    """
+    سطر واحد -> (id أو None، board، goal أو None).
+    الحجم بيتحسب من عدد الخانات (لازم يكون مربع كامل).
+    """
+    text = line.strip()
+    ident = goal = None
+    if text.startswith("{"):
+        obj = json.loads(text)
+        ident, board, goal = obj.get("id"), obj["board"], obj.get("goal")
+    elif text.startswith("["):
+        board = json.loads(text)
+    else:
+        board = [int(x) for x in text.replace(",", " ").split()]
+    board = tuple(int(x) for x in board)
+    size = math.isqrt(len(board))
+    if size < 2 or size * size != len(board) or sorted(board) != list(range(size * size)):
+        raise ValueError(f"not a square board with tiles 0..n-1: {text[:60]}")
+    if goal is not None:
+        goal = tuple(int(x) for x in goal)
+        if sorted(goal) != sorted(board):
+            raise ValueError("goal does not have the same tiles as the board")
+    return ident, board, goal
+
+def read_boards(lines):
+    """
+    ترجع (id, board, goal, error) لكل سطر مش فاضي ومش تعليق (#).
+    الـ id الافتراضي = رقم السطر في الملف. السطر اللي مش بيتقري بيرجع error بدل ما يوقف الملف كله.
+    """
+    for lineno, line in enumerate(lines, 1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        try:
+            ident, board, goal = parse_board(line)
+        except (ValueError, KeyError, TypeError) as e:
+            yield lineno, None, None, str(e)
+            continue
+        yield (lineno if ident is None else ident), board, goal, None
+
+# ----------------------------
+# حل لوح واحد (جوه الـ worker)
+# ----------------------------
+_CACHES = {}
+
+def _cache(path):
+    """SolutionCache واحد لكل ملف في كل عملية (الـ connection بتاع sqlite ما بيتنقلش بين العمليات)"""
+    if path not in _CACHES:
+        _CACHES[path] = SolutionCache(path)
+    return _CACHES[path]
+
+def solve_one(job):
+    """
+    job = (id, board, goal, error, algo, heuristic, time_limit, max_steps, with_stats, memory_limit, cache)
+    -> dict النتيجة. with_stats=True بيضيف "stats" (SearchStats.to_dict) للنتيجة.
+    memory_limit (بايت): A* / Best-First بيكملوا بـ IDA* لو وصلوه، فكل worker ذاكرته متوقعة.
+    cache: مسار ملف SolutionCache أو None — اللوح (أو لوح متماثل) اللي اتحل قبل كده بيرجع من غير بحث.
+    الجداول (PDB / الجدول الدقيق) بتتحمل مرة واحدة لكل worker وبتفضل في الكاش بتاعه،
+    والـ mmap معناه إن كل العمليات بتقرا نفس الصفحات من الـ page cache.
+    """
+    ident, board, goal, error, algo, heuristic, time_limit, max_steps, with_stats, memory_limit, cache = job
+    result = {"id": ident, "size": None, "length": None, "nodes": 0, "elapsed": 0.0}
+    if error is not None:
+        result.update(reason="invalid", error=error)
+        return result
+    size = result["size"] = math.isqrt(len(board))
+    goal = goal or default_goal(size)
+    if not is_solvable(board, size, goal):
+        result["reason"] = "unsolvable"
+        return result
+    engine = ENGINES[algo]
+    stats = SearchStats() if with_stats else None
+    kwargs = {"time_limit": time_limit, "max_steps": max_steps, "stats": stats}
+    if algo not in NO_HEURISTIC:
+        kwargs["heuristic"] = heuristic
+    if algo in MEMORY_LIMITED:
+        kwargs["memory_limit"] = memory_limit
+    t0 = time.time()
+    try:
+        if cache is not None:
+            path, nodes, reason = _cache(cache).solve(algo, board, goal, size, **kwargs)
+        else:
+            path, nodes, reason = engine(board, goal, size, **kwargs)
+    except (ValueError, FileNotFoundError, RuntimeError, sqlite3.Error) as e:
+        # مثلاً PDB مش متبني للحجم ده، أو table مع لوح مش 3x3، أو worker في محرك متوازي وقع
+        result.update(reason="error", error=str(e), elapsed=round(time.time() - t0, 4))
+        return result
+    result.update(length=None if path is None else len(path) - 1, nodes=nodes,
+                  elapsed=round(time.time() - t0, 4), reason=reason)
+    if stats is not None:
+        result["stats"] = stats.to_dict()
+    return result
+
+def hardest_first(boards):
+    """
+    ترتيب الألواح تنازلي حسب Manhattan (تقدير تقريبي للصعوبة) علشان الـ pool ما يخلصش
+    كل السهل وآخر لوح صعب يتحل لوحده في الآخر. القيم بتتحسب batched لكل (size, goal).
+    السطور الغلط بتفضل في الأول (بترجع فورًا).
+    """
+    boards = list(boards)
+    groups = {}
+    for i, (ident, board, goal, error) in enumerate(boards):
+        if error is None:
+            size = math.isqrt(len(board))
+            groups.setdefault((size, goal or default_goal(size)), []).append(i)
+    score = [-1] * len(boards)
+    for (size, goal), idx in groups.items():
+        for i, h in zip(idx, heuristic_many([boards[i][1] for i in idx], goal, size)):
+            score[i] = h
+    order = sorted(range(len(boards)), key=lambda i: -score[i] if score[i] >= 0 else float("-inf"))
+    return [boards[i] for i in order]
+
+def share_tables(registry, boards, algo, heuristic):
+    """
+    بينشر جدول الهيوريستيك لكل (size, goal) في الألواح مرة واحدة قبل الـ pool (shared.py)،
+    فالـ workers بيربطوا عليه بدل ما كل واحد يبنيه. table بينشر جدول 3x3 الدقيق، و reduction
+    هيوريستيك آخر بلوك 3x3. الجدول اللي مش بيتحمل (PDB ناقص مثلًا) بيتساب: كل لوح هيرجع الغلط بتاعه.
+    """
+    if algo in NO_HEURISTIC and algo != "table":
+        return
+    method = "exact" if algo == "table" else heuristic
+    seen = set()
+    for ident, board, goal, error in boards:
+        if error is not None:
+            continue
+        size = math.isqrt(len(board))
+        goal = goal or default_goal(size)
+        if algo == "reduction":
+            size, goal = 3, default_goal(3)
+        if (size, goal) in seen:
+            continue
+        seen.add((size, goal))
+        try:
+            registry.share_heuristic(goal, size, method)
+        except (ValueError, FileNotFoundError):
+            pass
+
+def solve_many(boards, algo="a_star", heuristic="manhattan", time_limit=None, max_steps=MAX_STEPS,
+               workers=None, ordered=False, with_stats=False, memory_limit=None, cache=None):
+    """
+    boards: iterable من (id, board, goal, error) زي read_boards.
+    generator بيرجع dict لكل لوح أول ما يخلص (أو بالترتيب لو ordered=True).
+    workers=1 بيحل في نفس العملية من غير pool؛ غير كده جداول الهيوريستيك بتتنشر للـ workers (share_tables).
+    من غير ordered الألواح بتدخل الـ pool الأصعب الأول (hardest_first).
+    محركات MULTIPROCESS (hda_star / parallel_ida_star) بتشتغل دايمًا في نفس العملية لوح لوح: هي اللي
+    بتوزع اللوح الواحد على عملياتها (كل الـ cores)، وعمليات الـ pool (daemon) مينفعش تشغّل عمليات.
+    """
+    if algo in MULTIPROCESS:
+        workers = 1
+    if workers != 1:
+        # الألواح كلها في الذاكرة: share_tables بيلف عليها قبل الـ pool
+        boards = list(boards) if ordered else hardest_first(boards)
+    jobs = ((ident, board, goal, error, algo, heuristic, time_limit, max_steps, with_stats, memory_limit, cache)
+            for ident, board, goal, error in boards)
+    if workers == 1:
+        for job in jobs:
+            yield solve_one(job)
+        return
+    with TableRegistry() as registry:
+        share_tables(registry, boards, algo, heuristic)
+        with multiprocessing.Pool(workers, initializer=install, initargs=(registry.handles,)) as pool:
+            # chunksize=1: الألواح مختلفة جدًا في الصعوبة، فكل worker ياخد لوح لوح
+            results = pool.imap(solve_one, jobs) if ordered else pool.imap_unordered(solve_one, jobs)
+            for result in results:
+                yield result
+
+# ----------------------------
+# نقطة البداية: سطر الأوامر
+# ----------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a file of N-Puzzle boards on a process pool.")
+    parser.add_argument("boards", help="board file (one board per line or JSON Lines), '-' for stdin")
+    parser.add_argument("--algo", choices=sorted(ENGINES), default="a_star")
+    parser.add_argument("--heuristic", choices=HEURISTICS, default="manhattan")
+    parser.add_argument("--time-limit", type=float, default=None, help="seconds per board (default: none)")
+    parser.add_argument("--max-nodes", type=int, default=MAX_STEPS, help=f"node budget per board (default: {MAX_STEPS})")
+    parser.add_argument("--memory-limit", type=float, default=None,
+                        help="MB per board for a_star / best_first; past it the search continues as IDA*")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="worker processes (default: all cores)")
+    parser.add_argument("--ordered", action="store_true", help="write results in input order")
+    parser.add_argument("--stats", action="store_true",
+                        help="add search counters (expansions, duplicate/stale pops, open size, timings) to each result")
+    parser.add_argument("--cache", nargs="?", const=DEFAULT_DB, default=None, metavar="PATH",
+                        help="reuse solutions of boards (or symmetric boards) solved before; "
+                             f"shared sqlite file (default path: {DEFAULT_DB})")
+    parser.add_argument("--out", default=None, help="output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    src = sys.stdin if args.boards == "-" else open(args.boards)
+    out = sys.stdout if args.out is None else open(args.out, "w")
+    counts = {}
+    t0 = time.time()
+    try:
+        # الملف بيتقري كله الأول علشان الـ pool ما يقراش من stdin من عمليات مختلفة
+        boards = list(read_boards(src))
+        for result in solve_many(boards, args.algo, args.heuristic, args.time_limit, args.max_nodes,
+                                 args.workers, args.ordered, args.stats,
+                                 None if args.memory_limit is None else int(args.memory_limit * 1e6),
+                                 args.cache):
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+            counts[result["reason"]] = counts.get(result["reason"], 0) + 1
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if out is not sys.stdout:
+            out.close()
+    summary = ", ".join(f"{k} {v}" for k, v in sorted(counts.items()))
+    print(f"{sum(counts.values())} boards in {time.time() - t0:.1f}s ({summary})", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# npuzzle/beam.py
+# Beam search: بحث طبقة طبقة بيحتفظ بأحسن width حالة بس في كل عمق
+# - كل طبقة بتتوسع كلها، الجيران بيتشالوا منهم المكرر جوه نفس الطبقة (dict) واللي اتحفظ في طبقة
+#   قبلها (seen: من غير ده الـ beam بيلف في دواير على 5x5)، وبعدين أحسن width بالهيوريستيك
+#   (g واحد لكل الطبقة، فالترتيب بـ h بس) هي اللي بتكمل
+# - الذاكرة على قد width × العمق (parent لكل طبقة) مهما كان اللوح، والوقت على قد width × العمق × 3
+# - مش أمثل، بس على 5x5 الحل أقصر بكتير من Best-First (greedy) اللي الـ frontier بتاعه مفتوح
+# - لو لفة فشلت (الطبقة فضيت أو العمق عدى max_depth) بنكبّر width (× widen) ونعيد لحد max_width
+# - نفس عقد (path, nodes, reason) ونفس time_limit / max_steps / progress / stats زي search.py
+# ملاحظة: الملف ده مفيهوش pygame
+
+import heapq
+import time
+
+from .board import MAX_STEPS, decode_state, encode_state, expand, find_blank
+from .heuristics import get_heuristic, heuristic_val
+from .search import PROGRESS_EVERY, _expand_counted
+from .stats import timed_heuristic
+
+DEFAULT_WIDTH = 256
+
+def default_max_depth(size):
+    """حد العمق للفة الواحدة: أطول بكتير من أي حل beam معقول (3x3: 154، 5x5: 350)"""
+    return 2 * size ** 3 + 100
+
+def _beam_path(parents, state, size):
+    """المسار من parent بتاع كل طبقة: parents[d][state] = الأب في الطبقة d - 1"""
+    path = [state]
+    for layer in reversed(parents):
+        state = layer[state]
+        path.append(state)
+    path.reverse()
+    return [decode_state(p, size) for p in path]
+
+def beam_search(start, goal, size, heuristic="manhattan", time_limit=None, max_steps=MAX_STEPS, progress=None,
+                stats=None, width=DEFAULT_WIDTH, max_width=None, widen=4, max_depth=None):
+    """
+    width: عدد الحالات في كل طبقة. لو اللفة فشلت بنعيد بـ width × widen لحد max_width
+    (افتراضيًا width × 16)، وبعد آخر لفة فاشلة "exhausted".
+    nodes = العقد المتوسعة في كل اللفات؛ stats.iterations = عدد اللفات، stats.max_open = أكبر طبقة قبل القص.
+    progress: bound = العمق الحالي.
+    """
+    start_time = time.time()
+    table = timed_heuristic(get_heuristic(goal, size, heuristic), stats)
+    start, goal = encode_state(start, size), encode_state(goal, size)
+    h0 = heuristic_val(start, goal, size, heuristic)
+    if max_width is None:
+        max_width = width * 16
+    if max_depth is None:
+        max_depth = default_max_depth(size)
+    nodes = 0
+    seen = ()
+    try:
+        if start == goal:
+            return [decode_state(start, size)], 0, "solved"
+        while True:
+            if stats:
+                stats.iterations += 1
+            layer = [(start, h0, find_blank(start, size), -1)]
+            parents = []
+            seen = {start}
+            while layer and len(parents) < max_depth:
+                # n -> (h, blank, parent, blank الأب): أول أب بيولّد الحالة هو اللي بيتسجل
+                children = {}
+                for state, h, blank, prev_blank in layer:
+                    if time_limit and nodes & 1023 == 0 and (time.time() - start_time) > time_limit:
+                        return None, nodes, "time_limit"
+                    nodes += 1
+                    if nodes > max_steps:
+                        return None, nodes, "max_steps"
+                    if progress and nodes % PROGRESS_EVERY == 0 and \
+                            progress(nodes, len(parents), len(layer) + len(children)):
+                        return None, nodes, "cancelled"
+                    if stats:
+                        generated = _expand_counted(stats, state, size, h, table, blank, prev_blank)
+                    else:
+                        generated = expand(state, size, h, table, blank, prev_blank)
+                    for n, nh, n_blank in generated:
+                        if n in children or n in seen:
+                            if stats:
+                                stats.duplicate_pops += 1
+                            continue
+                        children[n] = (nh, n_blank, state, blank)
+                        if n == goal:
+                            parents.append({n: state})
+                            return _beam_path(parents, n, size), nodes, "solved"
+                best = heapq.nsmallest(width, children.items(), key=lambda item: item[1][0])
+                parents.append({n: parent for n, (_, _, parent, _) in best})
+                layer = [(n, nh, n_blank, blank) for n, (nh, n_blank, _, blank) in best]
+                seen.update(layer_state for layer_state, _ in best)
+                if stats and len(children) > stats.max_open:
+                    stats.max_open = len(children)
+            if width >= max_width:
+                return None, nodes, "exhausted"
+            width = min(max_width, width * widen)
+    finally:
+        if stats:
+            stats.finish(nodes, len(seen), start_time)
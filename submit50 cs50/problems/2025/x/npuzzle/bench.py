@@ -0,0 +1,246 @@
+# npuzzle/bench.py
+# Benchmark ثابت: نفس الألواح كل مرة، فالأرقام تتقارن بين نسخة والتانية
+# - مجموعات seeded (3x3 عشوائي منتظم، 3x3 و 5x5 random walk) بتتولد من seed ثابت
+# - Korf 100 (الـ 100 لوح 4x4 المشهورين) بيتقري من ملف بالصيغة المعتادة:
+#   كل سطر = رقم اللوح ثم 16 رقم (الفراغ = 0، والهدف 0 1 2 ... 15 الفراغ في الأول)
+#   الملف مش جوه الريبو: من غير --sets المجموعات الافتراضية فيها korf100 بس لو الملف موجود (أو --korf)،
+#   ولو korf100 مطلوبة بالاسم والملف مش موجود الـ bench بيقف بغلط من الأول
+# - لكل (مجموعة، محرك، هيوريستيك): nodes، nodes/sec، الوقت، أقصى ذاكرة، طول الحل
+# - النتيجة JSON Lines (سطر لكل لوح) و --compare بيقارن ملفين
+# تشغيل: python -m npuzzle.bench --sets 3x3-random --algos a_star,ida_star --out bench.jsonl
+# ملاحظة: الملف ده مفيهوش pygame
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from . import ENGINES, MAX_STEPS, NO_HEURISTIC
+from .batch import solve_one
+from .board import default_goal, generate_by_moves, random_board
+from .heuristics import HEURISTICS, WD_MAX_SIZE, get_heuristic
+
+KORF_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "korf100.txt")
+
+# ----------------------------
+# مجموعات الألواح (كل حاجة بتتولد من seed فالمجموعة هي هي في كل تشغيل)
+# ----------------------------
+SETS = {
+    "3x3-random": {"size": 3, "count": 100, "seed": 1, "walk": None},  # uniform من كل الحالات
+    "3x3-walk": {"size": 3, "count": 100, "seed": 2, "walk": 30},
+    "5x5-walk": {"size": 5, "count": 20, "seed": 5, "walk": 40},
+    "korf100": None,  # من ملف
+}
+
+def seeded_set(spec):
+    """ترجع list من (id, board, goal) — نفس الألواح لنفس الـ spec"""
+    size = spec["size"]
+    goal = default_goal(size)
+    rng = random.Random(spec["seed"])
+    boards = []
+    for i in range(spec["count"]):
+        if spec["walk"]:
+            board = generate_by_moves(goal, size, spec["walk"], rng)
+        else:
+            board = random_board(goal, size, rng)
+        boards.append((i + 1, board, goal))
+    return boards
+
+def load_korf(path=KORF_PATH):
+    """
+    ملف Korf: سطر لكل لوح، "id t0 t1 ... t15" (أو 16 رقم من غير id)، والتعليقات بـ #.
+    الهدف عند Korf: الفراغ في الخانة 0 ثم 1..15.
+    """
+    goal = tuple(range(16))
+    boards = []
+    with open(path) as f:
+        for lineno, line in enumerate(f, 1):
+            nums = [int(x) for x in line.split("#")[0].split()]
+            if not nums:
+                continue
+            if len(nums) == 17:
+                ident, board = nums[0], tuple(nums[1:])
+            elif len(nums) == 16:
+                ident, board = len(boards) + 1, tuple(nums)
+            else:
+                raise ValueError(f"{path}:{lineno}: expected 16 tiles (optionally preceded by an id)")
+            if sorted(board) != list(goal):
+                raise ValueError(f"{path}:{lineno}: not a 4x4 board")
+            boards.append((ident, board, goal))
+    return boards
+
+def load_set(name, korf_path=KORF_PATH):
+    if name == "korf100":
+        return load_korf(korf_path)
+    return seeded_set(SETS[name])
+
+def skip_reason(algo, heuristic, size, goal):
+    """ليه التركيبة دي مش هتشتغل على المجموعة (None = تشتغل)"""
+    if algo in ("dfs", "table", "bidirectional_bfs") and size != 3:
+        return f"{algo} is only run on 3x3"
+    if algo in NO_HEURISTIC:
+        return None
+    if heuristic == "exact" and size != 3:
+        return "exact table is 3x3 only"
+    if heuristic == "walking_distance" and size > WD_MAX_SIZE:
+        return f"walking distance is limited to {WD_MAX_SIZE}x{WD_MAX_SIZE}"
+    if heuristic == "pdb":
+        from . import pattern_db
+        if pattern_db.find_default(size, goal) is None:
+            return f"no pattern database for {size}x{size} with this goal ({pattern_db.build_command(size, goal)})"
+    return None
+
+# ----------------------------
+# التشغيل
+# ----------------------------
+def run_combo(set_name, boards, size, algo, heuristic, time_limit, max_steps, memory=True):
+    """
+    generator: dict لكل لوح. الوقت بيتقاس من غير tracemalloc (بيبطّأ البحث كتير)،
+    ولو memory=True بنعيد نفس اللوح تحت tracemalloc علشان أقصى ذاكرة (peak_bytes).
+    """
+    if algo not in NO_HEURISTIC:
+        # الجداول (PDB / WD / الجدول الدقيق) تتحمل قبل القياس مش جوه أول لوح
+        get_heuristic(boards[0][2], size, heuristic)
+    for ident, board, goal in boards:
+        job = (ident, board, goal, None, algo, heuristic, time_limit, max_steps, False, None, None)
+        result = solve_one(job)
+        peak = None
+        if memory and result["reason"] not in ("invalid", "unsolvable", "error"):
+            tracemalloc.start()
+            solve_one(job)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        elapsed = result["elapsed"]
+        yield {
+            "set": set_name, "id": ident, "algo": algo,
+            "heuristic": None if algo in NO_HEURISTIC else heuristic,
+            "size": result["size"], "length": result["length"], "nodes": result["nodes"],
+            "elapsed": elapsed, "nodes_per_sec": round(result["nodes"] / elapsed) if elapsed > 0 else None,
+            "peak_bytes": peak, "reason": result["reason"],
+        }
+
+def summarize(records):
+    """(set, algo, heuristic) -> مجاميع: solved، nodes، elapsed، أقصى peak، مجموع الأطوال"""
+    out = {}
+    for r in records:
+        key = (r["set"], r["algo"], r["heuristic"])
+        s = out.setdefault(key, {"count": 0, "solved": 0, "nodes": 0, "elapsed": 0.0, "peak_bytes": 0, "length": 0})
+        s["count"] += 1
+        s["nodes"] += r["nodes"]
+        s["elapsed"] += r["elapsed"]
+        s["peak_bytes"] = max(s["peak_bytes"], r["peak_bytes"] or 0)
+        if r["reason"] == "solved":
+            s["solved"] += 1
+            s["length"] += r["length"]
+    return out
+
+def print_summary(records, file=sys.stderr):
+    print(f"{'set':<12} {'algo':<17} {'heuristic':<17} {'solved':>9} {'nodes':>12} {'time s':>9} {'nodes/s':>10} {'peak MB':>8} {'len':>7}", file=file)
+    for (set_name, algo, heur), s in sorted(summarize(records).items(), key=lambda kv: tuple(str(k) for k in kv[0])):
+        rate = s["nodes"] / s["elapsed"] if s["elapsed"] > 0 else 0
+        print(f"{set_name:<12} {algo:<17} {str(heur or '-'):<17} {s['solved']:>4}/{s['count']:<4} {s['nodes']:>12,} "
+              f"{s['elapsed']:>9.2f} {rate:>10,.0f} {s['peak_bytes'] / 1e6:>8.1f} {s['length']:>7}", file=file)
+
+def compare(old_records, new_records, file=sys.stdout):
+    """
+    بيقارن تشغيلتين لكل (set, algo, heuristic): نسبة الـ nodes والوقت (جديد / قديم)،
+    وبيعلّم أي لوح طول حله اتغير (لمحرك أمثل ده معناه bug).
+    """
+    old, new = summarize(old_records), summarize(new_records)
+    print(f"{'set':<12} {'algo':<17} {'heuristic':<17} {'solved':>11} {'nodes x':>8} {'time x':>8}", file=file)
+    for key in sorted(set(old) & set(new), key=lambda k: tuple(str(x) for x in k)):
+        o, n = old[key], new[key]
+        nodes_x = n["nodes"] / o["nodes"] if o["nodes"] else float("nan")
+        time_x = n["elapsed"] / o["elapsed"] if o["elapsed"] else float("nan")
+        print(f"{key[0]:<12} {key[1]:<17} {str(key[2] or '-'):<17} {o['solved']:>5}->{n['solved']:<5} "
+              f"{nodes_x:>8.2f} {time_x:>8.2f}", file=file)
+    lengths = {(r["set"], r["algo"], r["heuristic"], r["id"]): r["length"] for r in old_records if r["reason"] == "solved"}
+    for r in new_records:
+        key = (r["set"], r["algo"], r["heuristic"], r["id"])
+        if r["reason"] == "solved" and key in lengths and lengths[key] != r["length"]:
+            print(f"length changed: {key}: {lengths[key]} -> {r['length']}", file=file)
+
+def read_records(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+# ----------------------------
+# نقطة البداية: سطر الأوامر
+# ----------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the fixed N-Puzzle benchmark sets.")
+    parser.add_argument("--sets", default=None,
+                        help=f"comma-separated sets (default: {','.join(SETS)}; korf100 only if its file exists)")
+    parser.add_argument("--algos", default=",".join(ENGINES), help="comma-separated engines")
+    parser.add_argument("--heuristics", default=",".join(HEURISTICS), help="comma-separated heuristics")
+    parser.add_argument("--limit", type=int, default=None, help="only the first N boards of each set")
+    parser.add_argument("--time-limit", type=float, default=30, help="seconds per board (default: 30)")
+    parser.add_argument("--max-nodes", type=int, default=MAX_STEPS, help=f"node budget per board (default: {MAX_STEPS})")
+    parser.add_argument("--korf", default=None, help=f"Korf 100 instance file (default: {KORF_PATH})")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass (halves the run time)")
+    parser.add_argument("--out", default=None, help="JSON Lines results file (default: stdout)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two results files and exit")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(read_records(args.compare[0]), read_records(args.compare[1]))
+        return
+
+    def note(msg):
+        print(msg, file=sys.stderr, flush=True)
+
+    for name in args.algos.split(","):
+        if name not in ENGINES:
+            parser.error(f"unknown engine {name!r} (choose from {', '.join(ENGINES)})")
+    for name in args.heuristics.split(","):
+        if name not in HEURISTICS:
+            parser.error(f"unknown heuristic {name!r} (choose from {', '.join(HEURISTICS)})")
+
+    korf_given = args.korf is not None
+    args.korf = args.korf or KORF_PATH
+    if args.sets is None:
+        # korf100 بس لو الملف موجود أو اتطلب بـ --korf (وساعتها الملف الناقص غلط تحت)
+        set_names = [name for name in SETS if name != "korf100" or korf_given or os.path.exists(args.korf)]
+        if "korf100" not in set_names:
+            note(f"korf100: not run, {args.korf} not found (put the instance file there or pass --korf)")
+    else:
+        set_names = args.sets.split(",")
+    for set_name in set_names:
+        if set_name not in SETS:
+            parser.error(f"unknown set {set_name!r} (choose from {', '.join(SETS)})")
+    if "korf100" in set_names and not os.path.exists(args.korf):
+        parser.error(f"korf100: {args.korf} not found (put the 100 Korf instances there, pass --korf, "
+                     "or leave korf100 out of --sets)")
+
+    out = sys.stdout if args.out is None else open(args.out, "w")
+    records = []
+    try:
+        for set_name in set_names:
+            boards = load_set(set_name, args.korf)[:args.limit]
+            size = int(len(boards[0][1]) ** 0.5)
+            for algo in args.algos.split(","):
+                # المحركات اللي من غير heuristic بتشتغل مرة واحدة بس
+                heuristics = [None] if algo in NO_HEURISTIC else args.heuristics.split(",")
+                for heur in heuristics:
+                    why = skip_reason(algo, heur, size, boards[0][2])
+                    if why:
+                        note(f"{set_name} {algo} {heur or '-'}: skipped, {why}")
+                        continue
+                    note(f"{set_name} {algo} {heur or '-'}: {len(boards)} boards")
+                    t0 = time.time()
+                    for rec in run_combo(set_name, boards, size, algo, heur, args.time_limit, args.max_nodes,
+                                         memory=not args.no_memory):
+                        records.append(rec)
+                        out.write(json.dumps(rec) + "\n")
+                        out.flush()
+                    note(f"  done in {time.time() - t0:.1f}s")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print_summary(records)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+# npuzzle/bidirectional.py
+# بحث من الناحيتين: من البداية للهدف ومن الهدف للبداية لحد ما يتقابلوا في النص
+# - الحركات في البازل بتترجع (الجار جار في الاتجاهين)، فالبحث لورا هو نفس البحث بالظبط مع تبديل البداية والهدف
+# - bidirectional_bfs: من غير هيوريستيك — طبقة كاملة من الناحية اللي frontier بتاعها أصغر
+# - mm: بحث MM (Holte et al. 2016, "meet in the middle"): كل ناحية أولويتها pr = max(g + h, 2g)
+#   فمفيش ناحية بتعدي نص المسافة قبل ما تقابل التانية، والوقوف لما U (أحسن مسار متقابل) يبقى
+#   <= max(C, fmin_F, fmin_B, gmin_F + gmin_B + 1) وده إثبات إن مفيش مسار أقصر
+# - نفس عقد (path, nodes, reason) ونفس time_limit / max_steps / progress / stats زي search.py
+# - المسار: من البداية لحالة التقابل (parent قدام) + من حالة التقابل للهدف (parent ورا بالعكس)
+# ملاحظة: الملف ده مفيهوش pygame
+
+import time
+
+from .board import MAX_STEPS, decode_state, encode_state, expand, find_blank, move_table, tile_bits
+from .heuristics import get_heuristic
+from .openlist import BucketQueue
+from .search import PROGRESS_EVERY, _expand_counted
+from .stats import timed_heuristic
+
+def _stitch(parent_f, parent_b, meet, size):
+    """المسار الكامل: البداية -> meet بـ parent_f، وبعدين meet -> الهدف بـ parent_b"""
+    path = []
+    state = meet
+    while state is not None:
+        path.append(state)
+        state = parent_f[state]
+    path.reverse()
+    state = parent_b[meet]
+    while state is not None:
+        path.append(state)
+        state = parent_b[state]
+    return [decode_state(p, size) for p in path]
+
+# ----------------------------
+# Bidirectional BFS
+# ----------------------------
+def bidirectional_bfs(start, goal, size, time_limit=None, max_steps=MAX_STEPS, progress=None, stats=None):
+    """
+    كل لفة بتوسع طبقة كاملة من الناحية اللي frontier بتاعها أصغر.
+    أول طبقة فيها تقابل بتتكمل للآخر وبناخد أقصر مجموع g_F + g_B منها، فالحل أمثل:
+    أي مسار أقصر كان هيتقابل في طبقة قبلها.
+    progress: bound = مجموع عمق الناحيتين.
+    """
+    start_time = time.time()
+    bits = tile_bits(size)
+    mask = (1 << bits) - 1
+    moves = move_table(size)
+    start, goal = encode_state(start, size), encode_state(goal, size)
+    parents = ({start: None}, {goal: None})
+    depth = [0, 0]
+    frontiers = ([(start, find_blank(start, size))], [(goal, find_blank(goal, size))])
+    nodes = 0
+    try:
+        if start == goal:
+            return [decode_state(start, size)], 0, "solved"
+        while frontiers[0] and frontiers[1]:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            mine, other = parents[side], parents[1 - side]
+            best = None   # (طول المسار، حالة التقابل)
+            layer = []
+            for state, blank in frontiers[side]:
+                if time_limit and nodes & 1023 == 0 and (time.time() - start_time) > time_limit:
+                    return None, nodes, "time_limit"
+                nodes += 1
+                if nodes > max_steps:
+                    return None, nodes, "max_steps"
+                if progress and nodes % PROGRESS_EVERY == 0 and \
+                        progress(nodes, depth[0] + depth[1], len(frontiers[0]) + len(frontiers[1]) + len(layer)):
+                    return None, nodes, "cancelled"
+                if stats:
+                    t = time.perf_counter()
+                blank_shift = bits * blank
+                for target in moves[blank]:
+                    shift = bits * target
+                    tile = (state >> shift) & mask
+                    n = state - (tile << shift) + (tile << blank_shift)
+                    if n in mine:
+                        continue
+                    mine[n] = state
+                    layer.append((n, target))
+                    if n in other:
+                        # عمق n في الناحية التانية = طول السلسلة لحد بدايتها
+                        length = depth[side] + 1 + _chain_length(other, n)
+                        if best is None or length < best[0]:
+                            best = (length, n)
+                if stats:
+                    stats.neighbors_time += time.perf_counter() - t
+                    stats.expansions += 1
+                    stats.generated += len(moves[blank])
+            depth[side] += 1
+            frontiers = (layer, frontiers[1]) if side == 0 else (frontiers[0], layer)
+            if stats and len(frontiers[0]) + len(frontiers[1]) > stats.max_open:
+                stats.max_open = len(frontiers[0]) + len(frontiers[1])
+            if best is not None:
+                return _stitch(parents[0], parents[1], best[1], size), nodes, "solved"
+        return None, nodes, "exhausted"
+    finally:
+        if stats:
+            stats.finish(nodes, len(parents[0]) + len(parents[1]), start_time)
+
+def _chain_length(parent, state):
+    length = 0
+    state = parent[state]
+    while state is not None:
+        length += 1
+        state = parent[state]
+    return length
+
+# ----------------------------
+# هيوريستيك الناحية التانية: المسافة للبداية بدل الهدف
+# ----------------------------
+# جداول PDB والجدول الدقيق متبنية على هدف واحد، وتغيير أسماء البلاطات علشان البداية تبقى الهدف
+# مش بيشتغل: الفراغ في البداية والهدف مش في نفس الخانة غالبًا، فالبلاطات مش بتتطابق
+# (والهيوريستيك كان بيطلع أكبر من المسافة الحقيقية). بدل كده:
+# - "exact": |d(state) - d(start)| من نفس الجدول — d مسافة حقيقية فدي admissible و consistent
+# - "pdb": Linear Conflict للبداية (بناء PDB لكل بداية بياخد دقايق على 4x4)
+class _Differential:
+    """h(state, start) = |d(state, goal) - d(start, goal)| من جدول المسافات الدقيقة"""
+    def __init__(self, table, start):
+        self.table = table
+        self.d0 = table(start)
+
+    def __call__(self, code):
+        return abs(self.table(code) - self.d0)
+
+    def update(self, child, h, tile, src, dst):
+        return self(child)
+
+def backward_heuristic(start, goal, size, method="manhattan"):
+    """الهيوريستيك اللي بيقدّر المسافة من أي حالة لـ start (للبحث اللي ماشي من الهدف)"""
+    if method == "exact":
+        return _Differential(get_heuristic(goal, size, method), decode_state(start, size))
+    if method == "pdb":
+        return get_heuristic(start, size, "linear_conflict")
+    return get_heuristic(start, size, method)
+
+def _h0(table, code, size):
+    if isinstance(table, tuple):
+        return sum(table[t][i] for i, t in enumerate(decode_state(code, size)))
+    return table(code)
+
+# ----------------------------
+# MM
+# ----------------------------
+# عنصر الـ open list: (state << 48) | (h << 32) | (blank << 16) | (prev_blank + 1)
+# h جوه العنصر علشان pr = max(g + h, 2g) ما ينفعش نرجّع منها h وإحنا محتاجينها للتحديث التدريجي
+class _Side:
+    """ناحية واحدة من MM: open list بالأولوية pr، و g لكل حالة، وعدادات f و g للعناصر الصالحة في الـ open"""
+    def __init__(self, origin, h, size):
+        self.pq = BucketQueue()
+        self.g = {origin: 0}
+        self.parent = {origin: None}
+        self.closed = set()
+        self.f_count = []
+        self.g_count = []
+        self.low = [0, 0]   # أقل f وأقل g ممكن يكون ليهم عناصر (بيتقدم بس لما العدادات تفضى)
+        self.size = 0       # عدد العناصر الصالحة في الـ open (من غير المكررة القديمة)
+        self.push(origin, 0, h, find_blank(origin, size), -1)
+
+    def push(self, state, g, h, blank, prev_blank):
+        f = g + h
+        for i, counts, k in ((0, self.f_count, f), (1, self.g_count, g)):
+            while k >= len(counts):
+                counts.append(0)
+            counts[k] += 1
+            if k < self.low[i]:
+                self.low[i] = k
+        self.size += 1
+        self.pq.push(max(f, 2 * g), g, (state << 48) | (h << 32) | (blank << 16) | (prev_blank + 1))
+
+    def drop(self, g, h):
+        """عنصر خرج من الـ open (اتسحب أو اتلقاله g أحسن)"""
+        self.f_count[g + h] -= 1
+        self.g_count[g] -= 1
+        self.size -= 1
+
+    def _first(self, i, counts):
+        k = self.low[i]
+        while k < len(counts) and not counts[k]:
+            k += 1
+        self.low[i] = k
+        return k if k < len(counts) else float('inf')
+
+    def fmin(self):
+        return self._first(0, self.f_count)
+
+    def gmin(self):
+        return self._first(1, self.g_count)
+
+def mm(start, goal, size, heuristic="manhattan", time_limit=None, max_steps=MAX_STEPS, progress=None,
+       stats=None):
+    """
+    MM: كل لفة بتوسع من الناحية اللي أقل pr عندها (التعادل: الـ open الأصغر).
+    U = أقصر مسار متقابل لحد دلوقتي؛ البحث بيقف لما U <= max(C, fmin_F, fmin_B, gmin_F + gmin_B + 1)
+    (C = أقل pr في الناحيتين) — كل حد فيهم حد أدنى لأي مسار لسه ما اتلقاش، فـ U أمثل.
+    الهيوريستيك لازم يكون admissible بس: الـ PDB الجمعي مش consistent، فالحالة اللي تتلقالها g أحسن
+    بعد ما اتوسعت بتتفتح تاني. مع "pdb" / "exact" الناحية اللي ورا بتستخدم backward_heuristic.
+    progress: bound = C.
+    """
+    start_time = time.time()
+    h_fwd = timed_heuristic(get_heuristic(goal, size, heuristic), stats)
+    h_bwd = timed_heuristic(backward_heuristic(start, goal, size, heuristic), stats)
+    start, goal = encode_state(start, size), encode_state(goal, size)
+    sides = (_Side(start, _h0(h_fwd, start, size), size), _Side(goal, _h0(h_bwd, goal, size), size))
+    tables = (h_fwd, h_bwd)
+    best, meet = float('inf'), None
+    if start == goal:
+        best, meet = 0, start
+    nodes = 0
+    try:
+        while sides[0].size and sides[1].size:
+            fwd, bwd = sides
+            prs = (fwd.pq.min_key(), bwd.pq.min_key())
+            c = min(prs)
+            if best <= max(c, fwd.fmin(), bwd.fmin(), fwd.gmin() + bwd.gmin() + 1):
+                break
+            side = 0 if (prs[0], fwd.size) <= (prs[1], bwd.size) else 1
+            me, other = sides[side], sides[1 - side]
+            _, g, item = me.pq.pop()
+            state, h = item >> 48, (item >> 32) & 0xffff
+            if me.g[state] != g or state in me.closed:
+                # نسخة قديمة: الحالة اتلقالها g أحسن بعد ما اتحطت (أو اتوسعت خلاص)
+                if stats:
+                    stats.stale_pops += 1
+                continue
+            me.drop(g, h)
+            me.closed.add(state)
+            if time_limit and nodes & 1023 == 0 and (time.time() - start_time) > time_limit:
+                return None, nodes, "time_limit"
+            nodes += 1
+            if nodes > max_steps:
+                return None, nodes, "max_steps"
+            if progress and nodes % PROGRESS_EVERY == 0 and progress(nodes, c, fwd.size + bwd.size):
+                return None, nodes, "cancelled"
+            blank, prev_blank = (item >> 16) & 0xffff, (item & 0xffff) - 1
+            if stats:
+                children = _expand_counted(stats, state, size, h, tables[side], blank, prev_blank)
+            else:
+                children = expand(state, size, h, tables[side], blank, prev_blank)
+            new_g = g + 1
+            for n, nh, n_blank in children:
+                old = me.g.get(n)
+                if old is not None and old <= new_g:
+                    continue
+                if old is not None:
+                    if n in me.closed:
+                        me.closed.discard(n)   # reopen
+                    else:
+                        me.drop(old, nh)
+                me.g[n] = new_g
+                me.parent[n] = state
+                me.push(n, new_g, nh, n_blank, blank)
+                other_g = other.g.get(n)
+                if other_g is not None and new_g + other_g < best:
+                    best, meet = new_g + other_g, n
+            if stats and fwd.size + bwd.size > stats.max_open:
+                stats.max_open = fwd.size + bwd.size
+        if meet is None:
+            return None, nodes, "exhausted"
+        return _stitch(sides[0].parent, sides[1].parent, meet, size), nodes, "solved"
+    finally:
+        if stats:
+            stats.finish(nodes, len(sides[0].g) + len(sides[1].g), start_time)
@@ -0,0 +1,219 @@
+# npuzzle/board.py
+# تمثيل الحالة والحركات للـ N-Puzzle: الضغط في int، جداول الحركات، الشفل، قابلية الحل
+# ملاحظة: الملف ده مفيهوش pygame
+
+import random
+
+# ----------------------------
+# تعاريف سلوك الشفل بحسب الحجم والصعوبة
+# - هذه الخريطة تُستخدم لتحديد عدد الحركات العشوائية (shuffle)
+# ----------------------------
+SHUFFLE_MAP = {
+    3: {"Easy": 10, "Medium": 20, "Hard": 50},
+    4: {"Easy": 30, "Medium": 80, "Hard": 120},
+    5: {"Easy": 80, "Medium": 160, "Hard": 300},
+    10: {"Easy": 300, "Medium": 1500, "Hard": 6000},  # Reduction بس (reduction.py)
+}
+
+# حدود للحماية (لمنع استهلاك وقت غير محدود)
+MAX_STEPS = 500000
+# حد الذاكرة الافتراضي للواجهة (بايت) — لما A* / Best-First يوصلوه بيكملوا بـ IDA* (search.py)
+MEMORY_LIMIT = 1 << 30
+
+# ----------------------------
+# تمثيل الحالة كـ int مضغوط (bit-packed)
+# - كل خانة i بتاخد bits بت في المكان bits*i
+# - 3x3 و 4x4: 4 بت لكل بلاطة (4x4 كله = 64 بت)، 5x5: 5 بت لكل بلاطة (125 بت)
+# - الـ int أصغر بكتير من tuple وأسرع في الـ hash، فالـ visited / best_g بيصغروا جدًا
+# - الـ tuples بتتبني بس عند حدود الواجهة (draw_board) أو لما نرجع المسار
+# ----------------------------
+def tile_bits(size):
+    """عدد البتات اللازمة لتخزين أكبر رقم بلاطة (size*size - 1)"""
+    return max(4, (size * size - 1).bit_length())
+
+def encode_state(state, size):
+    """tuple -> int مضغوط (لو الحالة int أصلاً بترجع زي ما هي)"""
+    if isinstance(state, int):
+        return state
+    bits = tile_bits(size)
+    code = 0
+    for i, v in enumerate(state):
+        code |= v << (bits * i)
+    return code
+
+def decode_state(code, size):
+    """int مضغوط -> tuple (لو الحالة tuple أصلاً بترجع زي ما هي)"""
+    if not isinstance(code, int):
+        return tuple(code)
+    bits = tile_bits(size)
+    mask = (1 << bits) - 1
+    return tuple((code >> (bits * i)) & mask for i in range(size * size))
+
+def find_blank(code, size):
+    """مكان الصفر في حالة مضغوطة (أو tuple)"""
+    if not isinstance(code, int):
+        return code.index(0)
+    bits = tile_bits(size)
+    mask = (1 << bits) - 1
+    for i in range(size * size):
+        if (code >> (bits * i)) & mask == 0:
+            return i
+    raise ValueError("state has no blank tile")
+
+
+# ----------------------------
+# دوال حالات البازل: جيران، شفل، قابلية الحل
+# ----------------------------
+# جداول الحركات: لكل حجم، _MOVE_TABLES[size][blank] = الخانات اللي الفراغ يقدر يروحلها
+# بتتحسب مرة واحدة لكل حجم بدل divmod وفحص الحدود في كل توسيع
+_MOVE_TABLES = {}
+
+def move_table(size):
+    """ترجع tuple فيه لكل خانة للفراغ الخانات المجاورة المسموحة (فوق، تحت، شمال، يمين)"""
+    table = _MOVE_TABLES.get(size)
+    if table is None:
+        rows = []
+        for idx in range(size * size):
+            row, col = divmod(idx, size)
+            targets = []
+            for dr, dc in [(-1,0),(1,0),(0,-1),(0,1)]:
+                r, c = row + dr, col + dc
+                if 0 <= r < size and 0 <= c < size:
+                    targets.append(r * size + c)
+            rows.append(tuple(targets))
+        table = tuple(rows)
+        _MOVE_TABLES[size] = table
+    return table
+
+def legal_moves(size, blank, prev_blank=-1):
+    """
+    ترجع الحركات (الخانة اللي الفراغ هيروحلها) من غير ما نبني أي حالة.
+    prev_blank: مكان الفراغ في الأب — الحركة اللي ترجعله بنشيلها (عكس آخر حركة).
+    """
+    return [t for t in move_table(size)[blank] if t != prev_blank]
+
+def apply_move(state, blank, target, bits=None):
+    """
+    تبدّل الفراغ (في blank) مع البلاطة اللي في target.
+    - tuple: بترجع tuple جديد
+    - int مضغوط (bits لازم يتبعت): البلاطة بتتشال من target وتتحط في blank (الفراغ قيمته 0)
+    """
+    if bits is not None:
+        shift = bits * target
+        tile = (state >> shift) & ((1 << bits) - 1)
+        return state - (tile << shift) + (tile << (bits * blank))
+    new_state = list(state)
+    new_state[blank], new_state[target] = new_state[target], 0
+    return tuple(new_state)
+
+def get_neighbors(state, size, blank=None, prev_blank=-1):
+    """
+    ترجع قائمة الحالات الناتجة من تحريك البلاطة الفارغة (0) بمقدار خطوة.
+    لو blank معروف (متشال مع الحالة) مش بنعمل بحث عن الصفر.
+    الجيران بيرجعوا بنفس نوع state (tuple أو int مضغوط).
+    """
+    bits = tile_bits(size) if isinstance(state, int) else None
+    if blank is None:
+        blank = find_blank(state, size)
+    return [apply_move(state, blank, t, bits) for t in move_table(size)[blank] if t != prev_blank]
+
+def expand(code, size, h, table, blank, prev_blank=-1):
+    """
+    بتشتغل على الحالة المضغوطة (int) مباشرة.
+    بترجع (الحالة الجديدة، h الجديدة، مكان الفراغ الجديد) لكل جار ما عدا عكس آخر حركة.
+    لما الفراغ يتبادل مع بلاطة، البلاطة دي بس هي اللي مكانها اتغير،
+    فـ h الجديدة = h الأب - تكلفة البلاطة في مكانها القديم + تكلفتها في مكان الفراغ (O(1)).
+    لو table مش جدول (زي PDB) بننادي table.update على الحالة الجديدة.
+    """
+    bits = tile_bits(size)
+    mask = (1 << bits) - 1
+    blank_shift = bits * blank
+    additive = isinstance(table, tuple)
+    result = []
+    for target in move_table(size)[blank]:
+        if target == prev_blank:
+            continue
+        shift = bits * target
+        tile = (code >> shift) & mask
+        n = code - (tile << shift) + (tile << blank_shift)
+        if additive:
+            cost = table[tile]
+            result.append((n, h - cost[target] + cost[blank], target))
+        else:
+            result.append((n, table.update(n, h, tile, target, blank), target))
+    return result
+
+def default_goal(size):
+    """الهدف اللي الواجهة بتستخدمه: 1..n-1 ثم الفراغ في الآخر"""
+    return tuple(list(range(1, size*size)) + [0])
+
+def generate_by_moves(goal, size, moves, rng=random):
+    """
+    نبدأ من الحالة الهدف ثم نعمل 'moves' حركات عشوائية صالحة بحيث تكون النتيجة قابلة للحل.
+    هذه طريقة مضمونة لإنشاء حالة قابلة للحل (لأننا بدئنا من goal).
+    بنشيل مكان الفراغ معانا ونختار حركة بس، والحالة بتتبني مرة واحدة في الآخر.
+    rng: random.Random(seed) لو محتاجين نفس الألواح كل مرة (زي الـ benchmark)
+    """
+    cur = list(goal)
+    blank = cur.index(0)
+    prev = -1
+    for _ in range(moves):
+        # منع التراجع الفوري للخلف لعمل شفل أفضل
+        target = rng.choice(legal_moves(size, blank, prev))
+        cur[blank], cur[target] = cur[target], 0
+        prev, blank = blank, target
+    return tuple(cur)
+
+def random_board(goal, size, rng=random):
+    """
+    لوح عشوائي منتظم (uniform) من كل الحالات القابلة للحل — أصعب بكتير من random walk.
+    بنلخبط كل الخانات، ولو الـ parity غلط بنبدّل أول بلاطتين (مش الفراغ) فيبقى قابل للحل.
+    """
+    cur = list(goal)
+    rng.shuffle(cur)
+    if not is_solvable(cur, size, goal):
+        i, j = [k for k, v in enumerate(cur) if v != 0][:2]
+        cur[i], cur[j] = cur[j], cur[i]
+    return tuple(cur)
+
+def is_solvable(state, size, goal):
+    """
+    تحقق قابلية الحل عن طريق حساب inversions.
+    طريقة معيارية (بنقارن الحالة بالهدف نفسه، مش بترتيب ثابت):
+    - لو الحجم فردي: parity الـ inversions لازم تساوي parity الهدف.
+    - لو الحجم زوجي: parity (inversions + صف الصفر) لازم تساوي نفس القيمة للهدف.
+    (مكتوبة علشان لو استخدمت توليد عشوائي مختلف أو ألواح جاية من ملف)
+    """
+    def parity(s):
+        s = decode_state(s, size)
+        arr = [x for x in s if x != 0]
+        inv = 0
+        for i in range(len(arr)):
+            for j in range(i+1, len(arr)):
+                if arr[i] > arr[j]:
+                    inv += 1
+        if size % 2 == 0:
+            # كل حركة رأسية بتغير الـ inversions بعدد فردي (size - 1) وبتغير صف الصفر بواحد
+            inv += s.index(0) // size
+        return inv % 2
+    return parity(state) == parity(goal)
+
+# ----------------------------
+# إعادة بناء المسار من مؤشرات الأب (parent pointers)
+# - بدل ما كل عقدة تشيل نسخة كاملة من المسار (path + [n])، بنخزن لكل حالة الأب بتاعها بس
+# - المسار بيتبني مرة واحدة لما نوصل للهدف
+# ----------------------------
+def reconstruct_path(parent, state, size=None):
+    """
+    ترجع المسار من البداية إلى state بالمشي على parent لورا.
+    parent: dict بيربط كل حالة بالحالة اللي جت منها (البداية أبوها None)
+    لو size متبعت الحالات المضغوطة بتتفك لـ tuples (مرة واحدة للمسار كله).
+    """
+    path = []
+    while state is not None:
+        path.append(state)
+        state = parent[state]
+    path.reverse()
+    if size is not None:
+        path = [decode_state(p, size) for p in path]
+    return path
@@ -0,0 +1,222 @@
+# npuzzle/cache.py
+# كاش للحلول قدام المحركات: نفس اللوح (أو لوح متماثل معاه) ما يتحلش مرتين
+# - المفتاح شكل canonical للحالة: كل تماثل هندسي للوح (دوران / انعكاس / transpose) بيسيب فراغ الهدف
+#   في مكانه بيبقى تماثل للمسألة كلها بعد إعادة ترقيم البلاطات؛ بناخد أصغر كود من بينهم
+#   (للهدف العادي 1..n-1 ثم الفراغ: الأصل والـ transpose، فاللوح ومرآته على القطر مفتاح واحد)
+# - القيمة نص حركات مضغوط (حرف لكل حركة للفراغ: U / D / L / R) في إطار الشكل الـ canonical
+# - في الذاكرة: LRU بحد بايتات (OrderedDict)، وعلى الديسك اختياري: sqlite مشترك بين العمليات
+# - hit بيرجع المسار من غير بحث: (path, 0, "solved")
+# ملاحظة: الملف ده مفيهوش pygame
+
+import os
+import sqlite3
+from collections import OrderedDict
+
+from .board import decode_state, encode_state
+
+DEFAULT_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdb", "solutions.sqlite")
+DEFAULT_MAX_BYTES = 16 << 20
+ENTRY_OVERHEAD = 200  # تقدير بايتات المفتاح + عقدة الـ OrderedDict لكل عنصر
+# المحركات اللي مسارها أقصر مسار (كل الهيوريستيكس عندنا admissible)؛ ara_star بيرجع "solved" بس
+# لما يثبت إن الحل أمثل، والحل الـ best effort مش بيتخزن (الكاش بيخزن "solved" بس)
+OPTIMAL = ("a_star", "ida_star", "table", "bidirectional_bfs", "mm", "ara_star", "hda_star",
+           "parallel_ida_star")
+
+_DELTA = {"U": (-1, 0), "D": (1, 0), "L": (0, -1), "R": (0, 1)}
+_LETTER = {d: k for k, d in _DELTA.items()}
+
+# ----------------------------
+# التماثلات والشكل الـ canonical
+# ----------------------------
+def _transforms(size):
+    """الـ 8 تماثلات للمربع كـ permutations على الخانات: cells[i] = مكان الخانة i بعد التحويل"""
+    last = size - 1
+    maps = (
+        lambda r, c: (r, c), lambda r, c: (c, r),
+        lambda r, c: (r, last - c), lambda r, c: (last - r, c),
+        lambda r, c: (last - r, last - c), lambda r, c: (last - c, last - r),
+        lambda r, c: (c, last - r), lambda r, c: (last - c, r),
+    )
+    out = []
+    for f in maps:
+        cells = []
+        for i in range(size * size):
+            r, c = f(*divmod(i, size))
+            cells.append(r * size + c)
+        out.append(tuple(cells))
+    return out
+
+_SYMMETRIES = {}
+
+def symmetries(goal, size):
+    """
+    التماثلات اللي بتحافظ على الهدف: list من (cells, relabel).
+    cells: permutation للخانات بتسيب فراغ الهدف مكانه، relabel[t] = البلاطة اللي في الهدف مكان صورة t
+    (فالهدف بيتحول لنفسه، والجيران بيفضلوا جيران). الأصل دايمًا أول عنصر.
+    """
+    goal = decode_state(goal, size)
+    key = (goal, size)
+    if key not in _SYMMETRIES:
+        pos = {t: i for i, t in enumerate(goal)}
+        blank = pos[0]
+        syms = []
+        for cells in _transforms(size):
+            if cells[blank] != blank:
+                continue
+            syms.append((cells, tuple(goal[cells[pos[t]]] for t in range(size * size))))
+        _SYMMETRIES[key] = syms
+    return _SYMMETRIES[key]
+
+def transform_state(state, cells, relabel):
+    out = [0] * len(state)
+    for i, t in enumerate(state):
+        out[cells[i]] = relabel[t]
+    return tuple(out)
+
+def canonical(state, goal, size):
+    """-> (أصغر كود بين صور الحالة، التماثل اللي اداه (cells, relabel))"""
+    state = decode_state(state, size)
+    best = None
+    for sym in symmetries(goal, size):
+        code = encode_state(transform_state(state, *sym), size)
+        if best is None or code < best[0]:
+            best = (code, sym)
+    return best
+
+# ----------------------------
+# مسار <-> نص حركات
+# ----------------------------
+def path_to_moves(path, size, cells=None):
+    """حرف لكل خطوة حسب حركة الفراغ؛ cells (اختياري) بيحول الخانات لإطار تاني الأول"""
+    blanks = [p.index(0) for p in path]
+    if cells is not None:
+        blanks = [cells[b] for b in blanks]
+    letters = []
+    for a, b in zip(blanks, blanks[1:]):
+        (ra, ca), (rb, cb) = divmod(a, size), divmod(b, size)
+        letters.append(_LETTER[(rb - ra, cb - ca)])
+    return "".join(letters)
+
+def moves_to_path(start, moves, size, cells=None):
+    """
+    بيعيد بناء المسار من البداية. moves مكتوبة في إطار cells (لو متبعتة)،
+    فكل حركة بتتحسب على صورة الفراغ وبعدين بترجع للخانة الأصلية.
+    """
+    state = list(decode_state(start, size))
+    inverse = None
+    if cells is not None:
+        inverse = [0] * len(cells)
+        for i, c in enumerate(cells):
+            inverse[c] = i
+    blank = state.index(0)
+    pos = blank if cells is None else cells[blank]
+    path = [tuple(state)]
+    for letter in moves:
+        dr, dc = _DELTA[letter]
+        r, c = divmod(pos, size)
+        pos = (r + dr) * size + (c + dc)
+        target = pos if inverse is None else inverse[pos]
+        state[blank], state[target] = state[target], 0
+        blank = target
+        path.append(tuple(state))
+    return path
+
+# ----------------------------
+# الكاش
+# ----------------------------
+class SolutionCache:
+    """
+    cache = SolutionCache(path=DEFAULT_DB)   (path=None: في الذاكرة بس)
+    path, nodes, reason = cache.solve("a_star", start, goal, size, heuristic="pdb", ...)
+    - get(start, goal, size, optimal=False) -> مسار أو None
+    - put(start, goal, size, path, optimal)
+    - طلب من محرك optimal (OPTIMAL) بيتخدم بس من حل متعلم إنه optimal؛
+      غير كده أي حل متخزن ينفع (وأقصر من اللي المحرك كان هيلاقيه غالبًا)
+    """
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._lru = OrderedDict()   # key -> (moves, optimal)
+        self._bytes = 0
+        self.hits = self.misses = 0
+        self.path = path
+        self._db = None
+        if path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            # timeout: عملية تانية ممكن تكون بتكتب؛ WAL بيخلي القراية ما تستناش الكتابة
+            # check_same_thread=False: الواجهة بتفتح الكاش وSolveWorker بيستخدمه (worker واحد في المرة)
+            self._db = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS solutions "
+                             "(key TEXT PRIMARY KEY, moves TEXT NOT NULL, optimal INTEGER NOT NULL)")
+
+    def __len__(self):
+        return len(self._lru)
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    @staticmethod
+    def _key(code, goal, size):
+        return f"{size}:{encode_state(goal, size):x}:{code:x}"
+
+    def _remember(self, key, moves, optimal):
+        old = self._lru.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old[0]) + ENTRY_OVERHEAD
+        self._lru[key] = (moves, optimal)
+        self._bytes += len(moves) + ENTRY_OVERHEAD
+        while self._bytes > self.max_bytes and len(self._lru) > 1:
+            _, (old_moves, _) = self._lru.popitem(last=False)
+            self._bytes -= len(old_moves) + ENTRY_OVERHEAD
+
+    def _lookup(self, key):
+        entry = self._lru.get(key)
+        if entry is not None:
+            self._lru.move_to_end(key)
+            return entry
+        if self._db is not None:
+            row = self._db.execute("SELECT moves, optimal FROM solutions WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                entry = (row[0], bool(row[1]))
+                self._remember(key, *entry)
+        return entry
+
+    def get(self, start, goal, size, optimal=False):
+        code, (cells, _) = canonical(start, goal, size)
+        entry = self._lookup(self._key(code, goal, size))
+        if entry is None or (optimal and not entry[1]):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return moves_to_path(start, entry[0], size, cells)
+
+    def put(self, start, goal, size, path, optimal=False):
+        """بيخزن الحل لو مفيش أحسن منه: optimal بيغلب، وبعده الأقصر"""
+        code, (cells, _) = canonical(start, goal, size)
+        key = self._key(code, goal, size)
+        moves = path_to_moves(path, size, cells)
+        old = self._lookup(key)
+        if old is not None and (old[1], -len(old[0])) >= (optimal, -len(moves)):
+            return
+        self._remember(key, moves, optimal)
+        if self._db is not None:
+            self._db.execute("INSERT OR REPLACE INTO solutions (key, moves, optimal) VALUES (?, ?, ?)",
+                             (key, moves, int(optimal)))
+
+    def solve(self, algo, start, goal, size, **kwargs):
+        """زي ENGINES[algo](start, goal, size, **kwargs) بس بيبص في الكاش الأول ويخزن الحل بعد البحث"""
+        from . import ENGINES
+
+        optimal = algo in OPTIMAL
+        path = self.get(start, goal, size, optimal=optimal)
+        if path is not None:
+            stats = kwargs.get("stats")
+            if stats is not None:
+                stats.cache_hit = True
+            return path, 0, "solved"
+        path, nodes, reason = ENGINES[algo](start, goal, size, **kwargs)
+        if reason == "solved" and path is not None:
+            self.put(start, goal, size, path, optimal=optimal)
+        return path, nodes, reason
@@ -0,0 +1,194 @@
+# npuzzle/eight_puzzle.py
+# جدول المسافة الدقيقة لكل حالات الـ 3x3 (8-puzzle)
+# - فيه 181,440 حالة قابلة للحل بس، فبنحسب المسافة للهدف لكل واحدة بـ BFS مرة واحدة
+# - الجدول byte لكل تبديلة (permutation) متفهرس بالـ rank بتاعها من ranking.py (9! = 362,880 byte)
+#   والحالات اللي مش قابلة للحل قيمتها 255
+# - الحل الأمثل = نمشي greedy على الجار اللي مسافته أقل بواحد (من غير أي بحث)
+# - الجدول نفسه هيوريستيك مثالي (perfect) لأي محرك بيحل 3x3
+# بناء الملف من سطر الأوامر: python -m npuzzle.eight_puzzle
+# ملاحظة: الملف ده مفيهوش pygame
+
+import argparse
+import mmap
+import os
+import sys
+import time
+
+from .ranking import rank as perm_rank
+
+MAGIC = b"N8TB2\n"
+SIZE = 3
+CELLS = SIZE * SIZE
+UNREACHABLE = 255
+BITS = 4  # نفس تمثيل board.encode_state لـ 3x3
+MASK = (1 << BITS) - 1
+
+TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdb")
+DEFAULT_PATH = os.path.join(TABLE_DIR, "3x3-exact.tbl")
+
+_FACT = [1]
+for _i in range(1, CELLS + 1):
+    _FACT.append(_FACT[-1] * _i)
+
+_NEIGHBORS = []
+for _idx in range(CELLS):
+    _r, _c = divmod(_idx, SIZE)
+    _NEIGHBORS.append(tuple(r * SIZE + c for r, c in ((_r-1,_c),(_r+1,_c),(_r,_c-1),(_r,_c+1))
+                            if 0 <= r < SIZE and 0 <= c < SIZE))
+_NEIGHBORS = tuple(_NEIGHBORS)
+
+def default_goal():
+    return tuple(list(range(1, CELLS)) + [0])
+
+def default_path(goal=None):
+    """ملف الجدول للهدف ده: الهدف الافتراضي DEFAULT_PATH، وأي هدف تاني ترتيبه في اسم الملف"""
+    goal = tuple(goal or default_goal())
+    if goal == default_goal():
+        return DEFAULT_PATH
+    return os.path.join(TABLE_DIR, f"3x3-exact-{''.join(str(t) for t in goal)}.tbl")
+
+def _as_tuple(state):
+    """tuple أو int مضغوط (4 بت لكل خانة) -> tuple"""
+    if isinstance(state, int):
+        return tuple((state >> (BITS * i)) & MASK for i in range(CELLS))
+    return tuple(state)
+
+# ----------------------------
+# البناء: BFS من الهدف على كل الحالات القابلة للحل
+# ----------------------------
+def build_table(goal=None, progress=None):
+    goal = tuple(goal or default_goal())
+    table = bytearray([UNREACHABLE]) * _FACT[CELLS]
+    table[perm_rank(goal)] = 0
+    frontier = [goal]
+    depth = 0
+    done = 1
+    t0 = time.time()
+    while frontier:
+        depth += 1
+        nxt = []
+        for s in frontier:
+            b = s.index(0)
+            for t in _NEIGHBORS[b]:
+                l = list(s)
+                l[b], l[t] = l[t], 0
+                r = perm_rank(l)
+                if table[r] == UNREACHABLE:
+                    table[r] = depth
+                    nxt.append(tuple(l))
+        done += len(nxt)
+        if progress and nxt:
+            progress(depth, done, time.time() - t0)
+        frontier = nxt
+    return table
+
+def save_table(table, goal=None, path=None):
+    goal = tuple(goal or default_goal())
+    path = path or default_path(goal)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(bytes(goal))
+        f.write(table)
+    os.replace(tmp, path)
+    return path
+
+# ----------------------------
+# الجدول كهيوريستيك وكـ solver
+# ----------------------------
+class ExactTable:
+    """
+    جدول المسافات الدقيقة (مفتوح بـ mmap).
+    - t(state): المسافة الدقيقة للهدف (255 لو الحالة مش قابلة للحل)
+    - t.update(child, h, tile, src, dst): نفس الحاجة على child (نفس واجهة هيوريستيكس heuristics.py)
+    - t.solve(start): المسار الأمثل كقائمة tuples من البداية للهدف
+    """
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(MAGIC)] != MAGIC or len(self._mm) != len(MAGIC) + CELLS + _FACT[CELLS]:
+            raise ValueError(f"{path} is not a 3x3 distance table")
+        self.size = SIZE
+        self.goal = tuple(self._mm[len(MAGIC):len(MAGIC) + CELLS])
+        self.table = memoryview(self._mm)[len(MAGIC) + CELLS:]
+
+    def __call__(self, state):
+        return self.table[perm_rank(_as_tuple(state))]
+
+    def update(self, child, h, tile, src, dst):
+        return self(child)
+
+    def solve(self, start):
+        """
+        بنمشي من البداية على أي جار مسافته أقل بواحد — كل خطوة بتقرب خطوة فالمسار أمثل.
+        ترجع None لو الحالة مش قابلة للحل.
+        """
+        state = list(_as_tuple(start))
+        d = self.table[perm_rank(state)]
+        if d == UNREACHABLE:
+            return None
+        path = [tuple(state)]
+        b = state.index(0)
+        while d:
+            for t in _NEIGHBORS[b]:
+                state[b], state[t] = state[t], 0
+                if self.table[perm_rank(state)] == d - 1:
+                    b = t
+                    d -= 1
+                    break
+                state[t], state[b] = state[b], 0
+            path.append(tuple(state))
+        return path
+
+    def close(self):
+        self.table.release()
+        self._mm.close()
+
+_LOADED = {}
+
+def load(path=None, goal=None, build=True):
+    """
+    تفتح الجدول (مرة واحدة لكل مسار). لو الملف مش موجود و build=True بنبنيه ونحفظه
+    (البناء بياخد ثواني قليلة لـ 3x3 فمفيش داعي نطلب من المستخدم يبنيه يدوي).
+    path: افتراضيًا default_path(goal)، فكل هدف ليه ملفه.
+    """
+    goal = tuple(goal or default_goal())
+    path = path or default_path(goal)
+    tbl = _LOADED.get(path)
+    if tbl is None:
+        if not os.path.exists(path):
+            if not build:
+                raise FileNotFoundError(path)
+            save_table(build_table(goal), goal, path)
+        try:
+            tbl = ExactTable(path)
+        except ValueError:
+            # ملف قديم (نسخة فهرسة مختلفة) — نبنيه من جديد
+            if not build:
+                raise
+            save_table(build_table(goal), goal, path)
+            tbl = ExactTable(path)
+        _LOADED[path] = tbl
+    if tbl.goal != goal:
+        raise ValueError(f"{path} was built for goal {tbl.goal}, not {goal}")
+    return tbl
+
+# ----------------------------
+# نقطة البداية: بناء الجدول من سطر الأوامر
+# ----------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the exact 3x3 distance table.")
+    parser.add_argument("--out", default=DEFAULT_PATH, help=f"output file (default: {DEFAULT_PATH})")
+    args = parser.parse_args(argv)
+
+    def progress(depth, done, elapsed):
+        print(f"depth {depth:3d}  states {done:>8,}  {elapsed:6.1f}s", file=sys.stderr, flush=True)
+
+    t0 = time.time()
+    path = save_table(build_table(progress=progress), path=args.out)
+    print(f"wrote {path} ({os.path.getsize(path):,} bytes) in {time.time() - t0:.1f}s", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
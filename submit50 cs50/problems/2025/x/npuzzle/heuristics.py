@@ -0,0 +1,307 @@
+# npuzzle/heuristics.py
+# الهيوريستيكس: Manhattan / Misplaced (جداول)، Linear Conflict، Walking Distance، PDB، الجدول الدقيق
+# ملاحظة: الملف ده مفيهوش pygame
+
+from .board import decode_state, encode_state, tile_bits
+
+# ----------------------------
+# جداول الهيوريستيك: لكل (بلاطة، خانة) تكلفة جاهزة
+# - manhattan: المسافة من الخانة لمكان البلاطة في الهدف
+# - misplaced: 1 لو البلاطة مش في مكانها، 0 لو في مكانها
+# - البلاطة الفاضية (0) تكلفتها دايمًا 0
+# الجداول بتتحسب مرة واحدة لكل (goal, size, method) وتتخزن في _HEUR_TABLES
+# ----------------------------
+_HEUR_TABLES = {}
+
+# كل أسماء الهيوريستيك اللي get_heuristic بيعرفها (سطر الأوامر بياخد منها choices)
+HEURISTICS = ("manhattan", "misplaced", "linear_conflict", "walking_distance", "pdb", "exact")
+
+def heuristic_table(goal, size, method="manhattan"):
+    """
+    ترجع جدول table بحيث table[tile][cell] = تكلفة وجود tile في الخانة cell.
+    الهيوريستيك الكامل = مجموع table[state[i]][i] على كل الخانات.
+    method: "manhattan" أو "misplaced" بس (ValueError لأي حاجة تانية).
+    """
+    if method not in ("manhattan", "misplaced"):
+        raise ValueError(f"no per-tile table for heuristic {method!r} (choose manhattan or misplaced)")
+    key = (tuple(goal), size, method)
+    table = _HEUR_TABLES.get(key)
+    if table is not None:
+        return table
+    n = size * size
+    pos = {v: i for i, v in enumerate(goal)}
+    rows = [[0] * n for _ in range(n)]
+    for tile in range(1, n):
+        gr, gc = divmod(pos[tile], size)
+        for cell in range(n):
+            r, c = divmod(cell, size)
+            if method == "manhattan":
+                rows[tile][cell] = abs(r - gr) + abs(c - gc)
+            elif method == "misplaced":
+                rows[tile][cell] = 0 if cell == pos[tile] else 1
+    table = tuple(tuple(row) for row in rows)
+    _HEUR_TABLES[key] = table
+    return table
+
+# ----------------------------
+# Linear Conflict: Manhattan + 2 × (أقل عدد بلاطات لازم تخرج من كل صف/عمود علشان الترتيب يتصلح)
+# - في كل صف: البلاطات اللي صفها في الهدف هو نفس الصف، لو ترتيب أعمدتها مش تصاعدي فيه تعارض
+# - عدد اللي لازم يخرج = عددهم - أطول تسلسل تصاعدي (LIS) — ده اللي بيخليها admissible
+# - التحديث بعد حركة: حركة رأسية بتغير صفين بس، وحركة أفقية بتغير عمودين بس
+# ----------------------------
+def _conflict_penalty(seq):
+    """seq: أماكن الهدف للبلاطات على الخط بالترتيب → عددها - طول أطول تسلسل تصاعدي"""
+    tails = []
+    for x in seq:
+        lo, hi = 0, len(tails)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if tails[mid] < x:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(tails):
+            tails.append(x)
+        else:
+            tails[lo] = x
+    return len(seq) - len(tails)
+
+class LinearConflict:
+    """
+    هيوريستيك Linear Conflict على الحالة المضغوطة.
+    - lc(state): القيمة الكاملة
+    - lc.update(child, h, tile, src, dst): القيمة بعد ما tile اتحركت من src لـ dst
+    """
+    def __init__(self, goal, size):
+        self.size = size
+        self.md = heuristic_table(goal, size, "manhattan")
+        self.bits = tile_bits(size)
+        self.mask = (1 << self.bits) - 1
+        pos = {v: i for i, v in enumerate(goal)}
+        self.goal_row = [0] * (size * size)
+        self.goal_col = [0] * (size * size)
+        for tile in range(1, size * size):
+            self.goal_row[tile], self.goal_col[tile] = divmod(pos[tile], size)
+        self._row_memo = {}
+        self._col_memo = {}
+
+    def _row(self, code, r):
+        """penalty صف r: الصف في الـ int المضغوط متتالي، فبنقصه بـ shift واحد ونحفظ النتيجة"""
+        size, bits = self.size, self.bits
+        chunk = (code >> (bits * size * r)) & ((1 << (bits * size)) - 1)
+        key = (r, chunk)
+        p = self._row_memo.get(key)
+        if p is None:
+            seq = []
+            for c in range(size):
+                tile = (chunk >> (bits * c)) & self.mask
+                if tile and self.goal_row[tile] == r:
+                    seq.append(self.goal_col[tile])
+            p = _conflict_penalty(seq)
+            self._row_memo[key] = p
+        return p
+
+    def _col(self, code, c):
+        size, bits, mask = self.size, self.bits, self.mask
+        tiles = tuple((code >> (bits * (r * size + c))) & mask for r in range(size))
+        key = (c, tiles)
+        p = self._col_memo.get(key)
+        if p is None:
+            p = _conflict_penalty([self.goal_row[t] for t in tiles if t and self.goal_col[t] == c])
+            self._col_memo[key] = p
+        return p
+
+    def __call__(self, code):
+        code = encode_state(code, self.size)
+        md = self.md
+        h = 0
+        for cell in range(self.size * self.size):
+            h += md[(code >> (self.bits * cell)) & self.mask][cell]
+        for line in range(self.size):
+            h += 2 * (self._row(code, line) + self._col(code, line))
+        return h
+
+    def update(self, child, h, tile, src, dst):
+        cost = self.md[tile]
+        h += cost[dst] - cost[src]
+        parent = child - (tile << (self.bits * dst)) + (tile << (self.bits * src))
+        size = self.size
+        if src % size == dst % size:
+            # حركة رأسية: ترتيب العمود ما اتغيرش، الصفين بس اللي اتغيروا
+            r1, r2 = src // size, dst // size
+            h += 2 * (self._row(child, r1) + self._row(child, r2) - self._row(parent, r1) - self._row(parent, r2))
+        else:
+            c1, c2 = src % size, dst % size
+            h += 2 * (self._col(child, c1) + self._col(child, c2) - self._col(parent, c1) - self._col(parent, c2))
+        return h
+
+# ----------------------------
+# Walking Distance: لكل اتجاه (صفوف / أعمدة) بنبص على الحالة كمصفوفة عدّ:
+#   M[line][g] = عدد البلاطات في الخط line اللي خطها في الهدف g (+ مكان الفراغ)
+# - جدول صغير بيتحسب بـ BFS من مصفوفة الهدف: أقل عدد حركات رأسية (أو أفقية) للوصول
+# - WD = جدول الصفوف + جدول الأعمدة (كل حركة بتغير اتجاه واحد بس فهي admissible)
+# - المصفوفة بتتخزن كـ int: 3 بت لكل (line, g) والفراغ في الآخر، وكل صف في الحالة
+#   المضغوطة بيدي مساهمته في المصفوفتين مرة واحدة (memo) فالقيمة بتتحسب بـ O(size)
+# ----------------------------
+_WD_TABLES = {}
+# جدول 4x4 فيه 24,964 مصفوفة بس، لكن جدول 5x5 أكبر بكتير من إنه يتبني في dict بـ Python
+WD_MAX_SIZE = 4
+
+def walking_distance_table(size, goal_lines, blank_line):
+    """
+    BFS على مصفوفات العدّ. goal_lines[tile] = خط البلاطة في الهدف، blank_line = خط الفراغ في الهدف.
+    ترجع dict: مفتاح المصفوفة -> أقل عدد حركات.
+    """
+    key = (size, tuple(goal_lines), blank_line)
+    table = _WD_TABLES.get(key)
+    if table is not None:
+        return table
+    blank_off = 3 * size * size
+    start = blank_line << blank_off
+    for tile in range(1, size * size):
+        # في الهدف كل بلاطة في خطها
+        start += 1 << (3 * (goal_lines[tile] * size + goal_lines[tile]))
+    table = {start: 0}
+    frontier = [start]
+    depth = 0
+    while frontier:
+        depth += 1
+        nxt = []
+        for k in frontier:
+            b = k >> blank_off
+            for nb in (b - 1, b + 1):
+                if not 0 <= nb < size:
+                    continue
+                for g in range(size):
+                    off = 3 * (nb * size + g)
+                    if (k >> off) & 7:
+                        # بلاطة من الخط nb (خطها في الهدف g) بتتنقل لخط الفراغ b
+                        nk = k - (1 << off) + (1 << (3 * (b * size + g))) + ((nb - b) << blank_off)
+                        if nk not in table:
+                            table[nk] = depth
+                            nxt.append(nk)
+        frontier = nxt
+    _WD_TABLES[key] = table
+    return table
+
+class WalkingDistance:
+    """
+    هيوريستيك Walking Distance على الحالة المضغوطة.
+    - wd(state): القيمة الكاملة (O(size) بفضل memo لكل صف)
+    - wd.update(child, h, tile, src, dst): بتحسب من child مباشرة (نفس التكلفة)
+    - tables: (vertical, horizontal) جاهزين بدل البناء (جداول منشورة من shared.py)
+    """
+    def __init__(self, goal, size, tables=None):
+        if size > WD_MAX_SIZE:
+            raise ValueError(f"walking distance is only supported up to {WD_MAX_SIZE}x{WD_MAX_SIZE}")
+        self.size = size
+        self.bits = tile_bits(size)
+        self.mask = (1 << self.bits) - 1
+        pos = {v: i for i, v in enumerate(goal)}
+        self.goal_row = [0] * (size * size)
+        self.goal_col = [0] * (size * size)
+        for tile in range(1, size * size):
+            self.goal_row[tile], self.goal_col[tile] = divmod(pos[tile], size)
+        blank_row, blank_col = divmod(pos[0], size)
+        if tables is not None:
+            self.vertical, self.horizontal = tables
+        else:
+            self.vertical = walking_distance_table(size, self.goal_row, blank_row)
+            self.horizontal = walking_distance_table(size, self.goal_col, blank_col)
+        self._memo = {}
+
+    def _parts(self, chunk, r):
+        """مساهمة صف r (محتواه chunk) في مفتاح مصفوفة الصفوف ومصفوفة الأعمدة"""
+        key = (r, chunk)
+        parts = self._memo.get(key)
+        if parts is None:
+            size = self.size
+            blank_off = 3 * size * size
+            v = h = 0
+            for c in range(size):
+                tile = (chunk >> (self.bits * c)) & self.mask
+                if tile:
+                    v += 1 << (3 * (r * size + self.goal_row[tile]))
+                    h += 1 << (3 * (c * size + self.goal_col[tile]))
+                else:
+                    v += r << blank_off
+                    h += c << blank_off
+            parts = (v, h)
+            self._memo[key] = parts
+        return parts
+
+    def __call__(self, code):
+        code = encode_state(code, self.size)
+        size, bits = self.size, self.bits
+        row_bits = bits * size
+        row_mask = (1 << row_bits) - 1
+        kv = kh = 0
+        for r in range(size):
+            v, h = self._parts((code >> (row_bits * r)) & row_mask, r)
+            kv += v
+            kh += h
+        return self.vertical[kv] + self.horizontal[kh]
+
+    def update(self, child, h, tile, src, dst):
+        return self(child)
+
+_HEUR_OBJECTS = {}
+# البحث في الجداول المنشورة (shared.attached_heuristic): shared.install بيسجله في الـ worker بس،
+# فاستيراد الباكدج ما بيحمّلش shared ولا multiprocessing
+_attached_lookup = None
+
+def set_attached_lookup(lookup):
+    global _attached_lookup
+    _attached_lookup = lookup
+
+def get_heuristic(goal, size, method="manhattan"):
+    """
+    ترجع الهيوريستيك اللي المحركات بتستخدمه:
+    - "manhattan" / "misplaced": جدول (tile × cell) بيتحدث تدريجيًا جوه المحرك
+    - "linear_conflict" / "walking_distance" / "pdb": كائن بيتنادى على الحالة المضغوطة
+      وفيه update(child, h, tile, src, dst) للتحديث بعد حركة واحدة
+    - "exact": جدول المسافات الدقيقة لـ 3x3 (eight_puzzle.py) — هيوريستيك مثالي
+    أي اسم تاني ValueError (بدل جدول أصفار يخلي البحث من غير هيوريستيك من غير ما حد ياخد باله).
+    """
+    if method not in HEURISTICS:
+        raise ValueError(f"unknown heuristic {method!r} (choose from {', '.join(HEURISTICS)})")
+    goal = decode_state(goal, size)
+    # pattern_db / eight_puzzle بيتستوردوا هنا بس لما حد يطلبهم، فاستيراد الباكدج يفضل خفيف
+    # (وكمان python -m npuzzle.pattern_db ما يلاقيش الموديول محمّل قبل ما يشتغل)
+    if method == "pdb":
+        from . import pattern_db
+        return pattern_db.load_default(size, goal)
+    if method == "exact":
+        if size != 3:
+            raise ValueError("the exact distance table only covers 3x3 boards")
+        from . import eight_puzzle
+        return eight_puzzle.load(goal=goal)
+    # worker في pool: الجدول ممكن يكون منشور من العملية الرئيسية (shared.py) فمش بنبنيه تاني
+    if _attached_lookup is not None:
+        obj = _attached_lookup(goal, size, method)
+        if obj is not None:
+            return obj
+    if method in ("linear_conflict", "walking_distance"):
+        key = (goal, size, method)
+        obj = _HEUR_OBJECTS.get(key)
+        if obj is None:
+            cls = LinearConflict if method == "linear_conflict" else WalkingDistance
+            obj = cls(goal, size)
+            _HEUR_OBJECTS[key] = obj
+        return obj
+    return heuristic_table(goal, size, method)
+
+# ----------------------------
+# دالة مساعدة لحساب القيم الهيوريستية
+# ----------------------------
+def heuristic_val(state, goal, size, method="manhattan"):
+    """
+    ترجع قيمة الـ heuristic للحالة state بالنسبة للـ goal.
+    method: "manhattan" أو "misplaced" أو "linear_conflict" أو "walking_distance" أو "pdb"
+    أو "exact" (3x3 بس) — أي قيمة تانية ValueError
+    state و goal ممكن يكونوا tuple أو int مضغوط.
+    """
+    table = get_heuristic(goal, size, method)
+    if not isinstance(table, tuple):
+        return table(encode_state(state, size))
+    return sum(table[v][i] for i, v in enumerate(decode_state(state, size)))
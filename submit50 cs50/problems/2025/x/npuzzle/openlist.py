@@ -0,0 +1,81 @@
+# npuzzle/openlist.py
+# Open list على شكل buckets بدل heapq
+# - في البازل كل حركة تكلفتها 1 فـ f (أو h في Best-First) رقم صحيح صغير ومحدود
+# - buckets[f][g] = stack (LIFO): الـ push والـ pop من غير أي مقارنة بين tuples
+# - الـ pop بياخد أقل f، وجوه نفس f أعلى g (أقرب للهدف غالبًا فالبحث بيخلص أسرع)
+# - العنصر نفسه int واحد (الحالة + مكان الفراغ + مكان فراغ الأب) بدل tuple من 5 قيم
+# ملاحظة: الملف ده مفيهوش pygame
+
+# ----------------------------
+# ضغط (state, blank, prev_blank) في int واحد: 16 بت لكل مكان. prev_blank + 1 ممكن توصل لعدد الخانات
+# (الفراغ في آخر خانة)، فـ 8 بت كانت بتكفي لحد 15x15 بس (16x16 = 256 خانة بتطفح في خانة blank)
+# ----------------------------
+def pack_entry(state, blank, prev_blank):
+    return (state << 32) | (blank << 16) | (prev_blank + 1)
+
+def unpack_entry(item):
+    """-> (state, blank, prev_blank)"""
+    return item >> 32, (item >> 16) & 0xffff, (item & 0xffff) - 1
+
+class BucketQueue:
+    """
+    q.push(key, g, item) / key, g, item = q.pop() / len(q) / q.min_key()
+    - key: f في A* أو h في Best-First (int >= 0)
+    - g: للترجيح بين العناصر اللي ليها نفس key (الأعلى الأول)؛ Best-First بيبعت 0
+    - push بـ key أقل من أقل key حالي مسموح (هيوريستيك مش consistent أو Best-First)
+    """
+    def __init__(self):
+        self._buckets = []   # _buckets[key][g] = list
+        self._counts = []    # عدد العناصر في كل key
+        self._top_g = []     # أعلى g ممكن يكون فيه عناصر لكل key
+        self._min_key = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, key, g, item):
+        buckets = self._buckets
+        while key >= len(buckets):
+            buckets.append([])
+            self._counts.append(0)
+            self._top_g.append(-1)
+        row = buckets[key]
+        while g >= len(row):
+            row.append([])
+        row[g].append(item)
+        self._counts[key] += 1
+        if g > self._top_g[key]:
+            self._top_g[key] = g
+        if key < self._min_key:
+            self._min_key = key
+        self._size += 1
+
+    def min_key(self):
+        """أقل key فيه عناصر من غير سحب (IndexError لو فاضية)"""
+        if not self._size:
+            raise IndexError("min_key of an empty bucket queue")
+        counts = self._counts
+        key = self._min_key
+        while not counts[key]:
+            key += 1
+        self._min_key = key
+        return key
+
+    def pop(self):
+        """ترجع (key, g, item) بأقل key وأعلى g — IndexError لو فاضية زي heapq"""
+        if not self._size:
+            raise IndexError("pop from an empty bucket queue")
+        counts = self._counts
+        key = self._min_key
+        while not counts[key]:
+            key += 1
+        self._min_key = key
+        row = self._buckets[key]
+        g = self._top_g[key]
+        while not row[g]:
+            g -= 1
+        self._top_g[key] = g
+        counts[key] -= 1
+        self._size -= 1
+        return key, g, row[g].pop()
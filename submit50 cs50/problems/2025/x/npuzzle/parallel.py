@@ -0,0 +1,490 @@
+# npuzzle/parallel.py
+# بحث على كذا عملية لحل واحد صعب (مش كذا لوح زي batch)
+# - hda_star: HDA* (Kishimoto et al. 2009, hash-distributed A*): كل حالة ليها عملية "مالكة" بـ hash
+#   الحالة، وكل عملية عندها open و best_g خاصين بيها بس. الجيران اللي مش بتوعها بتتجمع في batches
+#   وتتبعت لـ queue المالك؛ مفيش أي حاجة مشتركة بين العمليات غير الـ queues
+# - أول ما أي عملية تلاقي الهدف بـ g أحسن بتبلغ، والعملية الرئيسية بتوزع U (أحسن طول) على الكل،
+#   وكل حالة f بتاعها >= U بتترمي
+# - الوقوف (termination detection): العملية الرئيسية بتبعت probe لكل العمليات في موجات؛ كل عملية بترد
+#   (فاضية ولا لأ، رسايل بعتتها، رسايل استلمتها). لو موجتين ورا بعض الكل فاضي والمجموعين متساويين
+#   ومااتغيروش (four-counter method، Mattern 1987) يبقى مفيش رسايل في الطريق ومفيش حالة f < U
+#   لسه ما اتوسعتش -> U أمثل (الهيوريستيك consistent)
+# - المسار: parent كل حالة عند مالكها، فالرئيسية بتسأل المالكين واحد واحد من الهدف لورا
+# - parallel_ida_star: IDA* متوازي بتقسيم الشجرة: البداية بتتوسع BFS لحد ما يبقى فيه split حالة
+#   (كام ألف)، وكل threshold الشجر اللي تحتهم بيتحط في queue واحدة والعمليات بتسحب منها أول ما تفضى
+#   (الأكبر الأول: f أقل = مساحة أكتر تحت الـ bound)، فالعملية اللي خلصت بتاخد شغل اللي لسه مشغولة.
+#   أول حل عند الـ bound الحالي أمثل، فبنوقف الكل بـ Event
+# - الاتنين بينشروا جدول الهيوريستيك مرة واحدة (shared.py) والعمليات بتربط عليه بدل ما تبنيه
+# ملاحظة: الملف ده مفيهوش pygame
+
+import multiprocessing
+import os
+import queue
+import time
+
+from .board import (MAX_STEPS, decode_state, encode_state, expand, find_blank, move_table, reconstruct_path,
+                    tile_bits)
+from .heuristics import get_heuristic, heuristic_val
+from .openlist import BucketQueue
+from .search import ABORTED, FOUND, _expand_counted
+from .shared import TableRegistry, install
+from .stats import SearchStats, timed_heuristic
+
+# جيران لكل رسالة، وبرضه عدد العقد بين كل مرتين العملية تبص في الـ inbox بتاعها. أكبر = رسايل أقل،
+# بس العمليات التانية بتستنى أكتر وكل عملية بتوسع حالات f بتاعها أعلى من اللازم (4x4: 64 -> +1-7% عقد عن A*)
+DEFAULT_BATCH = 64
+WAVE_EVERY = 0.02      # ثواني بين موجات الـ probe وفيه شغل
+# العدادات اللي بتتجمع من كل worker في الآخر
+_SUMMED = ("expansions", "generated", "stale_pops", "max_open", "heuristic_time", "neighbors_time")
+
+def owner(state, workers):
+    """العملية المالكة للحالة: hash(int) بيطوي كل البتات، والضرب بيفرّقها (Fibonacci hashing)"""
+    return (((hash(state) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 32) % workers
+
+def _check_not_daemon(name):
+    if multiprocessing.current_process().daemon:
+        raise ValueError(f"{name} starts its own worker processes and cannot run inside a daemonic "
+                         "pool worker")
+
+# ----------------------------
+# HDA*: عملية واحدة
+# ----------------------------
+def _hda_worker(wid, workers, goal, size, heuristic, inboxes, results, batch, with_stats, tables):
+    """
+    رسايل الـ inbox: ("nodes", [(state, g, h, blank, parent, parent_blank), ...]) / ("bound", U) /
+    ("probe", wave) / ("parent", state) / ("stop",)
+    tables: registry.handles من العملية الرئيسية (جداول الهيوريستيك المنشورة، shared.py)
+    """
+    try:
+        install(tables)
+        stats = SearchStats() if with_stats else None
+        table = timed_heuristic(get_heuristic(goal, size, heuristic), stats)
+        goal = encode_state(goal, size)
+        inbox = inboxes[wid]
+        pq = BucketQueue()
+        best_g = {}
+        parent = {}
+        out = [[] for _ in range(workers)]
+        sent = received = nodes = 0
+        bound = float('inf')
+
+        def insert(state, g, h, blank, par, par_blank):
+            nonlocal bound
+            if g + h >= bound or g >= best_g.get(state, float('inf')):
+                return
+            best_g[state] = g
+            parent[state] = par
+            if state == goal:
+                bound = g
+                results.put(("goal", wid, g))
+                return
+            pq.push(g + h, g, (state << 32) | (blank << 16) | (par_blank + 1))
+
+        def flush(dest):
+            nonlocal sent
+            inboxes[dest].put(("nodes", out[dest]))
+            out[dest] = []
+            sent += 1
+
+        def busy():
+            return pq and pq.min_key() < bound
+
+        while True:
+            # الـ inbox الأول: لو مفيش شغل بنستنى عليه، وغير كده بناخد اللي وصل بس
+            while True:
+                try:
+                    msg = inbox.get() if not busy() else inbox.get_nowait()
+                except queue.Empty:
+                    break
+                kind = msg[0]
+                if kind == "nodes":
+                    received += 1
+                    for node in msg[1]:
+                        insert(*node)
+                elif kind == "bound":
+                    bound = min(bound, msg[1])
+                elif kind == "probe":
+                    results.put(("status", msg[1], wid, not busy(), sent, received, nodes,
+                                 pq.min_key() if pq else None, len(pq)))
+                elif kind == "parent":
+                    results.put(("parent", msg[1], parent[msg[1]]))
+                elif kind == "stop":
+                    counters = None
+                    if stats:
+                        counters = {name: getattr(stats, name) for name in _SUMMED}
+                    results.put(("done", wid, nodes, len(best_g), counters))
+                    for q in inboxes:
+                        q.cancel_join_thread()
+                    return
+            # batch عقد وبعدين كل الجيران اللي اتجمعت تتبعت
+            for _ in range(batch):
+                if not busy():
+                    break
+                f, g, item = pq.pop()
+                state, blank, prev_blank = item >> 32, (item >> 16) & 0xffff, (item & 0xffff) - 1
+                if best_g[state] < g:
+                    if stats:
+                        stats.stale_pops += 1
+                    continue
+                nodes += 1
+                if stats:
+                    children = _expand_counted(stats, state, size, f - g, table, blank, prev_blank)
+                else:
+                    children = expand(state, size, f - g, table, blank, prev_blank)
+                new_g = g + 1
+                for n, nh, n_blank in children:
+                    if new_g + nh >= bound:
+                        continue
+                    dest = owner(n, workers)
+                    if dest == wid:
+                        insert(n, new_g, nh, n_blank, state, blank)
+                    else:
+                        out[dest].append((n, new_g, nh, n_blank, state, blank))
+                        if len(out[dest]) >= batch:
+                            flush(dest)
+                if stats and len(pq) > stats.max_open:
+                    stats.max_open = len(pq)
+            for dest in range(workers):
+                if out[dest]:
+                    flush(dest)
+    except Exception as e:  # أي غلط جوه الـ worker يوصل للرئيسية بدل ما تفضل مستنية موجات
+        results.put(("error", wid, f"{type(e).__name__}: {e}"))
+
+# ----------------------------
+# HDA*: العملية الرئيسية
+# ----------------------------
+def hda_star(start, goal, size, heuristic="manhattan", time_limit=None, max_steps=MAX_STEPS, progress=None,
+             stats=None, workers=None, batch=DEFAULT_BATCH):
+    """
+    نفس عقد (path, nodes, reason)؛ الحل أمثل زي A*.
+    workers: عدد العمليات (افتراضيًا كل الـ cores). nodes = مجموع العقد المتوسعة في كل العمليات.
+    max_steps و progress بيتشيكوا مع كل موجة probe (كل ~WAVE_EVERY ثانية)، فالعقد ممكن تعدي الحد
+    بشوية. progress: bound = أقل f في كل الـ open lists، frontier = مجموع أحجامها.
+    stats (لو متبعتة): العدادات متجمعة من كل العمليات (الأوقات مجموع CPU مش وقت فعلي)،
+    و stats.worker_nodes = العقد في كل عملية.
+    """
+    start_time = time.time()
+    _check_not_daemon("hda_star")
+    workers = max(1, workers or os.cpu_count() or 1)
+    h0 = heuristic_val(start, goal, size, heuristic)
+    goal_tuple = decode_state(goal, size)
+    start, goal = encode_state(start, size), encode_state(goal, size)
+    if start == goal:
+        if stats:
+            stats.finish(0, 1, start_time)
+        return [decode_state(start, size)], 0, "solved"
+    registry = TableRegistry()
+    registry.share_heuristic(goal_tuple, size, heuristic)
+    inboxes = [multiprocessing.Queue() for _ in range(workers)]
+    results = multiprocessing.Queue()
+    procs = [multiprocessing.Process(target=_hda_worker, daemon=True,
+                                     args=(w, workers, goal_tuple, size, heuristic, inboxes, results, batch,
+                                           stats is not None, registry.handles))
+             for w in range(workers)]
+    for p in procs:
+        p.start()
+    inboxes[owner(start, workers)].put(("nodes", [(start, 0, h0, find_blank(start, size), None, -1)]))
+    main_sent = 1
+    best = float('inf')
+    nodes = 0
+    reason = None
+    path = None
+
+    def next_message():
+        msg = results.get(timeout=0.1)
+        if msg[0] == "error":
+            raise RuntimeError(f"hda_star worker {msg[1]} failed: {msg[2]}")
+        return msg
+
+    try:
+        wave = 0
+        previous = None
+        while reason is None:
+            wave += 1
+            for q in inboxes:
+                q.put(("probe", wave))
+            replies = {}
+            while len(replies) < workers and reason is None:
+                if time_limit and (time.time() - start_time) > time_limit:
+                    reason = "time_limit"
+                    break
+                try:
+                    msg = next_message()
+                except queue.Empty:
+                    continue
+                if msg[0] == "goal" and msg[2] < best:
+                    best = msg[2]
+                    for q in inboxes:
+                        q.put(("bound", best))
+                elif msg[0] == "status" and msg[1] == wave:
+                    replies[msg[2]] = msg[3:]
+            if reason is not None:
+                break
+            idle = all(r[0] for r in replies.values())
+            total_sent = main_sent + sum(r[1] for r in replies.values())
+            total_received = sum(r[2] for r in replies.values())
+            nodes = sum(r[3] for r in replies.values())
+            if idle and total_sent == total_received:
+                if previous == (total_sent, total_received):
+                    reason = "solved" if best < float('inf') else "exhausted"
+                    break
+                previous = (total_sent, total_received)
+                continue
+            previous = None
+            if nodes > max_steps:
+                reason = "max_steps"
+                break
+            if progress:
+                mins = [r[4] for r in replies.values() if r[4] is not None]
+                if progress(nodes, min(mins) if mins else None, sum(r[5] for r in replies.values())):
+                    reason = "cancelled"
+                    break
+            time.sleep(WAVE_EVERY)
+        if reason == "solved":
+            path = _collect_path(inboxes, results, goal, size, workers, next_message)
+        return path, nodes, reason
+    finally:
+        _stop_workers(procs, inboxes, results, stats, start_time)
+        registry.close()
+
+def _collect_path(inboxes, results, goal, size, workers, next_message):
+    """المسار من الهدف لورا: كل parent بيتسأل عند مالك الحالة"""
+    path = []
+    state = goal
+    while state is not None:
+        path.append(state)
+        inboxes[owner(state, workers)].put(("parent", state))
+        while True:
+            try:
+                msg = next_message()
+            except queue.Empty:
+                continue
+            if msg[0] == "parent" and msg[1] == state:
+                state = msg[2]
+                break
+    path.reverse()
+    return [decode_state(p, size) for p in path]
+
+def _stop_workers(procs, inboxes, results, stats, start_time):
+    """stop لكل العمليات وتجميع عداداتها؛ اللي ما ردتش في ثانيتين بتتقفل بالعافية"""
+    for q in inboxes:
+        q.put(("stop",))
+    done = {}
+    deadline = time.time() + 2.0
+    while len(done) < len(procs) and time.time() < deadline:
+        try:
+            msg = results.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        if msg[0] == "done":
+            done[msg[1]] = msg[2:]
+    for p in procs:
+        p.join(timeout=0.5)
+        if p.is_alive():
+            p.terminate()
+    for q in inboxes:
+        q.cancel_join_thread()
+    if stats:
+        worker_nodes = [done[w][0] if w in done else 0 for w in range(len(procs))]
+        stats.worker_nodes = worker_nodes
+        for nodes, closed, counters in done.values():
+            for name, value in (counters or {}).items():
+                setattr(stats, name, getattr(stats, name) + value)
+        stats.finish(sum(worker_nodes), sum(d[1] for d in done.values()), start_time)
+
+# ----------------------------
+# Parallel IDA*
+# ----------------------------
+DEFAULT_SPLIT = 2000   # أقل عدد حالات في الـ frontier اللي بيتوزع (شغل كتير صغير = توزيع أعدل)
+COUNT_EVERY = 1024     # كل كام عقدة العملية بتحدّث عدادها المشترك وتبص على stop
+
+def _ida_worker(wid, goal, size, heuristic, tasks, results, counters, stop, tables):
+    """
+    tasks: (index, state, g, h, blank, prev_blank, bound) أو None للخروج.
+    لكل مهمة: ("result", index, المسار من state للهدف أو None، أقل f عدّى الـ bound)
+    counters[wid] = العقد اللي العملية دي وسعتها لحد دلوقتي (بيتحدث كل COUNT_EVERY).
+    tables: registry.handles (زي _hda_worker)
+    """
+    try:
+        install(tables)
+        bits = tile_bits(size)
+        mask = (1 << bits) - 1
+        moves = move_table(size)
+        table = get_heuristic(goal, size, heuristic)
+        additive = isinstance(table, tuple)
+        goal = encode_state(goal, size)
+        nodes = 0
+        path = []
+
+        def search(state, blank, prev_blank, g, h, bound):
+            nonlocal nodes
+            f = g + h
+            if f > bound:
+                return f
+            if state == goal:
+                return FOUND
+            nodes += 1
+            if nodes & (COUNT_EVERY - 1) == 0:
+                counters[wid] = nodes
+                if stop.is_set():
+                    return ABORTED
+            minimum = float('inf')
+            blank_shift = bits * blank
+            for target in moves[blank]:
+                if target == prev_blank:
+                    continue
+                shift = bits * target
+                tile = (state >> shift) & mask
+                n = state - (tile << shift) + (tile << blank_shift)
+                if additive:
+                    cost = table[tile]
+                    nh = h - cost[target] + cost[blank]
+                else:
+                    nh = table.update(n, h, tile, target, blank)
+                path.append(n)
+                t = search(n, target, blank, g + 1, nh, bound)
+                if t == FOUND or t == ABORTED:
+                    return t
+                path.pop()
+                if t < minimum:
+                    minimum = t
+            return minimum
+
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            index, state, g, h, blank, prev_blank, bound = task
+            if stop.is_set():
+                continue
+            path = [state]
+            t = search(state, blank, prev_blank, g, h, bound)
+            counters[wid] = nodes
+            if t != ABORTED:
+                results.put(("result", index, path if t == FOUND else None, t))
+    except Exception as e:
+        results.put(("error", wid, f"{type(e).__name__}: {e}"))
+
+def _split_frontier(start, goal, size, table, h0, split):
+    """
+    BFS من البداية (من غير تكرار) لحد ما الطبقة يبقى فيها split حالة على الأقل.
+    -> (frontier: list من (state, g, h, blank, prev_blank)، parent، عدد العقد، goal لو اتلقى في الـ BFS)
+    الـ BFS بيمشي طبقة طبقة، فلو الهدف ظهر فيه يبقى ده أقصر طريق.
+    """
+    parent = {start: None}
+    layer = [(start, 0, h0, find_blank(start, size), -1)]
+    nodes = 0
+    while layer and len(layer) < split:
+        nxt = []
+        for state, g, h, blank, prev_blank in layer:
+            nodes += 1
+            for n, nh, n_blank in expand(state, size, h, table, blank, prev_blank):
+                if n in parent:
+                    continue
+                parent[n] = state
+                if n == goal:
+                    return [], parent, nodes, n
+                nxt.append((n, g + 1, nh, n_blank, blank))
+        layer = nxt
+    return layer, parent, nodes, None
+
+def parallel_ida_star(start, goal, size, heuristic="manhattan", time_limit=None, max_steps=MAX_STEPS, progress=None,
+                      stats=None, workers=None, split=DEFAULT_SPLIT):
+    """
+    نفس عقد (path, nodes, reason)؛ الحل أمثل زي IDA*.
+    workers: عدد العمليات (افتراضيًا كل الـ cores). nodes = عقد الـ BFS + مجموع عقد كل العمليات.
+    time_limit / max_steps بيتشيكوا مع كل نتيجة (أو كل 0.1 ثانية)، و progress كل 0.1 ثانية،
+    من العدادات المشتركة.
+    progress: bound = الـ threshold الحالي، frontier = المهام اللي لسه ما خلصتش.
+    stats: iterations = عدد الـ thresholds، max_open = عدد الشجر اللي اتوزعت،
+    worker_nodes = العقد في كل عملية (من غير الـ BFS).
+    """
+    start_time = time.time()
+    _check_not_daemon("parallel_ida_star")
+    workers = max(1, workers or os.cpu_count() or 1)
+    table = get_heuristic(goal, size, heuristic)
+    h0 = heuristic_val(start, goal, size, heuristic)
+    goal_tuple = decode_state(goal, size)
+    start, goal = encode_state(start, size), encode_state(goal, size)
+    if start == goal:
+        if stats:
+            stats.finish(0, 0, start_time)
+        return [decode_state(start, size)], 0, "solved"
+    frontier, parent, nodes, found = _split_frontier(start, goal, size, table, h0, split)
+    if found is not None:
+        if stats:
+            stats.finish(nodes, len(parent), start_time)
+        return reconstruct_path(parent, found, size), nodes, "solved"
+    if not frontier:
+        if stats:
+            stats.finish(nodes, len(parent), start_time)
+        return None, nodes, "exhausted"
+    bfs_nodes = nodes
+    # الأكبر الأول: f أقل يعني مساحة أكبر تحت الـ bound، والتعادل بالأعمق (أقرب للهدف)
+    frontier.sort(key=lambda node: (node[1] + node[2], -node[1]))
+    registry = TableRegistry()
+    registry.share_heuristic(goal_tuple, size, heuristic)
+    tasks = multiprocessing.Queue()
+    results = multiprocessing.Queue()
+    stop = multiprocessing.Event()
+    counters = multiprocessing.Array("q", workers, lock=False)
+    procs = [multiprocessing.Process(target=_ida_worker, daemon=True,
+                                     args=(w, goal_tuple, size, heuristic, tasks, results, counters, stop,
+                                           registry.handles))
+             for w in range(workers)]
+    for p in procs:
+        p.start()
+    bound = min(g + h for _, g, h, _, _ in frontier)
+    iterations = 0
+    reported = time.time()
+    try:
+        while True:
+            iterations += 1
+            batch = [i for i, node in enumerate(frontier) if node[1] + node[2] <= bound]
+            next_bound = min((g + h for _, g, h, _, _ in frontier if g + h > bound), default=float('inf'))
+            for i in batch:
+                tasks.put((i,) + frontier[i] + (bound,))
+            pending = len(batch)
+            if stats and len(batch) > stats.max_open:
+                stats.max_open = len(batch)
+            while pending:
+                try:
+                    msg = results.get(timeout=0.1)
+                except queue.Empty:
+                    msg = None
+                nodes = bfs_nodes + sum(counters)
+                if msg is not None:
+                    if msg[0] == "error":
+                        raise RuntimeError(f"parallel_ida_star worker {msg[1]} failed: {msg[2]}")
+                    _, index, sub_path, t = msg
+                    pending -= 1
+                    if sub_path is not None:
+                        prefix = reconstruct_path(parent, frontier[index][0])
+                        return [decode_state(p, size) for p in prefix[:-1] + sub_path], nodes, "solved"
+                    next_bound = min(next_bound, t)
+                if time_limit and (time.time() - start_time) > time_limit:
+                    return None, nodes, "time_limit"
+                if nodes > max_steps:
+                    return None, nodes, "max_steps"
+                if progress and time.time() - reported >= 0.1:
+                    reported = time.time()
+                    if progress(nodes, bound, pending):
+                        return None, nodes, "cancelled"
+            if next_bound == float('inf'):
+                return None, nodes, "exhausted"
+            bound = next_bound
+    finally:
+        stop.set()
+        for _ in procs:
+            tasks.put(None)
+        for p in procs:
+            p.join(timeout=1.0)
+            if p.is_alive():
+                p.terminate()
+        tasks.cancel_join_thread()
+        registry.close()
+        if stats:
+            stats.iterations = iterations
+            stats.worker_nodes = list(counters)
+            stats.expansions = bfs_nodes + sum(counters)
+            stats.finish(stats.expansions, len(parent), start_time)
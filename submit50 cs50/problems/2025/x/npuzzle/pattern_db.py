@@ -0,0 +1,348 @@
+# npuzzle/pattern_db.py
+# قواعد بيانات الأنماط (Additive disjoint pattern databases) للـ N-Puzzle
+# - البلاطات بتتقسم لمجموعات منفصلة (مثلاً 5-5-5 لـ 4x4)
+# - لكل مجموعة بنحسب بـ BFS عكسي من الهدف أقل عدد حركات لبلاطات المجموعة بس
+#   (حركات البلاطات التانية تكلفتها 0) — فمجموع المجموعات admissible
+# - الجداول بتتحفظ في ملف bytes واحد وبتتفتح بـ mmap (من غير نسخ) فالتشغيل سريع
+# بناء ملف من سطر الأوامر: python -m npuzzle.pattern_db --size 4 --partition 5-5-5
+#   (--goal "0 1 2 ... 15" لهدف تاني، زي هدف Korf اللي الفراغ فيه في الأول؛ الهدف بيبقى في اسم الملف)
+# ملاحظة: الملف ده مفيهوش pygame علشان يشتغل على السيرفر من غير شاشة
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import time
+
+from .board import MEMORY_LIMIT
+from .ranking import pattern_space, rank_pattern
+
+MAGIC = b"NPDB2\n"
+UNSEEN = 255
+
+# التقسيمات الافتراضية: أحجام تقدر تتبني بـ Python في دقايق
+# أي تقسيمة تانية مدعومة طالما مصفوفة البحث لأكبر مجموعة (n^(k+1) byte، build_bytes) تحت
+# MEMORY_LIMIT: 6-6-3 على 4x4 (16^7 = 268MB) ماشية، لكن 7-8 (16^9 = 68GB) أو 6 بلاطات على 5x5
+# (25^7 = 6GB) بترجع ValueError قبل البناء
+DEFAULT_PARTITIONS = {
+    3: (4, 4),
+    4: (5, 5, 5),
+    5: (4, 4, 4, 4, 4, 4),
+}
+
+# مكان الملفات الافتراضي: فولدر pdb جنب الملف ده
+PDB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdb")
+
+# ----------------------------
+# دوال مساعدة
+# ----------------------------
+def default_goal(size):
+    """نفس الهدف المستخدم في الواجهة (main.py): 1..n-1 ثم الفراغ في الآخر"""
+    return tuple(list(range(1, size*size)) + [0])
+
+def parse_partition(text):
+    """'6-6-3' -> (6, 6, 3)"""
+    return tuple(int(x) for x in text.split("-"))
+
+def parse_goal(text):
+    """'0 1 2 3 ...' أو '0,1,2,3,...' -> tuple"""
+    return tuple(int(x) for x in text.replace(",", " ").split())
+
+def partition_groups(size, partition):
+    """
+    بتحوّل (5, 5, 5) لمجموعات بلاطات متتالية: (1..5), (6..10), (11..15).
+    لازم مجموع التقسيمة = عدد البلاطات (size*size - 1).
+    """
+    if sum(partition) != size*size - 1:
+        raise ValueError(f"partition {partition} does not cover the {size*size - 1} tiles of a {size}x{size} board")
+    groups = []
+    tile = 1
+    for k in partition:
+        groups.append(tuple(range(tile, tile + k)))
+        tile += k
+    return tuple(groups)
+
+def build_bytes(size, k):
+    """ذاكرة build_group لمجموعة من k بلاطة: dist (n^(k+1)) + seen (n^k) + الجدول النهائي"""
+    n = size * size
+    return n ** (k + 1) + n ** k + pattern_space(k, n)
+
+def check_memory(size, partition, memory_limit=MEMORY_LIMIT):
+    """ValueError لو أكبر مجموعة في التقسيمة محتاجة أكتر من memory_limit وهي بتتبني"""
+    need = build_bytes(size, max(partition))
+    if need > memory_limit:
+        raise ValueError(f"partition {'-'.join(map(str, partition))} needs {need / 1e9:.1f} GB to build a "
+                         f"{max(partition)}-tile group on {size}x{size} (limit {memory_limit / 1e9:.1f} GB); "
+                         "use smaller groups")
+
+def default_path(size, partition, goal=None):
+    """الهدف الافتراضي: <size>x<size>-<partition>.pdb، وأي هدف تاني ترتيبه في اسم الملف"""
+    name = f"{size}x{size}-{'-'.join(str(k) for k in partition)}"
+    goal = tuple(goal or default_goal(size))
+    if goal != default_goal(size):
+        name += "-goal-" + "_".join(str(t) for t in goal)
+    return os.path.join(PDB_DIR, name + ".pdb")
+
+def _neighbor_cells(size):
+    cells = []
+    for idx in range(size * size):
+        row, col = divmod(idx, size)
+        targets = []
+        for dr, dc in [(-1,0),(1,0),(0,-1),(0,1)]:
+            r, c = row + dr, col + dc
+            if 0 <= r < size and 0 <= c < size:
+                targets.append(r * size + c)
+        cells.append(tuple(targets))
+    return tuple(cells)
+
+# ----------------------------
+# البناء: BFS عكسي (0-1 BFS) على حالات مجردة = أماكن بلاطات المجموعة + مكان الفراغ
+# - أثناء البحث: index الحالة = sum(pos_i * n^i) + blank * n^k (أي حركة = جمع وطرح بس)
+# - حركة بلاطة من المجموعة تكلفتها 1، حركة أي بلاطة تانية تكلفتها 0
+# - أول مرة نقابل أماكن بلاطات معينة (بأي مكان للفراغ) دي أقل تكلفة ليها، فبنكتبها
+#   في الجدول النهائي على rank_pattern بتاعها (ranking.py) — الجدول على الديسك كثيف
+#   (n!/(n-k)! byte) حتى لو مصفوفة البحث نفسها مش كثيفة
+# ----------------------------
+def build_group(size, goal, tiles, progress=None):
+    """
+    ترجع bytearray طوله n!/(n-k)!: table[rank_pattern(أماكن tiles)] = أقل حركات لبلاطات tiles.
+    progress: دالة بتتنادى بعد كل مستوى (depth, states_done, elapsed)
+    """
+    n = size * size
+    k = len(tiles)
+    mults = [n ** i for i in range(k)]
+    blank_mult = n ** k
+    neighbors = _neighbor_cells(size)
+    dist = bytearray(b"\xff") * (n ** (k + 1))
+    seen = bytearray(blank_mult)
+    table = bytearray(b"\xff") * pattern_space(k, n)
+
+    start = sum(goal.index(t) * m for t, m in zip(tiles, mults)) + goal.index(0) * blank_mult
+    dist[start] = 0
+    current = [start]
+    depth = 0
+    done = 0
+    t0 = time.time()
+    while current:
+        nxt = []
+        stack = current
+        while stack:
+            s = stack.pop()
+            if dist[s] != depth:
+                # الحالة اتوصلت بتكلفة أقل في مستوى قبل كده
+                continue
+            done += 1
+            pidx = s % blank_mult
+            blank = s // blank_mult
+            cells = []
+            rem = pidx
+            for _ in range(k):
+                cells.append(rem % n)
+                rem //= n
+            if not seen[pidx]:
+                seen[pidx] = 1
+                table[rank_pattern(cells, n)] = depth
+            for t in neighbors[blank]:
+                if t in cells:
+                    # بلاطة من المجموعة بتتحرك لمكان الفراغ: تكلفة 1
+                    ns = pidx + (blank - t) * mults[cells.index(t)] + t * blank_mult
+                    if dist[ns] > depth + 1:
+                        dist[ns] = depth + 1
+                        nxt.append(ns)
+                else:
+                    # بلاطة برا المجموعة: الفراغ بيتنقل ببلاش
+                    ns = pidx + t * blank_mult
+                    if dist[ns] > depth:
+                        dist[ns] = depth
+                        stack.append(ns)
+        if progress:
+            progress(depth, done, time.time() - t0)
+        depth += 1
+        current = nxt
+    return table
+
+def build_database(size, partition=None, path=None, goal=None, progress=None, memory_limit=MEMORY_LIMIT):
+    """
+    تبني كل مجموعات التقسيمة وتكتبهم في ملف واحد وترجع مسار الملف.
+    شكل الملف: MAGIC + size + عدد المجموعات + goal + (k + tiles) لكل مجموعة، بعدين الجداول ورا بعض.
+    memory_limit: أقصى ذاكرة لبناء مجموعة واحدة (check_memory) — التقسيمة الأكبر بترجع ValueError.
+    """
+    partition = tuple(partition or DEFAULT_PARTITIONS[size])
+    check_memory(size, partition, memory_limit)
+    goal = tuple(goal or default_goal(size))
+    path = path or default_path(size, partition, goal)
+    groups = partition_groups(size, partition)
+    tables = []
+    for gi, tiles in enumerate(groups):
+        if progress:
+            progress(f"group {gi + 1}/{len(groups)}: tiles {tiles}")
+        report = None
+        if progress:
+            report = lambda d, done, el: progress(f"  depth {d:3d}  states {done:>12,}  {el:8.1f}s")
+        tables.append(build_group(size, goal, tiles, report))
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<BB", size, len(groups)))
+        f.write(bytes(goal))
+        for tiles in groups:
+            f.write(struct.pack("<B", len(tiles)))
+            f.write(bytes(tiles))
+        for table in tables:
+            f.write(table)
+    # نكتب في ملف مؤقت ونعمل rename علشان اللي بيقرا ما يشوفش ملف نص مكتوب
+    os.replace(tmp, path)
+    return path
+
+# ----------------------------
+# القراءة: mmap للملف و memoryview لكل جدول (من غير أي نسخ)
+# ----------------------------
+class PatternDatabase:
+    """
+    هيوريستيك PDB جاهز للمحركات.
+    - db(state): القيمة الكاملة (state = tuple أو int مضغوط بنفس تمثيل board.encode_state)
+    - db.update(child, h, tile, src, dst): القيمة بعد حركة واحدة (هنا بتتحسب من child مباشرة)
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        mm = self._mm
+        if mm[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a pattern database file")
+        off = len(MAGIC)
+        size, count = struct.unpack_from("<BB", mm, off)
+        off += 2
+        n = size * size
+        self.size = size
+        self.goal = tuple(mm[off:off + n])
+        off += n
+        groups = []
+        for _ in range(count):
+            k = mm[off]
+            groups.append(tuple(mm[off + 1:off + 1 + k]))
+            off += 1 + k
+        self.groups = tuple(groups)
+
+        view = memoryview(mm)
+        self.tables = []
+        for tiles in groups:
+            length = pattern_space(len(tiles), n)
+            self.tables.append(view[off:off + length])
+            off += length
+        if off != len(mm):
+            raise ValueError(f"{path} is truncated or corrupt")
+
+        # لكل بلاطة: رقم مجموعتها ومكانها جوه المجموعة (الفراغ في مجموعة وهمية بعد الآخر)
+        self._group_of = [count] * n
+        self._slot_of = [0] * n
+        for gi, tiles in enumerate(groups):
+            for i, t in enumerate(tiles):
+                self._group_of[t] = gi
+                self._slot_of[t] = i
+        self._bits = max(4, (n - 1).bit_length())
+
+    def __call__(self, state):
+        n = self.size * self.size
+        group_of, slot_of = self._group_of, self._slot_of
+        cells = [[0] * len(tiles) for tiles in self.groups] + [[0]]
+        if isinstance(state, int):
+            bits = self._bits
+            mask = (1 << bits) - 1
+            for cell in range(n):
+                tile = (state >> (bits * cell)) & mask
+                cells[group_of[tile]][slot_of[tile]] = cell
+        else:
+            for cell, tile in enumerate(state):
+                cells[group_of[tile]][slot_of[tile]] = cell
+        h = 0
+        for table, c in zip(self.tables, cells):
+            h += table[rank_pattern(c, n)]
+        return h
+
+    def update(self, child, h, tile, src, dst):
+        return self(child)
+
+    def close(self):
+        for t in self.tables:
+            t.release()
+        self.tables = []
+        self._mm.close()
+
+_LOADED = {}
+
+def load(path):
+    """تفتح ملف PDB مرة واحدة لكل مسار (الـ mmap بيتشارك بين كل الاستدعاءات)"""
+    db = _LOADED.get(path)
+    if db is None:
+        db = PatternDatabase(path)
+        _LOADED[path] = db
+    return db
+
+def find_default(size, goal=None):
+    """مسار أول ملف PDB موجود للحجم ده (التقسيمة الافتراضية الأول) أو None"""
+    candidates = [default_path(size, DEFAULT_PARTITIONS[size], goal)] if size in DEFAULT_PARTITIONS else []
+    if os.path.isdir(PDB_DIR):
+        prefix = f"{size}x{size}-"
+        candidates += sorted(os.path.join(PDB_DIR, f) for f in os.listdir(PDB_DIR)
+                             if f.startswith(prefix) and f.endswith(".pdb"))
+    goal = tuple(goal or default_goal(size))
+    for path in candidates:
+        if not os.path.exists(path):
+            continue
+        try:
+            db = load(path)
+        except ValueError:
+            # ملف بصيغة قديمة أو تالف — كأنه مش موجود
+            continue
+        if db.goal == goal:
+            return path
+    return None
+
+def build_command(size, goal=None):
+    """أمر بناء PDB للحجم والهدف دول (للرسايل)"""
+    cmd = f"python -m npuzzle.pattern_db --size {size}"
+    goal = tuple(goal or default_goal(size))
+    if goal != default_goal(size):
+        cmd += f" --goal \"{' '.join(str(t) for t in goal)}\""
+    return cmd
+
+def load_default(size, goal=None):
+    path = find_default(size, goal)
+    if path is None:
+        raise FileNotFoundError(f"no pattern database for {size}x{size} with this goal; build one with: "
+                                f"{build_command(size, goal)}")
+    return load(path)
+
+# ----------------------------
+# نقطة البداية: بناء ملف PDB من سطر الأوامر
+# ----------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build an additive pattern database for the N-Puzzle.")
+    parser.add_argument("--size", type=int, required=True, help="board size (3, 4 or 5)")
+    parser.add_argument("--partition", type=parse_partition, default=None,
+                        help="tile group sizes, e.g. 5-5-5 or 6-6-3 (default depends on size)")
+    parser.add_argument("--goal", type=parse_goal, default=None,
+                        help="goal board, tiles in cell order with 0 for the blank "
+                             "(default: 1..n-1 then the blank; Korf's goal is \"0 1 2 ... 15\")")
+    parser.add_argument("--out", default=None,
+                        help="output file (default: npuzzle/pdb/<size>x<size>-<partition>[-goal-<tiles>].pdb)")
+    args = parser.parse_args(argv)
+    if args.goal is not None and sorted(args.goal) != list(range(args.size * args.size)):
+        parser.error(f"--goal must list the tiles 0..{args.size * args.size - 1} once each")
+
+    def progress(msg):
+        print(msg, file=sys.stderr, flush=True)
+
+    t0 = time.time()
+    try:
+        path = build_database(args.size, args.partition, args.out, args.goal, progress=progress)
+    except ValueError as e:
+        parser.error(str(e))
+    progress(f"wrote {path} ({os.path.getsize(path):,} bytes) in {time.time() - t0:.1f}s")
+
+if __name__ == "__main__":
+    main()
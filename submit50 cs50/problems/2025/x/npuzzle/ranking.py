@@ -0,0 +1,149 @@
+# npuzzle/ranking.py
+# فهرسة الحالات بأرقام متتالية (perfect hash) — ترتيب Myrvold-Ruskey في وقت خطي
+# - rank(state) / unrank(index, size): لكل التبديلات (n! رقم من 0 لـ n!-1)
+# - rank_pattern(cells, n) / unrank_pattern(index, k, n): لأماكن k بلاطات بس من n خانة
+#   (n!/(n-k)! رقم) — ده اللي بتتبني عليه جداول الـ PDB
+# - rank_many / rank_patterns_many: نفس الحاجة لقايمة حالات في استدعاء واحد
+# الفكرة: array متفهرس بالـ rank (byte لكل حالة) أصغر بكتير من dict مفاتيحه tuples
+# ملاحظة: الترتيب هنا مش الترتيب المعجمي (lexicographic) بس هو bijection وبيتحسب في O(n)
+
+# ----------------------------
+# مساعدات
+# ----------------------------
+def pattern_space(k, n):
+    """عدد الطرق لوضع k بلاطات مميزة في n خانة = n × (n-1) × ... × (n-k+1)"""
+    total = 1
+    for i in range(n - k + 1, n + 1):
+        total *= i
+    return total
+
+def _unpack(code, size):
+    """int مضغوط (نفس تمثيل board.encode_state) -> list"""
+    n = size * size
+    bits = max(4, (n - 1).bit_length())
+    mask = (1 << bits) - 1
+    return [(code >> (bits * i)) & mask for i in range(n)]
+
+# ----------------------------
+# تبديلات كاملة
+# ----------------------------
+def rank(state, size=None):
+    """
+    rank لتبديلة كاملة (state[cell] = tile). state ممكن يكون tuple/list أو int مضغوط (ومعاه size).
+    في كل خطوة i من الآخر: الرقم اللي في i بيبقى digit، وبنبدّله مع مكان i (swap) — O(n).
+    """
+    pi = _unpack(state, size) if isinstance(state, int) else list(state)
+    n = len(pi)
+    inv = [0] * n
+    for i, v in enumerate(pi):
+        inv[v] = i
+    r = 0
+    mult = 1
+    for i in range(n - 1, 0, -1):
+        s = pi[i]
+        j = inv[i]
+        pi[j] = s
+        inv[s] = j
+        r += s * mult
+        mult *= i + 1
+    return r
+
+def unrank(index, size):
+    """عكس rank: بترجع tuple (state[cell] = tile) للوح size × size"""
+    n = size * size
+    pi = list(range(n))
+    for i in range(n - 1, 0, -1):
+        index, d = divmod(index, i + 1)
+        pi[i], pi[d] = pi[d], pi[i]
+    return tuple(pi)
+
+# ----------------------------
+# أنماط جزئية: أماكن k بلاطات من n خانة
+# - البلاطة رقم t في القايمة بنعاملها كـ item رقم n-1-t في التبديلة الكاملة
+# - أول k خطوات من rank بتعتمد على أماكن البلاطات دي بس، فبنقف بعدهم
+# - لو ضفت بلاطة زيادة في آخر cells (زي الفراغ)، rank الأولانيين = الناتج % pattern_space(k, n)
+# ----------------------------
+def rank_pattern(cells, n):
+    """cells[t] = مكان البلاطة t في النمط → رقم من 0 لـ pattern_space(len(cells), n)-1"""
+    k = len(cells)
+    pos = [0] * n          # pos[item] = مكانه
+    at = [-1] * n          # at[cell] = الـ item اللي فيه (-1 = بلاطة برا النمط)
+    for t, c in enumerate(cells):
+        item = n - 1 - t
+        pos[item] = c
+        at[c] = item
+    r = 0
+    mult = 1
+    for i in range(n - 1, n - 1 - k, -1):
+        s = pos[i]
+        j = at[i]
+        if j >= 0:
+            pos[j] = s
+        at[s] = j
+        r += s * mult
+        mult *= i + 1
+    return r
+
+def unrank_pattern(index, k, n):
+    """عكس rank_pattern: بترجع tuple بأماكن الـ k بلاطات"""
+    pi = {}
+    for i in range(n - 1, n - 1 - k, -1):
+        index, d = divmod(index, i + 1)
+        pi[i], pi[d] = pi.get(d, d), pi.get(i, i)
+    return tuple(pi.get(n - 1 - t, n - 1 - t) for t in range(k))
+
+# ----------------------------
+# نسخ batched: مصفوفات الشغل بتتعمل مرة واحدة للقايمة كلها
+# ----------------------------
+def rank_many(states, size=None):
+    """rank لكل حالة في states (tuples أو ints مضغوطة مع size) → list"""
+    out = []
+    inv = None
+    for state in states:
+        pi = _unpack(state, size) if isinstance(state, int) else list(state)
+        n = len(pi)
+        if inv is None or len(inv) != n:
+            inv = [0] * n
+        for i, v in enumerate(pi):
+            inv[v] = i
+        r = 0
+        mult = 1
+        for i in range(n - 1, 0, -1):
+            s = pi[i]
+            j = inv[i]
+            pi[j] = s
+            inv[s] = j
+            r += s * mult
+            mult *= i + 1
+        out.append(r)
+    return out
+
+def rank_patterns_many(cells_list, n):
+    """rank_pattern لكل عنصر في cells_list (كلهم نفس k) → list"""
+    out = []
+    pos = [0] * n
+    at = [-1] * n
+    for cells in cells_list:
+        k = len(cells)
+        for t, c in enumerate(cells):
+            item = n - 1 - t
+            pos[item] = c
+            at[c] = item
+        r = 0
+        mult = 1
+        for i in range(n - 1, n - 1 - k, -1):
+            s = pos[i]
+            j = at[i]
+            if j >= 0:
+                pos[j] = s
+            at[s] = j
+            r += s * mult
+            mult *= i + 1
+        out.append(r)
+        # نرجّع at لـ -1 للاستخدام الجاي (الخانات اللي اتلمست كلها من cells)
+        for c in cells:
+            at[c] = -1
+    return out
+
+def unrank_many(indices, size):
+    return [unrank(i, size) for i in indices]
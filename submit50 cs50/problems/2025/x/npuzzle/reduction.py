@@ -0,0 +1,197 @@
+# npuzzle/reduction.py
+# حل بالتقليص للألواح الكبيرة (6x6 لحد 20x20): مش أمثل، بس polynomial
+# - بنرتب أول صف في اللوح الباقي، وبعده أول عمود، فاللوح يبقى (m-1)×(m-1) ونكرر
+# - كل بلاطة بتتنقل خطوة خطوة على أقصر طريق (BFS على الخانات اللي لسه مش متثبتة)، وكل خطوة
+#   الفراغ بيلف من غير ما يلمس البلاطة ولا اللي اتثبت: O(N) حركة لكل بلاطة -> O(N³) للوح كله
+# - آخر بلاطتين في كل صف / عمود بالحركة المعروفة: الأخيرة في الركن، اللي قبلها تحتها، وبعدين
+#   حركتين للفراغ يدخلوهم مكانهم
+# - آخر بلوك 3x3 (أو 4x4) بيتحل بمحرك أمثل (A* افتراضيًا) بعد إعادة ترقيم بلاطاته
+# - reduction_moves بيطلع الحركات (U / D / L / R للفراغ) أول بأول؛ reduction_solve هو نفس عقد المحركات
+# الهدف لازم يكون الهدف العادي (1..n-1 ثم الفراغ)
+# ملاحظة: الملف ده مفيهوش pygame
+
+import time
+from collections import deque
+
+from .board import MAX_STEPS, decode_state, default_goal, is_solvable, move_table
+from .search import PROGRESS_EVERY
+
+_DELTA = {"U": (-1, 0), "D": (1, 0), "L": (0, -1), "R": (0, 1)}
+MAX_SIZE = 20
+# المحرك الأمثل للبلوك الأخير: 4x4 بـ IDA* علشان ذاكرة A* ممكن تنفجر على بلوك متلخبط
+FINAL_ENGINES = {3: "a_star", 4: "ida_star"}
+
+class _Reducer:
+    """اللوح كـ list خانات + مكان كل بلاطة + الخانات المتثبتة؛ كل حركة بتتسجل في out"""
+    def __init__(self, state, size):
+        self.size = size
+        self.cells = list(state)
+        self.pos = [0] * len(self.cells)
+        for cell, tile in enumerate(self.cells):
+            self.pos[tile] = cell
+        self.locked = [False] * len(self.cells)
+        self.moves = move_table(size)
+        self.out = []
+
+    def step(self, target):
+        """الفراغ يدخل الخانة المجاورة target"""
+        blank = self.pos[0]
+        tile = self.cells[target]
+        self.cells[blank], self.cells[target] = tile, 0
+        self.pos[tile], self.pos[0] = blank, target
+        (rb, cb), (rt, ct) = divmod(blank, self.size), divmod(target, self.size)
+        self.out.append("UDLR"[(0 if rt < rb else 1) if ct == cb else (2 if ct < cb else 3)])
+
+    def route(self, src, dst, avoid=-1):
+        """أقصر طريق من src لـ dst على الخانات المش متثبتة (ومن غير avoid) — list الخانات بعد src"""
+        if src == dst:
+            return []
+        prev = {src: None}
+        todo = deque([src])
+        locked, moves = self.locked, self.moves
+        while todo:
+            cell = todo.popleft()
+            for n in moves[cell]:
+                if n in prev or locked[n] or n == avoid:
+                    continue
+                prev[n] = cell
+                if n == dst:
+                    path = []
+                    while n != src:
+                        path.append(n)
+                        n = prev[n]
+                    path.reverse()
+                    return path
+                todo.append(n)
+        raise RuntimeError(f"no free route from cell {src} to {dst}")
+
+    def blank_to(self, dst, avoid=-1):
+        for cell in self.route(self.pos[0], dst, avoid):
+            self.step(cell)
+
+    def move_tile(self, tile, dst):
+        """البلاطة لـ dst: الفراغ يروح للخانة الجاية على الطريق من غير ما يعدي عليها، وبعدين يبدّل معاها"""
+        for nxt in self.route(self.pos[tile], dst):
+            self.blank_to(nxt, avoid=self.pos[tile])
+            self.step(self.pos[tile])
+
+    def place_line(self, line, inner):
+        """
+        line: خانات الصف (أو العمود) بالترتيب، inner: الإزاحة للخانة اللي جوه اللوح (+size للصف، +1 للعمود).
+        البلاطة الصح لكل خانة = رقم الخانة + 1 (الهدف العادي).
+        """
+        for cell in line[:-2]:
+            self.move_tile(cell + 1, cell)
+            self.locked[cell] = True
+        edge, corner = line[-2], line[-1]
+        a, b = edge + 1, corner + 1
+        if self.pos[a] == edge and self.pos[b] == corner:
+            self.locked[edge] = self.locked[corner] = True
+            return
+        for _ in range(8):
+            self.move_tile(a, corner)
+            self.locked[corner] = True
+            # b في الخانة اللي جنب الركن (أو تحتها والفراغ محبوس فيها): مفيش طريق يطلعها من غير ما a
+            # تتحرك، فنبعدها خطوتين لجوه ونعيد
+            if self.pos[b] == edge or (self.pos[0] == edge and self.pos[b] == edge + inner):
+                self.locked[corner] = False
+                self.move_tile(b, edge + 2 * inner)
+                continue
+            break
+        else:
+            raise RuntimeError("could not set up the last two tiles of a line")
+        self.move_tile(b, corner + inner)
+        self.locked[corner + inner] = True
+        self.blank_to(edge)
+        self.locked[corner] = self.locked[corner + inner] = False
+        self.step(corner)            # a تدخل edge
+        self.step(corner + inner)    # b تطلع للركن
+        self.locked[edge] = self.locked[corner] = True
+
+    def finish_block(self, m, algo, heuristic, time_limit):
+        """آخر بلوك m×m بمحرك أمثل (من غير حد عقد؛ TimeoutError لو time_limit خلص)"""
+        from . import ENGINES
+
+        size = self.size
+        top = size - m
+        block = [(top + r) * size + (top + c) for r in range(m) for c in range(m)]
+        index = {cell: i for i, cell in enumerate(block)}
+        # البلاطة اللي مكانها في الهدف block[i] بتبقى i + 1 في البلوك الصغير
+        sub = tuple(0 if self.cells[cell] == 0 else index[self.cells[cell] - 1] + 1 for cell in block)
+        kwargs = {"time_limit": time_limit, "max_steps": float('inf')}
+        if algo != "table":
+            kwargs["heuristic"] = heuristic
+        path, _, reason = ENGINES[algo](sub, default_goal(m), m, **kwargs)
+        if reason == "time_limit":
+            raise TimeoutError(f"final {m}x{m} block hit the time limit")
+        if path is None:
+            raise RuntimeError(f"final {m}x{m} block not solved ({reason})")
+        for state in path[1:]:
+            self.step(block[state.index(0)])
+
+def reduction_moves(start, size, heuristic="manhattan", final=3, time_limit=None):
+    """
+    generator: حرف لكل حركة للفراغ (U / D / L / R) بيطلع أول ما كل بلاطة تتثبت — الذاكرة على قد اللوح
+    بس، فينفع لـ 20x20 والحركات رايحة لملف أو شبكة. final: حجم البلوك الأخير (3 أو 4)،
+    و heuristic للمحرك بتاعه. time_limit (ثواني) للبلوك الأخير بس — الباقي ملّي ثواني لكل بلاطة.
+    """
+    if final not in (3, 4):
+        raise ValueError("final block must be 3 or 4")
+    if size > MAX_SIZE:
+        raise ValueError(f"reduction supports boards up to {MAX_SIZE}x{MAX_SIZE}")
+    red = _Reducer(decode_state(start, size), size)
+    m = size
+    while m > final:
+        top = size - m
+        row = [top * size + c for c in range(top, size)]
+        col = [r * size + top for r in range(top + 1, size)]
+        red.place_line(row, size)
+        yield from red.out
+        red.out = []
+        red.place_line(col, 1)
+        yield from red.out
+        red.out = []
+        m -= 1
+    red.finish_block(m, FINAL_ENGINES.get(m, "a_star"), heuristic, time_limit)
+    yield from red.out
+
+def reduction_solve(start, goal, size, heuristic="manhattan", time_limit=None, max_steps=MAX_STEPS, progress=None,
+                    stats=None, final=3):
+    """
+    نفس عقد (path, nodes, reason): المسار مش أمثل بس طوله O(N³).
+    nodes = عدد الحركات (زي table_solve: كل حركة خطوة اتمشت) — max_steps حد على عدد الحركات.
+    progress: bound = None و frontier = 0 (مفيش open list).
+    ملحوظة: المسار list من tuples، فلـ 20x20 ده عشرات الآلاف من الحالات؛ reduction_moves أخف.
+    """
+    start_time = time.time()
+    start, goal = decode_state(start, size), decode_state(goal, size)
+    if goal != default_goal(size):
+        raise ValueError("reduction only supports the standard goal (1..n-1 then the blank)")
+    if not is_solvable(start, size, goal):
+        return None, 0, "exhausted"
+    state = list(start)
+    blank = state.index(0)
+    path = [start]
+    nodes = 0
+    try:
+        for letter in reduction_moves(start, size, heuristic, final, time_limit):
+            dr, dc = _DELTA[letter]
+            target = blank + dr * size + dc
+            state[blank], state[target] = state[target], 0
+            blank = target
+            path.append(tuple(state))
+            nodes += 1
+            if nodes > max_steps:
+                return None, nodes, "max_steps"
+            if time_limit and nodes & 1023 == 0 and (time.time() - start_time) > time_limit:
+                return None, nodes, "time_limit"
+            if progress and nodes % PROGRESS_EVERY == 0 and progress(nodes, None, 0):
+                return None, nodes, "cancelled"
+        if stats:
+            stats.expansions = stats.generated = nodes
+        return path, nodes, "solved"
+    except TimeoutError:
+        return None, nodes, "time_limit"
+    finally:
+        if stats:
+            stats.finish(nodes, 0, start_time)
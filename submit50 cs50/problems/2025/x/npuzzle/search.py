@@ -0,0 +1,361 @@
+# npuzzle/search.py
+# محركات البحث: DFS، Best-First، A*، IDA*، Table (3x3)
+# ملاحظة: الملف ده مفيهوش pygame
+
+import time
+
+from .board import (MAX_STEPS, apply_move, decode_state, encode_state, expand, find_blank,
+                    legal_moves, move_table, reconstruct_path, tile_bits)
+from .heuristics import get_heuristic, heuristic_val
+from .openlist import BucketQueue, pack_entry
+from .stats import timed_heuristic
+
+# ----------------------------
+# الخوارزميات: DFS (stack)، Best-First (Greedy)، A*
+# - كلها ترجع (path, nodes, reason)
+# - path: قائمة الحالات (من البداية إلى الهدف) أو None لو مش لقيت
+# - nodes: عدد العقد الموسعة
+# - reason: "solved" أو "time_limit" أو "max_steps" أو "exhausted" أو "cancelled"
+# - progress (اختياري): دالة بتتنادى كل PROGRESS_EVERY عقدة بـ (nodes, bound, frontier)
+#   bound = f الحالية (أو h في Best-First، والعمق في DFS) و frontier = حجم الـ open list
+#   لو رجعت True البحث بيقف فورًا بـ "cancelled" (إلغاء تعاوني من الواجهة أو أي worker)
+# ----------------------------
+PROGRESS_EVERY = 2048
+
+# ----------------------------
+# حد الذاكرة (memory_limit بالبايت، اختياري) لـ A* و Best-First
+# - كل 1024 عقدة بنقدّر الذاكرة من حجم الـ open list وعدد الحالات المخزنة
+# - لو عدّينا الحد: بنرمي الجداول ونكمل بـ IDA* من البداية (ذاكرته على قد عمق الحل بس)
+#   بدل ما نرجع فاشلين، و A* بيدي IDA* أقل f وصله كـ bound أولاني (مفيش حل أقل منه)
+# - الأرقام اتقاست بـ tracemalloc على 3x3 / 4x4 / 5x5 (حوالي 170-200 بايت لكل حالة مخزنة
+#   مع نصيبها من الـ open list)؛ DFS مش داخل هنا لأنه 3x3 بس
+# ----------------------------
+CLOSED_BYTES = 160  # best_g + parent (أو parent + visited) لكل حالة
+OPEN_BYTES = 60     # عنصر int في الـ bucket queue
+
+def memory_estimate(open_size, closed_size):
+    return open_size * OPEN_BYTES + closed_size * CLOSED_BYTES
+
+def _memory_fallback(start, goal, size, heuristic, time_limit, max_steps, progress, stats,
+                     start_time, nodes, bound=None):
+    """
+    IDA* بالباقي من الوقت والعقد؛ العقد والـ progress بيكملوا من عدد العقد اللي فات.
+    ترجع (path, عقد IDA* بس, reason).
+    """
+    if stats:
+        stats.memory_fallback = True
+    remaining = None
+    if time_limit:
+        remaining = max(0.0, time_limit - (time.time() - start_time))
+    report = None
+    if progress:
+        report = lambda n, b, fr: progress(nodes + n, b, fr)
+    return ida_star(start, goal, size, heuristic, remaining, max_steps - nodes, report, stats, bound)
+
+# ----------------------------
+# stats (اختياري): SearchStats من stats.py — لو متبعتة المحرك بيملاها وهو شغال،
+# و finish بتتنادى في finally فالأرقام بتبقى كاملة أيًا كان سبب الرجوع
+# ----------------------------
+def _expand_counted(stats, code, size, h, table, blank, prev_blank):
+    """expand مع العدادات: وقت توليد الجيران من غير وقت الهيوريستيك (اللي بيتجمع لوحده)"""
+    t = time.perf_counter()
+    heur_before = stats.heuristic_time
+    children = expand(code, size, h, table, blank, prev_blank)
+    stats.neighbors_time += time.perf_counter() - t - (stats.heuristic_time - heur_before)
+    stats.expansions += 1
+    stats.generated += len(children)
+    return children
+
+def dfs(start, goal, size, time_limit=None, max_steps=MAX_STEPS, progress=None, stats=None):
+    """
+    DFS عبارة عن stack (عمق أولاً) — نستخدم هنا نهج غير متكرر مع visited لمنع الدوران.
+    ملاحظة: هذا DFS قد يستغرق وقت طويل لذا هناك وقت/حد للعقد.
+    كل عنصر في الـ stack هو (الحالة، الأب) — الأب بيتسجل في parent وقت السحب بس.
+    البحث كله على الحالات المضغوطة (int)، والمسار بيتفك لـ tuples في الآخر.
+    """
+    start_time = time.time()
+    bits = tile_bits(size)
+    start, goal = encode_state(start, size), encode_state(goal, size)
+    stack = [(start, None, find_blank(start, size), -1)]  # (state, parent, blank, parent_blank)
+    visited = set()
+    parent = {}
+    nodes = 0
+    try:
+        while stack:
+            # فحص حدود الوقت
+            if time_limit and (time.time() - start_time) > time_limit:
+                return None, nodes, "time_limit"
+            state, prev, blank, prev_blank = stack.pop()
+            nodes += 1
+            if nodes > max_steps:
+                return None, nodes, "max_steps"
+            if progress and nodes % PROGRESS_EVERY == 0 and progress(nodes, None, len(stack)):
+                return None, nodes, "cancelled"
+            if state in visited:
+                if stats:
+                    stats.duplicate_pops += 1
+                continue
+            parent[state] = prev
+            if state == goal:
+                return reconstruct_path(parent, state, size), nodes, "solved"
+            visited.add(state)
+            if stats:
+                t = time.perf_counter()
+            # نضيف الجيران (لا نتحقق من عمق هنا لأن المثال السابق طلب تعطيل DFS للحجم الأكبر)
+            targets = legal_moves(size, blank, prev_blank)
+            for target in targets:
+                n = apply_move(state, blank, target, bits)
+                if n not in visited:
+                    stack.append((n, state, target, blank))
+            if stats:
+                stats.neighbors_time += time.perf_counter() - t
+                stats.expansions += 1
+                stats.generated += len(targets)
+                if len(stack) > stats.max_open:
+                    stats.max_open = len(stack)
+        return None, nodes, "exhausted"
+    finally:
+        if stats:
+            stats.finish(nodes, len(visited), start_time)
+
+def best_first(start, goal, size, heuristic="manhattan", time_limit=None, max_steps=MAX_STEPS, progress=None,
+               stats=None, memory_limit=None):
+    """
+    Best-First (Greedy) يعتمد على أقل قيمة هيوريستيك فقط (g not considered).
+    الأب بيتسجل أول مرة الحالة تتولد (أول مرة بس) فالمسار يفضل ثابت.
+    """
+    start_time = time.time()
+    table = timed_heuristic(get_heuristic(goal, size, heuristic), stats)
+    origin = start
+    start, goal = encode_state(start, size), encode_state(goal, size)
+    pq = BucketQueue()  # key = h، والعناصر المتساوية LIFO
+    pq.push(heuristic_val(start, goal, size, heuristic), 0, pack_entry(start, find_blank(start, size), -1))
+    parent = {start: None}
+    visited = set()
+    nodes = 0
+    closed_size = 0  # حجم visited وقت التحويل لـ IDA* (الجداول بتتمسح قبل stats.finish)
+    try:
+        while pq:
+            if time_limit and (time.time() - start_time) > time_limit:
+                return None, nodes, "time_limit"
+            h, _, item = pq.pop()
+            # unpack_entry مكتوبة inline علشان دي أسخن لفة في المحرك
+            state, blank, prev_blank = item >> 32, (item >> 16) & 0xffff, (item & 0xffff) - 1
+            nodes += 1
+            if nodes > max_steps:
+                return None, nodes, "max_steps"
+            if progress and nodes % PROGRESS_EVERY == 0 and progress(nodes, h, len(pq)):
+                return None, nodes, "cancelled"
+            if memory_limit and not nodes & 1023 and memory_estimate(len(pq), len(parent)) > memory_limit:
+                closed_size = len(visited)
+                pq, parent, visited = BucketQueue(), {}, set()
+                path, more, reason = _memory_fallback(origin, goal, size, heuristic, time_limit, max_steps,
+                                                      progress, stats, start_time, nodes)
+                nodes += more
+                return path, nodes, reason
+            if state == goal:
+                return reconstruct_path(parent, state, size), nodes, "solved"
+            if state in visited:
+                if stats:
+                    stats.duplicate_pops += 1
+                continue
+            visited.add(state)
+            if stats:
+                children = _expand_counted(stats, state, size, h, table, blank, prev_blank)
+            else:
+                children = expand(state, size, h, table, blank, prev_blank)
+            for n, nh, n_blank in children:
+                if n not in parent:
+                    parent[n] = state
+                    pq.push(nh, 0, (n << 32) | (n_blank << 16) | (blank + 1))
+            if stats and len(pq) > stats.max_open:
+                stats.max_open = len(pq)
+        return None, nodes, "exhausted"
+    finally:
+        if stats:
+            stats.finish(nodes, closed_size or len(visited), start_time)
+
+def a_star(start, goal, size, heuristic="manhattan", time_limit=None, max_steps=MAX_STEPS, progress=None,
+           stats=None, memory_limit=None):
+    """
+    A* يستخدم f = g + h ويخزن أفضل g لكل حالة.
+    parent بيتحدث مع best_g، فالمسار المبني في الآخر هو مسار أفضل g.
+    memory_limit: لو الذاكرة المقدرة عدّته بنكمل بـ IDA* (الحل بيفضل أمثل).
+    """
+    start_time = time.time()
+    table = timed_heuristic(get_heuristic(goal, size, heuristic), stats)
+    origin = start
+    start, goal = encode_state(start, size), encode_state(goal, size)
+    pq = BucketQueue()  # buckets[f][g]: أقل f الأول، وجوه نفس f أعلى g
+    pq.push(heuristic_val(start, goal, size, heuristic), 0, pack_entry(start, find_blank(start, size), -1))
+    best_g = {start: 0}
+    parent = {start: None}
+    nodes = 0
+    closed_size = 0  # حجم best_g وقت التحويل لـ IDA* (الجداول بتتمسح قبل stats.finish)
+    try:
+        while pq:
+            if time_limit and (time.time() - start_time) > time_limit:
+                return None, nodes, "time_limit"
+            f, g, item = pq.pop()
+            state, blank, prev_blank = item >> 32, (item >> 16) & 0xffff, (item & 0xffff) - 1
+            nodes += 1
+            if nodes > max_steps:
+                return None, nodes, "max_steps"
+            if progress and nodes % PROGRESS_EVERY == 0 and progress(nodes, f, len(pq)):
+                return None, nodes, "cancelled"
+            if memory_limit and not nodes & 1023 and memory_estimate(len(pq), len(best_g)) > memory_limit:
+                # f هنا أقل f في الـ open list، فهو حد أدنى صحيح لطول الحل الأمثل
+                closed_size = len(best_g)
+                pq, best_g, parent = BucketQueue(), {}, {}
+                path, more, reason = _memory_fallback(origin, goal, size, heuristic, time_limit, max_steps,
+                                                      progress, stats, start_time, nodes, f)
+                nodes += more
+                return path, nodes, reason
+            if state == goal:
+                return reconstruct_path(parent, state, size), nodes, "solved"
+            # إذا كان لدينا g أفضل لهذه الحالة نكمل
+            if best_g.get(state, float('inf')) < g:
+                if stats:
+                    stats.stale_pops += 1
+                continue
+            # h بتاعة الحالة الحالية = f - g، ومنها نحسب h للجيران تدريجيًا
+            if stats:
+                children = _expand_counted(stats, state, size, f - g, table, blank, prev_blank)
+            else:
+                children = expand(state, size, f - g, table, blank, prev_blank)
+            for n, nh, n_blank in children:
+                new_g = g + 1
+                if new_g < best_g.get(n, float('inf')):
+                    best_g[n] = new_g
+                    parent[n] = state
+                    pq.push(new_g + nh, new_g, (n << 32) | (n_blank << 16) | (blank + 1))
+            if stats and len(pq) > stats.max_open:
+                stats.max_open = len(pq)
+        return None, nodes, "exhausted"
+    finally:
+        if stats:
+            stats.finish(nodes, closed_size or len(best_g), start_time)
+
+# ----------------------------
+# IDA* (Iterative Deepening A*)
+# - DFS محدود بحد f (bound)، ولما يفشل نرفع الحد لأقل f اتجاوزته في اللفة اللي فاتت
+# - الذاكرة بتكبر مع عمق الحل بس (المسار الحالي)، من غير best_g ولا heap
+# - نفس عقد (path, nodes, reason) ونفس حدود الوقت وعدد العقد
+# ----------------------------
+FOUND = -1   # علامة إن الحل اتلقى جوه search
+ABORTED = -2 # علامة إن الوقت أو عدد العقد خلص
+
+def ida_star(start, goal, size, heuristic="manhattan", time_limit=None, max_steps=MAX_STEPS, progress=None,
+             stats=None, bound=None):
+    """
+    IDA* على الحالات المضغوطة مع h تدريجي ومنع عكس آخر حركة.
+    المسار الحالي بيتخزن في list واحدة (append/pop) وبيتفك لـ tuples لما نلاقي الحل.
+    مع stats: max_open = أقصى عمق، و closed_size = 0 (IDA* مش بيخزن حالات).
+    bound: أول حد نبدأ بيه لو معروف إن مفيش حل أقصر منه (زي لما A* بيسلّم لـ IDA*)
+    """
+    start_time = time.time()
+    bits = tile_bits(size)
+    mask = (1 << bits) - 1
+    moves = move_table(size)
+    table = timed_heuristic(get_heuristic(goal, size, heuristic), stats)
+    additive = isinstance(table, tuple)
+    start, goal = encode_state(start, size), encode_state(goal, size)
+    path = [start]
+    nodes = 0
+    reason = None
+
+    def search(state, blank, prev_blank, g, h, bound):
+        nonlocal nodes, reason
+        f = g + h
+        if f > bound:
+            return f
+        if state == goal:
+            return FOUND
+        nodes += 1
+        if nodes > max_steps:
+            reason = "max_steps"
+            return ABORTED
+        # فحص الوقت كل 1024 عقدة بس علشان time.time() مش رخيصة
+        if time_limit and nodes & 1023 == 0 and (time.time() - start_time) > time_limit:
+            reason = "time_limit"
+            return ABORTED
+        # frontier هنا = عمق المسار الحالي (IDA* مفيهوش open list)
+        if progress and nodes % PROGRESS_EVERY == 0 and progress(nodes, bound, len(path)):
+            reason = "cancelled"
+            return ABORTED
+        minimum = float('inf')
+        blank_shift = bits * blank
+        if stats:
+            stats.expansions += 1
+            if len(path) > stats.max_open:
+                stats.max_open = len(path)
+        for target in moves[blank]:
+            if target == prev_blank:
+                continue
+            if stats:
+                t0 = time.perf_counter()
+                heur_before = stats.heuristic_time
+            shift = bits * target
+            tile = (state >> shift) & mask
+            n = state - (tile << shift) + (tile << blank_shift)
+            if additive:
+                cost = table[tile]
+                nh = h - cost[target] + cost[blank]
+            else:
+                nh = table.update(n, h, tile, target, blank)
+            if stats:
+                stats.neighbors_time += time.perf_counter() - t0 - (stats.heuristic_time - heur_before)
+                stats.generated += 1
+            path.append(n)
+            t = search(n, target, blank, g + 1, nh, bound)
+            if t == FOUND or t == ABORTED:
+                return t
+            path.pop()
+            if t < minimum:
+                minimum = t
+        return minimum
+
+    blank = find_blank(start, size)
+    h0 = heuristic_val(start, goal, size, heuristic)
+    bound = h0 if bound is None else max(h0, bound)
+    try:
+        while True:
+            if stats:
+                stats.iterations += 1
+            t = search(start, blank, -1, 0, h0, bound)
+            if t == FOUND:
+                return [decode_state(p, size) for p in path], nodes, "solved"
+            if t == ABORTED:
+                return None, nodes, reason
+            if t == float('inf'):
+                return None, nodes, "exhausted"
+            bound = t
+    finally:
+        if stats:
+            stats.finish(nodes, 0, start_time)
+
+# ----------------------------
+# Table (3x3 بس): الحل الأمثل من جدول المسافات الدقيقة من غير بحث
+# - نفس عقد (path, nodes, reason)، nodes = عدد الخطوات اللي اتمشت على الجدول
+# ----------------------------
+def table_solve(start, goal, size, time_limit=None, max_steps=MAX_STEPS, progress=None, stats=None):
+    """
+    بنقرأ المسافة الدقيقة لكل جار ونمشي على اللي أقل بواحد — كل خطوة O(1) تقريبًا.
+    الجدول بيتبني ويتحفظ أول مرة لو مش موجود (ثواني قليلة).
+    progress مش بيتنادى هنا: الحل بياخد أقل من ملّي ثانية.
+    """
+    if size != 3:
+        raise ValueError("table_solve only supports 3x3 boards")
+    from . import eight_puzzle
+    start_time = time.time()
+    table = eight_puzzle.load(goal=decode_state(goal, size))
+    path = table.solve(decode_state(start, size))
+    nodes = 0 if path is None else len(path) - 1
+    if stats:
+        # كل خطوة = توسيع واحد على الجدول (الوقت كله قراية من الجدول = heuristic)
+        stats.expansions = nodes
+        stats.heuristic_time = time.time() - start_time
+        stats.finish(nodes, 0, start_time)
+    if path is None:
+        return None, 0, "exhausted"
+    return path, nodes, "solved"
@@ -0,0 +1,165 @@
+# npuzzle/shared.py
+# جداول الهيوريستيك مشتركة بين العمليات: العملية الرئيسية بتحمّل (أو تبني) كل جدول مرة واحدة
+# وبتنشره، والـ workers بيربطوا عليه بالاسم read-only من غير نسخ
+# - جداول Walking Distance (dict بـ Python) بتتحول لـ arrays مترتبة (مفاتيح uint64 + قيم byte)
+#   في multiprocessing.shared_memory، والـ worker بيدور فيها بـ bisect بدل ما يبني dict لنفسه
+# - الجداول اللي أصلًا ملفات (PDB، جدول 3x3 الدقيق) بتتنشر بمسار الملف: كل worker بيعمل mmap لنفس
+#   الملف فالصفحات واحدة في الـ page cache، والرئيسية بتبني الملف الناقص قبل ما الـ workers تبدأ
+#   (بدل ما كل worker يبنيه لوحده في نفس الوقت)
+# - جداول Manhattan / Misplaced (tile × cell) مش بتتنشر: أكبرها 625 رقم وبتتبني في ميكروثواني،
+#   والمحركات محتاجاها tuples علشان التحديث التدريجي
+# الاستخدام:
+#     with TableRegistry() as registry:
+#         registry.share_heuristic(goal, size, "walking_distance")
+#         pool = multiprocessing.Pool(initializer=install, initargs=(registry.handles,))
+#     وجوه الـ worker: get_heuristic بيلاقي الجدول المنشور لوحده
+# ملاحظة: الملف ده مفيهوش pygame
+
+import array
+import os
+import struct
+from bisect import bisect_left
+from itertools import count
+from multiprocessing import shared_memory
+
+from .board import decode_state
+
+_NAMES = count()
+_HANDLES = {}    # اللي install سجله في العملية دي: key -> spec
+_ATTACHED = {}   # key -> الكائن بعد الربط (والـ SharedMemory بيفضل عايش جواه)
+
+def table_key(goal, size, method):
+    return (method, size, decode_state(goal, size))
+
+# ----------------------------
+# جدول lookup مترتب في shared memory
+# ----------------------------
+# الشكل: عدد العناصر (uint64) + المفاتيح (uint64 مترتبة) + القيم (byte لكل مفتاح)
+def pack_lookup(table):
+    """dict (مفاتيح int >= 0 أقل من 2^64، قيم 0..255) -> bytes"""
+    keys = sorted(table)
+    return struct.pack("<Q", len(keys)) + array.array("Q", keys).tobytes() + bytes(table[k] for k in keys)
+
+class SharedLookup:
+    """
+    dict read-only فوق buffer من pack_lookup (من غير نسخ): table[key] بـ bisect، O(log n).
+    shm (اختياري): الـ SharedMemory اللي الـ buffer جواه، علشان يفضل مفتوح طول ما الجدول مستخدم.
+    """
+    def __init__(self, buf, shm=None):
+        self._shm = shm
+        n = struct.unpack_from("<Q", buf)[0]
+        self.keys = buf[8:8 + 8 * n].cast("Q")
+        self.values = buf[8 + 8 * n:8 + 9 * n]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __getitem__(self, key):
+        i = bisect_left(self.keys, key)
+        if i == len(self.keys) or self.keys[i] != key:
+            raise KeyError(key)
+        return self.values[i]
+
+    def __contains__(self, key):
+        i = bisect_left(self.keys, key)
+        return i < len(self.keys) and self.keys[i] == key
+
+def attach(name):
+    """-> (memoryview read-only, SharedMemory) لجزء منشور بالاسم؛ من غير نسخ"""
+    try:
+        # Python 3.13+: الـ worker مش مالك الجزء فما يسجلوش في الـ resource tracker
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+    return shm.buf.toreadonly(), shm
+
+# ----------------------------
+# العملية الرئيسية: النشر
+# ----------------------------
+class TableRegistry:
+    """
+    registry.share_heuristic(goal, size, method): يحمّل / يبني جدول الهيوريستيك وينشره (لو ليه جدول كبير)
+    registry.publish(data) -> اسم جزء shared memory فيه نسخة واحدة من data
+    registry.handles: dict صغير (بيتبعت للـ workers) key -> ("lookups", أسماء) أو ("file", مسار)
+    close() (أو with) بيمسح الأجزاء؛ الـ workers لازم يكونوا خلصوا قبلها
+    """
+    def __init__(self):
+        self.handles = {}
+        self._segments = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def publish(self, data):
+        name = f"npz{os.getpid()}_{next(_NAMES)}"
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(1, len(data)))
+        shm.buf[:len(data)] = data
+        self._segments.append(shm)
+        return name
+
+    def share_heuristic(self, goal, size, method):
+        """
+        بيحمّل الهيوريستيك هنا (نفس get_heuristic، فالأغلاط زي PDB ناقص بتطلع من هنا) وينشر جدوله.
+        ترجع True لو اتنشر حاجة.
+        """
+        from .heuristics import get_heuristic
+
+        key = table_key(goal, size, method)
+        if key in self.handles:
+            return True
+        obj = get_heuristic(goal, size, method)
+        if method == "walking_distance":
+            self.handles[key] = ("lookups", (self.publish(pack_lookup(obj.vertical)),
+                                             self.publish(pack_lookup(obj.horizontal))))
+        elif method in ("pdb", "exact"):
+            self.handles[key] = ("file", obj.path)
+        else:
+            return False
+        return True
+
+    def close(self):
+        for shm in self._segments:
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._segments = []
+        self.handles = {}
+
+# ----------------------------
+# الـ worker: الربط
+# ----------------------------
+def install(handles):
+    """initializer للـ pool (أو أول سطر في worker): يسجل الجداول المنشورة للعملية دي"""
+    from .heuristics import set_attached_lookup
+
+    _HANDLES.clear()
+    _HANDLES.update(handles)
+    _ATTACHED.clear()
+    set_attached_lookup(attached_heuristic if handles else None)
+
+def attached_heuristic(goal, size, method):
+    """الهيوريستيك من جدول منشور، أو None لو مفيش (get_heuristic بيبنيه عادي ساعتها)"""
+    key = table_key(goal, size, method)
+    spec = _HANDLES.get(key)
+    if spec is None:
+        return None
+    obj = _ATTACHED.get(key)
+    if obj is None:
+        kind, ref = spec
+        if kind == "file":
+            if method == "pdb":
+                from . import pattern_db
+                obj = pattern_db.load(ref)
+            else:
+                from . import eight_puzzle
+                obj = eight_puzzle.load(ref, goal=key[2], build=False)
+        else:
+            from .heuristics import WalkingDistance
+            obj = WalkingDistance(key[2], size, tables=tuple(SharedLookup(*attach(name)) for name in ref))
+        _ATTACHED[key] = obj
+    return obj
@@ -0,0 +1,116 @@
+# npuzzle/stats.py
+# عدادات البحث: أي محرك بياخد stats=SearchStats() ويملاها وهو شغال
+# - لما البحث يبطأ نعرف ليه: pops مكررة كتير؟ heap ضخم؟ وقت الهيوريستيك؟
+# - الحساب بيحصل بس لو stats متبعتة، فالمحرك من غيرها بنفس سرعته
+# ملاحظة: الملف ده مفيهوش pygame
+
+import time
+
+class SearchStats:
+    """
+    - expansions: عقد اتوسعت فعلاً (اتولد منها جيران)
+    - generated: جيران اتولدوا (قبل أي فلترة)
+    - duplicate_pops: حالة اتسحبت وهي متوسعة قبل كده (visited في DFS / Best-First)
+    - stale_pops: حالة اتسحبت بـ g أسوأ من أفضل g معروف (A*)
+    - max_open: أقصى حجم للـ open list (في IDA*: أقصى عمق للمسار)
+    - closed_size: عدد الحالات المخزنة في الآخر (visited / best_g)
+    - heuristic_time: وقت الهيوريستيك (الكائنات زي LC / WD / PDB؛ جداول Manhattan و Misplaced
+      تحديثها عملية طرح واحدة جوه توليد الجيران فبتتحسب في neighbors_time)
+    - neighbors_time: وقت توليد الجيران
+    - iterations: عدد لفات IDA* (عدد الـ bounds)
+    - memory_fallback: True لو حد الذاكرة اتوصل والبحث كمّل بـ IDA*
+    - cache_hit: True لو الحل جه من SolutionCache من غير بحث
+    - suboptimality: في ARA* حد أعلى لـ (طول الحل اللي رجع / الطول الأمثل)، None في الباقي
+    - worker_nodes: في المحركات المتوازية (parallel.py) العقد اللي اتوسعت في كل عملية، None في الباقي
+      (وباقي العدادات مجموع كل العمليات: الأوقات وقت CPU، و max_open مجموع أقصى open لكل عملية)
+    """
+    FIELDS = ("expansions", "generated", "duplicate_pops", "stale_pops", "max_open", "closed_size",
+              "iterations", "memory_fallback", "cache_hit", "suboptimality", "worker_nodes",
+              "heuristic_time", "neighbors_time", "elapsed")
+
+    def __init__(self):
+        self.expansions = 0
+        self.generated = 0
+        self.duplicate_pops = 0
+        self.stale_pops = 0
+        self.max_open = 0
+        self.closed_size = 0
+        self.iterations = 0
+        self.memory_fallback = False
+        self.cache_hit = False
+        self.suboptimality = None
+        self.worker_nodes = None
+        self.heuristic_time = 0.0
+        self.neighbors_time = 0.0
+        self.elapsed = 0.0
+        self.nodes = 0
+
+    @property
+    def nodes_per_sec(self):
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def finish(self, nodes, closed_size, start_time):
+        """بتتنادى مرة واحدة لما المحرك يرجع (أيًا كان السبب)"""
+        self.nodes = nodes
+        self.closed_size = closed_size
+        self.elapsed = time.time() - start_time
+
+    def to_dict(self):
+        d = {name: getattr(self, name) for name in self.FIELDS}
+        for name in ("heuristic_time", "neighbors_time", "elapsed"):
+            d[name] = round(d[name], 6)
+        d["nodes"] = self.nodes
+        d["nodes_per_sec"] = round(self.nodes_per_sec)
+        return d
+
+    def to_json(self):
+        import json  # هنا بس: json (و re / enum معاه) بيزود ~10ms على استيراد الباكدج
+
+        return json.dumps(self.to_dict())
+
+    def lines(self):
+        """سطور جاهزة للعرض (result_screen)"""
+        if self.cache_hit:
+            return ["Solution from cache (no search)"]
+        lines = [
+            f"Expansions: {self.expansions:,}   Generated: {self.generated:,}",
+            f"Duplicate pops: {self.duplicate_pops:,}   Stale pops: {self.stale_pops:,}",
+            f"Max open: {self.max_open:,}   Closed: {self.closed_size:,}",
+            f"Heuristic: {self.heuristic_time:.3f} s   Neighbors: {self.neighbors_time:.3f} s",
+            f"Speed: {self.nodes_per_sec:,.0f} nodes/s" + ("   (memory limit hit, finished with IDA*)"
+                                                         if self.memory_fallback else ""),
+        ]
+        if self.worker_nodes:
+            # لحد 4 عمليات كل رقم لوحده، وبعد كده أقل وأكتر بس علشان السطر يفضل قصير
+            per_worker = (" / ".join(f"{n:,}" for n in self.worker_nodes) if len(self.worker_nodes) <= 4
+                          else f"{min(self.worker_nodes):,} - {max(self.worker_nodes):,}")
+            lines.append(f"Workers: {len(self.worker_nodes)}   Nodes per worker: {per_worker}")
+        if self.suboptimality is not None and self.suboptimality > 1:
+            lines.append(f"Path is at most {self.suboptimality:.2f}x the optimal length")
+        return lines
+
+class TimedHeuristic:
+    """
+    غلاف حوالين كائن هيوريستيك (LC / WD / PDB / الجدول الدقيق) بيجمع الوقت في stats.heuristic_time.
+    جداول (tile × cell) بترجع زي ما هي من timed_heuristic (مفيش نداء نقيسه).
+    """
+    def __init__(self, table, stats):
+        self.table = table
+        self.stats = stats
+
+    def __call__(self, code):
+        t = time.perf_counter()
+        h = self.table(code)
+        self.stats.heuristic_time += time.perf_counter() - t
+        return h
+
+    def update(self, child, h, tile, src, dst):
+        t = time.perf_counter()
+        h = self.table.update(child, h, tile, src, dst)
+        self.stats.heuristic_time += time.perf_counter() - t
+        return h
+
+def timed_heuristic(table, stats):
+    if stats is None or isinstance(table, tuple):
+        return table
+    return TimedHeuristic(table, stats)
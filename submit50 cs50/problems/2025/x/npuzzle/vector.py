@@ -0,0 +1,161 @@
+# npuzzle/vector.py
+# هيوريستيكس لمجموعة حالات مرة واحدة بـ NumPy (Manhattan / Misplaced / Linear Conflict)
+# - الحالات مصفوفة (n × N²) uint8 (uint16 فوق 16x16)، والقيم كلها بتطلع في نداء واحد من غير لف Python على الخانات
+# - لكل goal بنجهز مرة واحدة: مصفوفة المسافات (tile × cell)، ولكل صف/عمود جدول penalty
+#   متفهرس بمحتوى الخط (كل بلاطة بتتحول لـ label: 0 لو مش من الخط ده، أو مكانها في الهدف + 1)
+# - جدول الـ penalty حجمه (N+1)^N فبيتبني أول مرة linear_conflict تتطلب بس، ولحد LC_MAX_SIZE؛
+#   أكبر من كده heuristic_many بترجع للحساب العادي لكل حالة
+# - مفيد لما يبقى عندنا حالات كتير مرة واحدة: ألواح batch، طبقة beam، ترتيب frontier
+#   (المحركات العادية بتحسب h تدريجي O(1) لكل جار فمش محتاجة ده)
+# - NumPy اختياري: لو مش متسطب HAVE_NUMPY = False و heuristic_many بترجع للحساب العادي
+# ملاحظة: الملف ده مفيهوش pygame
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:  # pragma: no cover - بيئة من غير numpy
+    np = None
+    HAVE_NUMPY = False
+
+from .board import decode_state, tile_bits
+from .heuristics import _conflict_penalty, heuristic_val
+
+METHODS = ("manhattan", "misplaced", "linear_conflict")
+# أكبر حجم ليه جدول penalty: 6x6 = 7^6 = 117,649 قيمة (ثانية تقريبًا)، و 7x7 = 8^7 = 2 مليون
+LC_MAX_SIZE = 6
+
+# ----------------------------
+# تحويل الحالات لمصفوفة (n × N²) uint8
+# ----------------------------
+def _tile_dtype(size):
+    """uint8 لحد 16x16 (أكبر بلاطة 255)، وبعد كده uint16"""
+    return np.uint8 if size * size <= 256 else np.uint16
+
+def states_array(states, size):
+    """
+    states: tuples أو ints مضغوطة (نفس تمثيل board.encode_state) أو مصفوفة جاهزة.
+    الـ ints بتتفك vectorised: كل int بيتقسم لكلمات 64 بت (كل كلمة فيها عدد خانات صحيح)
+    وبعدين shift و mask على المصفوفة كلها.
+    """
+    dtype = _tile_dtype(size)
+    if isinstance(states, np.ndarray):
+        return states.astype(dtype, copy=False)
+    states = list(states)
+    n = size * size
+    if not states or not isinstance(states[0], int):
+        return np.array([decode_state(s, size) for s in states], dtype=dtype).reshape(len(states), n)
+    bits = tile_bits(size)
+    per_word = 64 // bits
+    words = -(-n // per_word)
+    word_bits = bits * per_word
+    word_mask = (1 << word_bits) - 1
+    packed = np.array([[(code >> (word_bits * w)) & word_mask for w in range(words)] for code in states],
+                      dtype=np.uint64).reshape(len(states), words)
+    cells = np.arange(n)
+    shifts = ((cells % per_word) * bits).astype(np.uint64)
+    out = (packed[:, cells // per_word] >> shifts) & np.uint64((1 << bits) - 1)
+    return out.astype(dtype)
+
+# ----------------------------
+# الجداول المجهزة لكل goal
+# ----------------------------
+class BatchHeuristic:
+    """
+    bh = batch_heuristic(goal, size)
+    bh.manhattan(arr) / bh.misplaced(arr) / bh.linear_conflict(arr) -> np.ndarray (n,) int32
+    bh(arr, method) نفس الحاجة بالاسم
+    """
+    def __init__(self, goal, size):
+        self.size = size
+        goal = decode_state(goal, size)
+        n = size * size
+        pos = {v: i for i, v in enumerate(goal)}
+        goal_row = [0] * n
+        goal_col = [0] * n
+        for tile in range(1, n):
+            goal_row[tile], goal_col[tile] = divmod(pos[tile], size)
+
+        # md[tile, cell] / mis[tile, cell] بـ broadcasting؛ صف البلاطة 0 (الفراغ) أصفار
+        rows, cols = np.divmod(np.arange(n), size)
+        goal_row, goal_col = np.array(goal_row), np.array(goal_col)
+        md = np.abs(rows[None, :] - goal_row[:, None]) + np.abs(cols[None, :] - goal_col[:, None])
+        mis = np.arange(n)[None, :] != np.array([pos[tile] for tile in range(n)])[:, None]
+        md[0] = mis[0] = 0
+        self.md = md.astype(np.int32)
+        self.mis = mis.astype(np.int32)
+        self._cells = np.arange(n)
+
+        # label لكل (خط، بلاطة): 0 = البلاطة مش من الخط ده في الهدف، غير كده مكانها على الخط + 1
+        base = size + 1
+        self._row_labels = np.zeros((size, n), dtype=np.int32)
+        self._col_labels = np.zeros((size, n), dtype=np.int32)
+        for tile in range(1, n):
+            self._row_labels[goal_row[tile], tile] = goal_col[tile] + 1
+            self._col_labels[goal_col[tile], tile] = goal_row[tile] + 1
+        self._weights = base ** np.arange(size, dtype=np.int64)
+        self._penalty = None  # بيتبني في أول linear_conflict
+        cells = np.arange(n).reshape(size, size)
+        self._row_cells = cells         # _row_cells[r] = خانات الصف r
+        self._col_cells = cells.T.copy()
+
+    def manhattan(self, arr):
+        return self.md[arr, self._cells].sum(axis=1)
+
+    def misplaced(self, arr):
+        return self.mis[arr, self._cells].sum(axis=1)
+
+    def _penalty_table(self):
+        """penalty لكل محتوى خط ممكن: base^size قيمة (6^5 = 7776 لـ 5x5)"""
+        if self._penalty is None:
+            if self.size > LC_MAX_SIZE:
+                raise ValueError(f"batched linear_conflict supports boards up to {LC_MAX_SIZE}x{LC_MAX_SIZE}")
+            base = self.size + 1
+            penalty = np.zeros(base ** self.size, dtype=np.int32)
+            for index in range(base ** self.size):
+                seq = []
+                rem = index
+                for _ in range(self.size):
+                    rem, label = divmod(rem, base)
+                    if label:
+                        seq.append(label)
+                penalty[index] = _conflict_penalty(seq)
+            self._penalty = penalty
+        return self._penalty
+
+    def linear_conflict(self, arr):
+        penalty = self._penalty_table()
+        arr = arr.astype(np.intp, copy=False)
+        extra = np.zeros(len(arr), dtype=np.int32)
+        for line in range(self.size):
+            # labels الصف line (n × size) -> رقم واحد لكل حالة -> penalty من الجدول
+            rows = self._row_labels[line][arr[:, self._row_cells[line]]]
+            extra += penalty[rows @ self._weights]
+            cols = self._col_labels[line][arr[:, self._col_cells[line]]]
+            extra += penalty[cols @ self._weights]
+        return self.manhattan(arr) + 2 * extra
+
+    def __call__(self, arr, method="manhattan"):
+        if method not in METHODS:
+            raise ValueError(f"no batched version of heuristic {method!r} (choose from {', '.join(METHODS)})")
+        return getattr(self, method)(arr)
+
+_BATCH = {}
+
+def batch_heuristic(goal, size):
+    """BatchHeuristic واحد لكل (goal, size) — الجداول بتتبني مرة واحدة"""
+    key = (decode_state(goal, size), size)
+    bh = _BATCH.get(key)
+    if bh is None:
+        bh = BatchHeuristic(key[0], size)
+        _BATCH[key] = bh
+    return bh
+
+def heuristic_many(states, goal, size, method="manhattan"):
+    """
+    قيمة الهيوريستيك لكل حالة في states -> list من ints.
+    بـ NumPy لو موجود والـ method ليها نسخة batched (linear_conflict لحد LC_MAX_SIZE)،
+    وغير كده heuristic_val لكل حالة.
+    """
+    if HAVE_NUMPY and method in METHODS and (method != "linear_conflict" or size <= LC_MAX_SIZE):
+        return batch_heuristic(goal, size)(states_array(states, size), method).tolist()
+    return [heuristic_val(s, goal, size, method) for s in states]
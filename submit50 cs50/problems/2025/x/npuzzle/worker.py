@@ -0,0 +1,74 @@
+# npuzzle/worker.py
+# تشغيل محرك في thread جانبي علشان الواجهة (أو أي loop تاني) يفضل شغال أثناء البحث
+# - الـ worker بيبعت أحداث في queue: ("progress", dict) كل شوية و ("done", dict) مرة واحدة في الآخر
+# - cancel() بيخلي دالة progress ترجع True فالمحرك يقف لوحده بـ "cancelled" (إلغاء تعاوني)
+# ملاحظة: الملف ده مفيهوش pygame
+# ليه thread مش process: الحالة والجداول (PDB بـ mmap) موجودة في نفس العملية ومفيش pickle،
+# والـ GIL بيتبدّل كل كام ملّي ثانية فالواجهة بترسم عادي حتى لو البحث أبطأ شوية
+
+import queue
+import threading
+import time
+
+from . import ANYTIME, ENGINES, MAX_STEPS, MEMORY_LIMITED, NO_HEURISTIC
+from .stats import SearchStats
+
+class SolveWorker(threading.Thread):
+    """
+    w = SolveWorker("a_star", start, goal, size, heuristic="pdb", time_limit=120)
+    w.start()  ثم  w.events.get_nowait() في كل frame
+    - ("progress", {"nodes", "bound", "frontier", "elapsed"})
+    - ("solution", {"length", "bound", "elapsed"})  (محركات ANYTIME بس: كل حل أقصر من اللي قبله)
+    - ("done", {"path", "nodes", "reason", "elapsed", "stats"})  (أو reason="error" ومعاه "error")
+    stats = SearchStats بتاعة البحث (عدادات، أحجام، أوقات) — w.stats.to_json() للتصدير
+    cache: SolutionCache (اختياري) — hit بيرجع done على طول من غير بحث
+    """
+    def __init__(self, algo, start, goal, size, heuristic="manhattan", time_limit=None, max_steps=MAX_STEPS,
+                 memory_limit=None, cache=None):
+        super().__init__(daemon=True)  # daemon: قفل النافذة ما يستناش البحث
+        self.algo = algo
+        self.args = (start, goal, size)
+        self.heuristic = heuristic
+        self.time_limit = time_limit
+        self.max_steps = max_steps
+        self.memory_limit = memory_limit
+        self.cache = cache
+        self.events = queue.Queue()
+        self._cancel = threading.Event()
+        self._t0 = None
+        self.stats = SearchStats()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def _progress(self, nodes, bound, frontier):
+        self.events.put(("progress", {"nodes": nodes, "bound": bound, "frontier": frontier,
+                                      "elapsed": time.time() - self._t0}))
+        return self._cancel.is_set()
+
+    def _solution(self, path, bound):
+        self.events.put(("solution", {"length": len(path) - 1, "bound": bound, "elapsed": time.time() - self._t0}))
+
+    def run(self):
+        self._t0 = time.time()
+        engine = ENGINES[self.algo]
+        kwargs = {"time_limit": self.time_limit, "max_steps": self.max_steps, "progress": self._progress,
+                  "stats": self.stats}
+        if self.algo not in NO_HEURISTIC:
+            kwargs["heuristic"] = self.heuristic
+        if self.algo in MEMORY_LIMITED:
+            kwargs["memory_limit"] = self.memory_limit
+        if self.algo in ANYTIME:
+            kwargs["on_solution"] = self._solution
+        try:
+            if self.cache is not None:
+                path, nodes, reason = self.cache.solve(self.algo, *self.args, **kwargs)
+            else:
+                path, nodes, reason = engine(*self.args, **kwargs)
+        except Exception as e:  # أي غلط لازم يوصل "done"، وإلا الواجهة تفضل مستنية للأبد
+            self.events.put(("done", {"path": None, "nodes": 0, "reason": "error",
+                                      "error": str(e) or type(e).__name__,
+                                      "elapsed": time.time() - self._t0}))
+            return
+        self.events.put(("done", {"path": path, "nodes": nodes, "reason": reason,
+                                  "elapsed": time.time() - self._t0, "stats": self.stats}))
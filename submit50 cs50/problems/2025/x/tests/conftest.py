@@ -0,0 +1,5 @@
+# الباكدج npuzzle جنب فولدر tests، فبنضيفه للـ path علشان pytest يشتغل من أي مكان
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
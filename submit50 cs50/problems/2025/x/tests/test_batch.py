@@ -0,0 +1,46 @@
+# قراءة ملفات batch: سطر أرقام عادي، JSON list، و JSONL بـ id/goal؛ والسطر البايظ يرجع error
+# برقم سطره من غير ما يوقف باقي الملف
+
+import pytest
+
+from npuzzle.batch import parse_board, read_boards
+
+GOAL = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+
+def test_parse_plain_line():
+    assert parse_board("1 2 3 4 5 6 7 0 8\n") == (None, (1, 2, 3, 4, 5, 6, 7, 0, 8), None)
+    assert parse_board("1,2,3,4,5,6,7,0,8") == (None, (1, 2, 3, 4, 5, 6, 7, 0, 8), None)
+
+def test_parse_json_list():
+    assert parse_board("[1, 2, 3, 4, 5, 6, 7, 0, 8]") == (None, (1, 2, 3, 4, 5, 6, 7, 0, 8), None)
+
+def test_parse_jsonl_object():
+    line = '{"id": "a", "board": [1, 2, 3, 4, 5, 6, 7, 0, 8], "goal": [1, 2, 3, 4, 5, 6, 7, 8, 0]}'
+    assert parse_board(line) == ("a", (1, 2, 3, 4, 5, 6, 7, 0, 8), GOAL)
+
+@pytest.mark.parametrize("line", [
+    "1 2 3 4 5 6 7 8",                          # مش مربع
+    "1 2 3 4 5 6 7 8 8",                        # بلاطة متكررة
+    '{"board": [1, 2, 3, 4, 5, 6, 7, 0, 8], "goal": [1, 2, 3]}',
+    '{"id": 3}',                                # مفيش board
+    "[1, 2, 3",                                 # JSON بايظ
+])
+def test_parse_rejects_bad_lines(line):
+    with pytest.raises((ValueError, KeyError)):
+        parse_board(line)
+
+def test_read_boards_reports_bad_lines_and_keeps_going():
+    lines = [
+        "# تعليق",
+        "1 2 3 4 5 6 7 0 8",
+        "",
+        "1 2 3 4 5 6 7 8",
+        '{"id": "x", "board": [1, 2, 3, 4, 5, 6, 0, 7, 8]}',
+        "[1, 2, 3, 4, 5, 6, 7, 8, 0]",
+    ]
+    rows = list(read_boards(lines))
+    assert [r[0] for r in rows] == [2, 4, "x", 6]
+    assert rows[0][1:] == ((1, 2, 3, 4, 5, 6, 7, 0, 8), None, None)
+    assert rows[1][1] is None and rows[1][3]
+    assert rows[2][1:] == ((1, 2, 3, 4, 5, 6, 0, 7, 8), None, None)
+    assert rows[3][3] is None
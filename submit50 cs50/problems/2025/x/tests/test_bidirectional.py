@@ -0,0 +1,44 @@
+# MM لازم يرجع نفس طول حل A* (الاتنين أمثل) — مع كل هيوريستيك، ومن ضمنهم pdb / exact
+# اللي الناحية اللي ورا فيهم ليها هيوريستيك مختلف (backward_heuristic)
+
+import random
+
+import pytest
+
+from npuzzle import a_star, bidirectional_bfs, mm
+from npuzzle.board import default_goal, generate_by_moves, random_board
+from npuzzle.heuristics import get_heuristic
+
+def _needs(size, heuristic):
+    try:
+        get_heuristic(default_goal(size), size, heuristic)
+    except FileNotFoundError as e:
+        pytest.skip(str(e))
+
+@pytest.mark.parametrize("heuristic", ["manhattan", "linear_conflict", "pdb", "exact"])
+def test_mm_matches_a_star_3x3(heuristic):
+    _needs(3, heuristic)
+    goal = default_goal(3)
+    rng = random.Random(19)
+    for _ in range(40):
+        board = random_board(goal, 3, rng)
+        expected = len(a_star(board, goal, 3)[0])
+        path, _, reason = mm(board, goal, 3, heuristic=heuristic)
+        assert reason == "solved"
+        assert len(path) == expected, board
+        assert tuple(path[0]) == board and tuple(path[-1]) == goal
+
+def test_mm_matches_a_star_4x4_pdb():
+    _needs(4, "pdb")
+    goal = default_goal(4)
+    rng = random.Random(4)
+    for _ in range(4):
+        board = generate_by_moves(goal, 4, 60, rng)
+        assert len(mm(board, goal, 4, heuristic="pdb")[0]) == len(a_star(board, goal, 4, heuristic="pdb")[0])
+
+def test_bidirectional_bfs_matches_a_star():
+    goal = default_goal(3)
+    rng = random.Random(7)
+    for _ in range(10):
+        board = random_board(goal, 3, rng)
+        assert len(bidirectional_bfs(board, goal, 3)[0]) == len(a_star(board, goal, 3)[0])
@@ -0,0 +1,55 @@
+# الكاش بيخزن الحل بشكل canonical: لازم كل تماثل يرجع نفس المفتاح، والحركات تتحول صح رايح جاي،
+# ولوح متماثل مع لوح اتحل قبل كده ياخد الحل من الكاش (وطوله زي A*)
+
+import random
+
+from npuzzle import a_star
+from npuzzle.board import default_goal, encode_state, generate_by_moves, random_board
+from npuzzle.cache import SolutionCache, canonical, moves_to_path, path_to_moves, symmetries, transform_state
+
+def _valid(path, size):
+    for a, b in zip(path, path[1:]):
+        ra, ca = divmod(a.index(0), size)
+        rb, cb = divmod(b.index(0), size)
+        assert abs(ra - rb) + abs(ca - cb) == 1
+        assert sorted(a) == sorted(b)
+
+def test_canonical_is_the_same_for_every_symmetry():
+    for size in (3, 4):
+        goal = default_goal(size)
+        rng = random.Random(size)
+        for _ in range(30):
+            board = random_board(goal, size, rng)
+            code = canonical(board, goal, size)[0]
+            for sym in symmetries(goal, size):
+                image = transform_state(board, *sym)
+                assert canonical(image, goal, size)[0] == code
+                assert canonical(encode_state(image, size), goal, size)[0] == code
+
+def test_moves_round_trip_through_every_symmetry():
+    size = 4
+    goal = default_goal(size)
+    rng = random.Random(18)
+    board = generate_by_moves(goal, size, 40, rng)
+    path = a_star(board, goal, size)[0]
+    assert moves_to_path(board, path_to_moves(path, size), size) == path
+    for cells, _ in symmetries(goal, size):
+        moves = path_to_moves(path, size, cells)
+        assert moves_to_path(board, moves, size, cells) == path
+
+def test_symmetric_board_hits_the_cache():
+    size = 3
+    goal = default_goal(size)
+    cache = SolutionCache()
+    rng = random.Random(3)
+    board = random_board(goal, size, rng)
+    path, _, reason = cache.solve("a_star", board, goal, size)
+    assert reason == "solved" and cache.misses == 1 and cache.hits == 0
+    for sym in symmetries(goal, size)[1:]:
+        image = transform_state(board, *sym)
+        got, nodes, reason = cache.solve("a_star", image, goal, size)
+        assert reason == "solved" and nodes == 0
+        assert len(got) == len(path)
+        assert got[0] == image and got[-1] == goal
+        _valid(got, size)
+    assert cache.hits == len(symmetries(goal, size)) - 1
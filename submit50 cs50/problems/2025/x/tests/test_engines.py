@@ -0,0 +1,61 @@
+# المحركات الأمثل (ara_star لآخره، hda_star، parallel_ida_star) لازم ترجع نفس طول حل A*،
+# و reduction / beam لازم يرجعوا مسار صحيح (كل خطوة حركة واحدة للفراغ، ومن البداية للهدف)
+
+import random
+
+import pytest
+
+from npuzzle import a_star, ara_star, beam_search, hda_star, parallel_ida_star, reduction_solve
+from npuzzle.board import default_goal, generate_by_moves, random_board
+
+def _check_path(path, start, goal, size):
+    assert path is not None
+    assert tuple(path[0]) == tuple(start) and tuple(path[-1]) == tuple(goal)
+    for a, b in zip(path, path[1:]):
+        ra, ca = divmod(list(a).index(0), size)
+        rb, cb = divmod(list(b).index(0), size)
+        assert abs(ra - rb) + abs(ca - cb) == 1
+        # البلاطة اللي اتحركت بس هي اللي اتغيرت
+        assert sum(x != y for x, y in zip(a, b)) == 2
+
+def _walks(seed, count, moves=40):
+    goal = default_goal(4)
+    rng = random.Random(seed)
+    return goal, [generate_by_moves(goal, 4, moves, rng) for _ in range(count)]
+
+def test_ara_star_matches_a_star():
+    goal, boards = _walks(20, 5)
+    for board in boards:
+        path, _, reason = ara_star(board, goal, 4)
+        assert reason == "solved"
+        _check_path(path, board, goal, 4)
+        assert len(path) == len(a_star(board, goal, 4)[0])
+
+@pytest.mark.parametrize("engine", [hda_star, parallel_ida_star])
+def test_parallel_engines_match_a_star(engine):
+    goal, boards = _walks(23, 3)
+    for board in boards:
+        path, _, reason = engine(board, goal, 4, workers=2)
+        assert reason == "solved"
+        _check_path(path, board, goal, 4)
+        assert len(path) == len(a_star(board, goal, 4)[0])
+
+@pytest.mark.parametrize("size", [6, 10, 20])
+def test_reduction_returns_a_valid_path(size):
+    goal = default_goal(size)
+    board = random_board(goal, size, random.Random(size))
+    path, _, reason = reduction_solve(board, goal, size)
+    assert reason == "solved"
+    _check_path(path, board, goal, size)
+
+def test_beam_search_returns_a_valid_path():
+    goal = default_goal(4)
+    rng = random.Random(22)
+    for board in [random_board(default_goal(3), 3, rng) for _ in range(5)]:
+        path, _, reason = beam_search(board, default_goal(3), 3)
+        assert reason == "solved"
+        _check_path(path, board, default_goal(3), 3)
+    board = generate_by_moves(goal, 4, 60, rng)
+    path, _, reason = beam_search(board, goal, 4)
+    assert reason == "solved"
+    _check_path(path, board, goal, 4)
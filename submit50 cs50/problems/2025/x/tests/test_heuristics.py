@@ -0,0 +1,30 @@
+# LC / WD / PDB لازم يكونوا admissible: عمرهم ما يزيدوا عن المسافة الدقيقة (جدول eight_puzzle)
+# على ألواح 3x3 عشوائية، ومش أقل من Manhattan (دي فكرتهم أصلًا)
+
+import random
+
+import pytest
+
+from npuzzle import eight_puzzle
+from npuzzle.board import default_goal, encode_state, random_board
+from npuzzle.heuristics import get_heuristic, heuristic_val
+
+@pytest.mark.parametrize("method", ["linear_conflict", "walking_distance", "pdb"])
+def test_never_above_exact_distance_3x3(method):
+    goal = default_goal(3)
+    try:
+        h = get_heuristic(goal, 3, method)
+    except FileNotFoundError as e:
+        pytest.skip(str(e))
+    exact = eight_puzzle.load(goal=goal)
+    rng = random.Random(7)
+    for _ in range(500):
+        board = random_board(goal, 3, rng)
+        value = h(encode_state(board, 3))
+        assert value <= exact(board), board
+        if method != "pdb":
+            assert value >= heuristic_val(board, goal, 3, "manhattan"), board
+
+def test_unknown_heuristic_is_rejected():
+    with pytest.raises(ValueError):
+        get_heuristic(default_goal(3), 3, "manhatan")
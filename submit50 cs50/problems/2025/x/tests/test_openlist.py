@@ -0,0 +1,56 @@
+# BucketQueue: أقل key الأول، وجوه نفس key أعلى g؛ والعناصر القديمة (stale) المحرك بيرميها بعد الـ pop
+# من غير ما الـ buckets الفاضية اللي فضلت وراها تلخبط min_key
+
+import random
+
+import pytest
+
+from npuzzle.openlist import BucketQueue, pack_entry, unpack_entry
+
+def test_pops_min_key_then_max_g():
+    rng = random.Random(15)
+    entries = [(rng.randrange(30), rng.randrange(20), i) for i in range(500)]
+    q = BucketQueue()
+    for key, g, item in entries:
+        q.push(key, g, item)
+    assert len(q) == len(entries)
+    order = []
+    while q:
+        key = q.min_key()
+        order.append(q.pop())
+        assert order[-1][0] == key
+    assert [(k, -g) for k, g, _ in order] == sorted((k, -g) for k, g, _ in entries)
+    with pytest.raises(IndexError):
+        q.pop()
+
+def test_push_below_current_min_key():
+    q = BucketQueue()
+    q.push(5, 0, "a")
+    assert q.pop() == (5, 0, "a")
+    q.push(2, 1, "b")
+    q.push(7, 0, "c")
+    assert q.min_key() == 2
+    assert q.pop() == (2, 1, "b")
+    assert q.pop() == (7, 0, "c")
+
+def test_stale_entries_are_skipped():
+    # نفس الحالة اتضافت مرتين: بـ g=5 وبعدين بـ g أحسن (3) — زي A* لما يلاقي طريق أقصر
+    q = BucketQueue()
+    best_g = {}
+    for state, g, h in (("x", 5, 4), ("y", 4, 6), ("x", 3, 4)):
+        if g < best_g.get(state, float("inf")):
+            best_g[state] = g
+        q.push(g + h, g, state)
+    popped, stale = [], 0
+    while q:
+        f, g, state = q.pop()
+        if best_g[state] < g:
+            stale += 1
+            continue
+        popped.append((f, g, state))
+    assert popped == [(7, 3, "x"), (10, 4, "y")]
+    assert stale == 1
+
+def test_pack_entry_round_trip():
+    for state, blank, prev in ((0, 0, -1), (123456789, 255, 254), (1 << 200, 399, 398)):
+        assert unpack_entry(pack_entry(state, blank, prev)) == (state, blank, prev)
@@ -0,0 +1,46 @@
+# rank / unrank لازم يكونوا bijection على كل تبديلات 3x3، ونفس الكلام للأنماط الجزئية؛
+# والنسخ الـ batched (rank_many / rank_patterns_many) لازم ترجع نفس أرقام النسخ العادية
+
+import itertools
+import math
+import random
+
+from npuzzle.board import encode_state
+from npuzzle.ranking import (pattern_space, rank, rank_many, rank_pattern, rank_patterns_many, unrank,
+                             unrank_many, unrank_pattern)
+
+def test_rank_is_a_bijection_on_3x3():
+    seen = set()
+    for perm in itertools.permutations(range(9)):
+        r = rank(perm)
+        assert 0 <= r < math.factorial(9)
+        assert unrank(r, 3) == perm
+        seen.add(r)
+    assert len(seen) == math.factorial(9)
+
+def test_rank_accepts_encoded_states():
+    rng = random.Random(9)
+    for _ in range(200):
+        perm = tuple(rng.sample(range(9), 9))
+        assert rank(encode_state(perm, 3), 3) == rank(perm)
+
+def test_rank_pattern_is_a_bijection():
+    n = 9
+    for k in (1, 2, 4):
+        seen = set()
+        for cells in itertools.permutations(range(n), k):
+            r = rank_pattern(cells, n)
+            assert 0 <= r < pattern_space(k, n)
+            assert unrank_pattern(r, k, n) == cells
+            seen.add(r)
+        assert len(seen) == pattern_space(k, n)
+
+def test_batched_versions_match_scalar():
+    rng = random.Random(1)
+    perms = [tuple(rng.sample(range(9), 9)) for _ in range(300)]
+    ranks = [rank(p) for p in perms]
+    assert rank_many(perms) == ranks
+    assert rank_many([encode_state(p, 3) for p in perms], 3) == ranks
+    assert unrank_many(ranks, 3) == perms
+    cells_list = [tuple(rng.sample(range(16), 5)) for _ in range(300)]
+    assert rank_patterns_many(cells_list, 16) == [rank_pattern(c, 16) for c in cells_list]